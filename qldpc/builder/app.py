@@ -17,36 +17,186 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import numpy as np
 import math
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, FrozenSet, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 import json
 import os
+import functools
+import importlib.util
+from types import MappingProxyType
 
-# Quantum computing libraries
+# Import shared types from package modules (avoiding duplication)
+from qldpc.components import ViewMode, ComponentType, Component3D
+from qldpc.config import COMPONENT_COLORS, LDPC_COLORS, ColorPalette
+from qldpc.processor import QuantumLDPCProcessor, group_by_type
+from qldpc.builder.renderers.isometric import IsometricRenderer
+from qldpc.builder.tutorials import (
+    compile_tutorial_steps, configure_text_tags, load_tutorial_steps, screen_dims,
+)
+
+# Quantum computing libraries are imported on first simulation (see _ensure_qiskit);
+# qiskit_aer dominates startup time and is not needed to build or save circuits.
+QISKIT_AVAILABLE = (importlib.util.find_spec("qiskit") is not None and
+                    importlib.util.find_spec("qiskit_aer") is not None)
+transpile = None
+AerSimulator = None
+if not QISKIT_AVAILABLE:
+    print("Warning: Qiskit not available. Some quantum computations will be simulated.")
+
+
+def _ensure_qiskit() -> bool:
+    """Import the Qiskit simulation stack on first use; return whether it is usable."""
+    global QISKIT_AVAILABLE, transpile, AerSimulator
+    if not QISKIT_AVAILABLE or AerSimulator is not None:
+        return QISKIT_AVAILABLE
+    try:
+        from qiskit import transpile
+        from qiskit_aer import AerSimulator
+    except ImportError:
+        QISKIT_AVAILABLE = False
+    return QISKIT_AVAILABLE
+
+
+# orjson (optional) parses and writes circuit files several times faster than json
 try:
-    from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
-    from qiskit.quantum_info import Statevector, Operator
-    from qiskit_aer import AerSimulator
-    QISKIT_AVAILABLE = True
+    import orjson
 except ImportError:
-    QISKIT_AVAILABLE = False
-    QuantumCircuit = None  # Placeholder for type hints
-    QuantumRegister = None
-    ClassicalRegister = None
-    print("Warning: Qiskit not available. Some quantum computations will be simulated.")
+    orjson = None
+
+
+def _circuit_json_default(obj: Any) -> Any:
+    """JSON fallback for circuit objects, so components serialize while being written.
+    
+    Components become the same dict Component3D.to_dict gives (tuples are
+    written as arrays by the encoder, so they are not copied to lists here).
+    """
+    if isinstance(obj, Component3D):
+        return {
+            'type': obj.component_type.value,
+            'position': obj.position,
+            'rotation': obj.rotation,
+            'size': obj.size,
+            'color': obj.color,
+            'connections': obj.connections,
+            'properties': obj.properties
+        }
+    if isinstance(obj, ComponentType):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_circuit_json(filename: str, circuit_data: Dict[str, Any]) -> None:
+    """Write circuit_data (which may hold Component3D objects) to filename as indented JSON."""
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(circuit_data, default=_circuit_json_default,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                                 orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(circuit_data, f, indent=2, default=_circuit_json_default)
+
 
-# Scientific computing
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import seaborn as sns
+def _read_circuit_json(filename: str) -> Any:
+    """Parse the JSON circuit file at filename."""
+    if orjson is not None:
+        with open(filename, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filename, 'r') as f:
+        return json.load(f)
 
-# Set up color palettes for consistency with project standards
-sns.set_style("darkgrid")
-seqCmap = sns.color_palette("mako", as_cmap=True)
-divCmap = sns.cubehelix_palette(start=.5, rot=-.5, as_cmap=True)
-lightCmap = sns.cubehelix_palette(start=2, rot=0, dark=0, light=.95, reverse=True, as_cmap=True)
+
+# Compact binary circuit files: a compressed NumPy archive with one array per
+# component field, for circuits too large to save comfortably as indented JSON
+_BINARY_CIRCUIT_EXT = '.qldpc'
+
+
+def _write_circuit_binary(filename: str, components: List[Component3D]) -> None:
+    """Write components to filename as a compressed .qldpc archive."""
+    # Connections and properties are free-form, so they travel as one JSON string
+    extras = json.dumps([[c.connections, c.properties] for c in components],
+                        default=_circuit_json_default)
+    with open(filename, 'wb') as f:  # a file object stops NumPy appending .npz
+        np.savez_compressed(
+            f,
+            types=np.array([c.component_type.value for c in components], dtype=str),
+            positions=np.array([c.position for c in components]).reshape(-1, 3),
+            rotations=np.array([c.rotation for c in components], dtype=float),
+            sizes=np.array([c.size for c in components], dtype=float).reshape(-1, 3),
+            colors=np.array([c.color for c in components], dtype=float).reshape(-1, 3),
+            extras=np.array(extras),
+        )
+
+
+def _read_circuit_binary(filename: str) -> Dict[str, Any]:
+    """Read a .qldpc archive back into the same structure as a JSON circuit file."""
+    with np.load(filename, allow_pickle=False) as archive:
+        types = archive['types'].tolist()
+        positions = archive['positions'].tolist()
+        rotations = archive['rotations'].tolist()
+        sizes = archive['sizes'].tolist()
+        colors = archive['colors'].tolist()
+        extras = json.loads(str(archive['extras']))
+    return {
+        'components': [
+            {
+                'type': type_str,
+                'position': position,
+                'rotation': rotation,
+                'size': size,
+                'color': color,
+                'connections': connections,
+                'properties': properties
+            }
+            for type_str, position, rotation, size, color, (connections, properties)
+            in zip(types, positions, rotations, sizes, colors, extras)
+        ]
+    }
+
+
+def _read_circuit_file(filename: str) -> Any:
+    """Read a circuit file, binary or JSON by extension."""
+    if filename.lower().endswith(_BINARY_CIRCUIT_EXT):
+        return _read_circuit_binary(filename)
+    return _read_circuit_json(filename)
+
+
+_TUTORIAL_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '.tutorial_config.json')
+
+# Isometric projection factors for the legend's mini cubes
+_ISO_COS30 = math.cos(math.radians(30))
+_ISO_SIN30 = math.sin(math.radians(30))
+# (x, y, z) -> canvas offset: iso_x = (x - y) * cos30, iso_y = (x + y) * sin30 - z
+_ISO_MATRIX = np.array([[_ISO_COS30, _ISO_SIN30], [-_ISO_COS30, _ISO_SIN30], [0.0, -1.0]])
+
+
+@functools.lru_cache(maxsize=None)
+def _mini_cube_faces(cx: float, cy: float, depth: float) -> Tuple[Tuple[float, ...], ...]:
+    """Flat polygon coordinates of a legend cube at (cx, cy), in the renderer's face order."""
+    size = 12
+    size_depth = size * depth  # Extend in Y direction for two-qubit gates
+    v = (IsometricRenderer._UNIT_ARRAY * (size, size_depth, size)) @ _ISO_MATRIX + (cx, cy)
+    return tuple(map(tuple, v[IsometricRenderer._FACE_ARRAY].reshape(6, 8).tolist()))
+
+
+# (cos, sin) for the rotation angles the builder produces (rotate steps by 90°)
+_ROTATION_TRIG: Dict[float, Tuple[float, float]] = {
+    a: (math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 15)
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_tutorial_preference() -> bool:
+    """Read the saved tutorial preference once; cleared when it is re-saved."""
+    try:
+        if os.path.exists(_TUTORIAL_CONFIG_PATH):
+            with open(_TUTORIAL_CONFIG_PATH, 'r') as f:
+                config = json.load(f)
+                return config.get('show_tutorial', True)
+    except (OSError, json.JSONDecodeError):
+        pass
+    return True
 
 
 # ==================== ERROR HANDLING UTILITIES (#25) ====================
@@ -150,6 +300,70 @@ class ErrorContext:
         return f"❌ {error_info['title']}: {error_info['message']}"
 
 
+# Gate types that span two qubit lanes
+_TWO_QUBIT_TYPES: FrozenSet[ComponentType] = frozenset({
+    ComponentType.CNOT_GATE, ComponentType.CZ_GATE, ComponentType.SWAP_GATE,
+})
+
+# Single-qubit gates the context menu offers to add a control to
+_CONTROLLABLE_TYPES: FrozenSet[ComponentType] = frozenset({
+    ComponentType.X_GATE, ComponentType.Y_GATE, ComponentType.Z_GATE,
+    ComponentType.H_GATE, ComponentType.S_GATE, ComponentType.T_GATE,
+    ComponentType.SWAP_GATE,
+})
+
+# One-line legend description per component type
+_LEGEND_DESCRIPTIONS = MappingProxyType({
+    ComponentType.X_GATE: "Bit-flip gate (Pauli-X)",
+    ComponentType.Y_GATE: "Pauli-Y rotation",
+    ComponentType.Z_GATE: "Phase-flip gate (Pauli-Z)",
+    ComponentType.H_GATE: "Hadamard superposition",
+    ComponentType.S_GATE: "Phase gate (√Z)",
+    ComponentType.T_GATE: "π/8 gate (√S)",
+    ComponentType.CNOT_GATE: "Controlled-NOT gate",
+    ComponentType.CZ_GATE: "Controlled-Z gate",
+    ComponentType.SWAP_GATE: "Swap two qubits",
+    ComponentType.PARITY_CHECK: "LDPC parity check node",
+    ComponentType.DATA_QUBIT: "Data qubit (stores info)",
+    ComponentType.ANCILLA_QUBIT: "Ancilla (syndrome helper)",
+    ComponentType.MEASURE: "Measurement operation",
+    ComponentType.RESET: "Reset to |0⟩ state",
+    ComponentType.SURFACE_DATA: "Surface code data qubit (edge)",
+    ComponentType.SURFACE_X_STABILIZER: "X-stabilizer (plaquette)",
+    ComponentType.SURFACE_Z_STABILIZER: "Z-stabilizer (vertex)",
+    ComponentType.SURFACE_BOUNDARY: "Lattice boundary marker",
+})
+
+# Surface code error markers, which may sit on top of a data qubit
+_SURFACE_ERROR_TYPES: FrozenSet[ComponentType] = frozenset({
+    ComponentType.SURFACE_X_ERROR, ComponentType.SURFACE_Z_ERROR, ComponentType.SURFACE_Y_ERROR,
+})
+
+# Example LDPC circuit placed by the tutorial hint, matching
+# saved_circuits/error_correction_demo.json. Layout follows quantum circuit convention:
+#   x-axis = time/operations (left to right)
+#   y-axis = qubit lanes (stacked vertically)
+#
+# Time step 0: Data qubits (column x=0)
+# Time step 1: Parity checks (column x=1)
+# Time step 2: X gate error (column x=2)
+#
+#   y=0: [Data0] [Parity0]
+#   y=1: [Data1] [Parity1] [X Gate]
+#   y=2: [Data2]
+_HINT_SPECS: Tuple[Tuple[ComponentType, Tuple[int, int, int]], ...] = (
+    # Data qubits in a column (x=0, varying y)
+    (ComponentType.DATA_QUBIT, (0, 0, 0)),
+    (ComponentType.DATA_QUBIT, (0, 1, 0)),
+    (ComponentType.DATA_QUBIT, (0, 2, 0)),
+    # Parity checks adjacent (x=1)
+    (ComponentType.PARITY_CHECK, (1, 0, 0)),
+    (ComponentType.PARITY_CHECK, (1, 1, 0)),
+    # X gate (error) on middle data qubit line (x=2, y=1)
+    (ComponentType.X_GATE, (2, 1, 0)),
+)
+
+
 class TutorialScreen:
     """
     Interactive tutorial screen that guides users through the Quantum LDPC Circuit Builder.
@@ -160,8 +374,8 @@ class TutorialScreen:
     - Running computations and error correction
     """
     
-    # Color scheme for highlighted keywords
-    COLORS = {
+    # Color scheme for highlighted keywords (read-only)
+    COLORS = MappingProxyType({
         'quantum': '#00ffcc',      # Cyan for quantum terms
         'ldpc': '#ff6b6b',         # Coral red for LDPC terms  
         'component': '#ffd93d',    # Yellow for component names
@@ -170,7 +384,10 @@ class TutorialScreen:
         'warning': '#ff9f43',      # Orange for important notes
         'title': '#74b9ff',        # Light blue for titles
         'highlight': '#fd79a8',    # Pink for emphasis
-    }
+    })
+    
+    # Compiled steps shared by all instances (see _get_steps)
+    _steps_cache: Optional[List[Dict[str, Any]]] = None
     
     def __init__(self, parent: tk.Tk, on_complete_callback=None, circuit_builder=None):
         """
@@ -190,387 +407,24 @@ class TutorialScreen:
         self.hint_components = []  # Store hint component references for removal
         self.demo_components = []  # Store demo components for step-by-step demos
         
-        # Define tutorial steps with rich content
-        self.steps = self._create_tutorial_steps()
+        # Define tutorial steps with rich content (shared, read-only)
+        self.steps = self._get_steps()
+        self._n_steps = len(self.steps)
+        # Per-step progress bar fractions and indicator labels
+        self._progress_table = tuple((i + 1) / self._n_steps for i in range(self._n_steps))
+        self._step_labels = tuple(f"Step {i + 1} of {self._n_steps}" for i in range(self._n_steps))
     
-    def _create_tutorial_steps(self) -> List[Dict[str, Any]]:
-        """Create the tutorial content with tagged text for coloring."""
-        return [
-            # Step 0: Welcome
-            {
-                'title': 'Welcome to the Quantum Circuit Builder!',
-                'content': [
-                    ('Welcome to the ', 'normal'),
-                    ('3D Quantum Circuit Builder', 'title'),
-                    ('!\n\n', 'normal'),
-                    ('This interactive tool lets you build and simulate quantum circuits ', 'normal'),
-                    ('for error correction — including LDPC codes and surface codes.\n\n', 'normal'),
-                    ('🎯 What you\'ll learn:\n', 'normal'),
-                    ('• How to place quantum components on the grid\n', 'normal'),
-                    ('• Understanding qubit lanes and gate operations\n', 'normal'),
-                    ('• Building basic error correction circuits\n', 'normal'),
-                    ('• Switching between circuit and surface code modes\n\n', 'normal'),
-                    ('💡 ', 'normal'),
-                    ('Tip:', 'highlight'),
-                    (' You can interact with the main window while this tutorial is open!\n\n', 'normal'),
-                    ('Click ', 'normal'),
-                    ('Next', 'action'),
-                    (' to begin, or ', 'normal'),
-                    ('Skip Tutorial', 'action'),
-                    (' to jump right in.', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_welcome'
-            },
-            # Step 1: Basic Components
-            {
-                'title': 'Understanding Quantum Components',
-                'content': [
-                    ('The Component Toolbox (right panel) contains:\n\n', 'normal'),
-                    ('📦 ', 'normal'),
-                    ('Single Qubit Gates:', 'title'),
-                    ('\n', 'normal'),
-                    ('   • X Gate — Bit flip (Pauli-X): |0⟩ ↔ |1⟩\n', 'normal'),
-                    ('   • Z Gate — Phase flip (Pauli-Z)\n', 'normal'),
-                    ('   • H Gate — Hadamard, creates superposition\n\n', 'normal'),
-                    ('🔗 ', 'normal'),
-                    ('Two Qubit Gates:', 'title'),
-                    ('\n', 'normal'),
-                    ('   • CNOT — Controlled-NOT for entanglement\n', 'normal'),
-                    ('   • CZ — Controlled-Z gate\n\n', 'normal'),
-                    ('🛡️ ', 'normal'),
-                    ('LDPC Components', 'ldpc'),
-                    (':\n', 'normal'),
-                    ('   • ', 'normal'),
-                    ('Data Qubit', 'component'),
-                    (' — Stores quantum information\n', 'normal'),
-                    ('   • ', 'normal'),
-                    ('Ancilla Qubit', 'component'),
-                    (' — Helper qubits for measurement\n', 'normal'),
-                    ('   • ', 'normal'),
-                    ('Parity Check', 'ldpc'),
-                    (' — Detects errors\n', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_welcome'
-            },
-            # Step 2: Placing Components
-            {
-                'title': 'Placing Components on the Grid',
-                'content': [
-                    ('The isometric grid is your quantum circuit canvas!\n\n', 'normal'),
-                    ('🖱️ How to place components:\n\n', 'normal'),
-                    ('1. ', 'normal'),
-                    ('Select', 'action'),
-                    (' a component from the toolbox tabs\n', 'normal'),
-                    ('2. ', 'normal'),
-                    ('Click', 'action'),
-                    (' anywhere on the grid to place it\n', 'normal'),
-                    ('3. ', 'normal'),
-                    ('Drag', 'action'),
-                    (' existing components to move them\n\n', 'normal'),
-                    ('⚡ Pro Tips:\n', 'normal'),
-                    ('• Click a component to ', 'normal'),
-                    ('select', 'action'),
-                    (' it (yellow outline)\n', 'normal'),
-                    ('• Right-click for context menu (rotate, delete)\n', 'normal'),
-                    ('• Middle-click + drag to pan the view\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('Scroll wheel', 'action'),
-                    (' to zoom in/out\n', 'normal'),
-                    ('• Grid boundaries (±10) keep your circuit organized\n\n', 'normal'),
-                    ('Look at the demo circuit - one component is ', 'normal'),
-                    ('selected', 'highlight'),
-                    (' (yellow border)!', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_placing_components'
-            },
-            # Step 3: Understanding Qubit Placement (from Advanced)
-            {
-                'title': 'Understanding Qubit Placement',
-                'content': [
-                    ('Where Do Qubits Live on the Grid?', 'title'),
-                    ('\n\n', 'normal'),
-                    ('In this circuit builder, each ', 'normal'),
-                    ('grid cell', 'highlight'),
-                    (' represents a single quantum component.\n\n', 'normal'),
-                    ('Key Concepts:', 'title'),
-                    ('\n\n', 'normal'),
-                    ('1. ', 'normal'),
-                    ('One cube = One qubit/gate', 'component'),
-                    ('\n   When you place a Data Qubit, it occupies exactly one grid position.\n\n', 'normal'),
-                    ('2. ', 'normal'),
-                    ('Position = (x, y, z)', 'math'),
-                    ('\n   • ', 'normal'),
-                    ('X-axis', 'component'),
-                    (' = Time/circuit depth (left to right)\n', 'normal'),
-                    ('   • ', 'normal'),
-                    ('Y-axis', 'component'),
-                    (' = Qubit index / lane (front to back)\n', 'normal'),
-                    ('   • ', 'normal'),
-                    ('Z-axis', 'component'),
-                    (' = Layer (usually 0 for flat circuits)\n\n', 'normal'),
-                    ('3. Components are placed at ', 'normal'),
-                    ('integer coordinates', 'highlight'),
-                    ('\n   No partial positions - each block snaps to the grid.', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_qubit_positions'
-            },
-            # Step 4: How Operators Act (from Advanced)
-            {
-                'title': 'How Operators Act on Qubits',
-                'content': [
-                    ('Operators & Qubit Interactions', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Gates (operators) act on qubits in the same ', 'normal'),
-                    ('qubit lane', 'highlight'),
-                    (' (same Y coordinate).\n\n', 'normal'),
-                    ('Circuit Flow:', 'title'),
-                    ('\n', 'normal'),
-                    ('Time flows left → right along the X-axis.\n\n', 'normal'),
-                    ('   [Qubit] → [Gate] → [Gate] → [Measure]\n', 'math'),
-                    ('      x=0      x=1      x=2       x=3\n\n', 'normal'),
-                    ('Visual Indication:', 'title'),
-                    ('\n', 'normal'),
-                    ('When a gate is in the same lane as a qubit:\n', 'normal'),
-                    ('• The gate operates on that qubit at that time step\n', 'normal'),
-                    ('• Gates in different lanes act on different qubits\n\n', 'normal'),
-                    ('Example:', 'warning'),
-                    (' An X gate at (2, 0, 0) acts on the qubit in lane 0\n', 'normal'),
-                    ('at time step 2.', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_operator_interaction'
-            },
-            # Step 5: Single vs Two-Qubit Gates (from Advanced)
-            {
-                'title': 'Single vs Two-Qubit Gates',
-                'content': [
-                    ('Distinguishing Gate Types', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Single-Qubit Gates', 'component'),
-                    (' (X, Y, Z, H, S, T):\n', 'normal'),
-                    ('• Occupy ', 'normal'),
-                    ('one grid cell', 'highlight'),
-                    ('\n', 'normal'),
-                    ('• Act on the qubit in their lane only\n', 'normal'),
-                    ('• Shown as ', 'normal'),
-                    ('standard cubes', 'component'),
-                    (' (1x1 footprint)\n\n', 'normal'),
-                    ('Two-Qubit Gates', 'ldpc'),
-                    (' (CNOT, CZ, SWAP):\n', 'normal'),
-                    ('• Placed at the ', 'normal'),
-                    ('control qubit lane', 'highlight'),
-                    ('\n', 'normal'),
-                    ('• Extend to the target qubit lane (below)\n', 'normal'),
-                    ('• Shown as ', 'normal'),
-                    ('taller cubes', 'warning'),
-                    (' spanning both lanes\n\n', 'normal'),
-                    ('CNOT Convention:', 'title'),
-                    ('\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('●', 'highlight'),
-                    (' = Control qubit (filled dot)\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('⊕', 'highlight'),
-                    (' = Target qubit (XOR symbol)\n', 'normal'),
-                    ('• Target qubit is at Y+1 (adjacent lane)', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_gate_comparison'
-            },
-            # Step 6: Creating Controlled Gates (NEW!)
-            {
-                'title': '⭐ Creating Controlled Gates',
-                'content': [
-                    ('Make Any Gate Controlled!', 'title'),
-                    ('\n\n', 'normal'),
-                    ('You can turn any single-qubit gate into a ', 'normal'),
-                    ('controlled', 'highlight'),
-                    (' version!\n\n', 'normal'),
-                    ('🖱️ How to Add a Control:', 'title'),
-                    ('\n\n', 'normal'),
-                    ('1. Place a gate (H, X, Y, Z, S, T) on the grid\n', 'normal'),
-                    ('2. ', 'normal'),
-                    ('Right-click', 'action'),
-                    (' on the gate\n', 'normal'),
-                    ('3. Select "', 'normal'),
-                    ('● Add Control', 'highlight'),
-                    ('"\n', 'normal'),
-                    ('4. Click on any qubit lane to place the control\n\n', 'normal'),
-                    ('The result: ', 'normal'),
-                    ('CH, CY, CZ, CS, CT', 'component'),
-                    (' gates!\n\n', 'normal'),
-                    ('✨ Features:', 'title'),
-                    ('\n', 'normal'),
-                    ('• Controls can span ', 'normal'),
-                    ('multiple wires', 'warning'),
-                    (' (not just adjacent)\n', 'normal'),
-                    ('• Same color as original gate + ', 'normal'),
-                    ('●', 'highlight'),
-                    (' control dot\n', 'normal'),
-                    ('• Right-click again to remove control\n\n', 'normal'),
-                    ('Try the demo to see a controlled gate spanning 3 qubits!', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_controlled_gate'
-            },
-            # Step 7: Three-Qubit Repetition Code (from Advanced)
-            {
-                'title': 'Three-Qubit Repetition Code',
-                'content': [
-                    ('Classical Error Correction: The Repetition Code', 'title'),
-                    ('\n\n', 'normal'),
-                    ('The simplest quantum error correction is the ', 'normal'),
-                    ('3-qubit bit-flip code', 'ldpc'),
-                    ('.\n\n', 'normal'),
-                    ('Encoding:', 'title'),
-                    ('\n', 'normal'),
-                    ('   |0⟩ → |000⟩    |1⟩ → |111⟩\n', 'math'),
-                    ('\nThis uses ', 'normal'),
-                    ('2 CNOT gates', 'component'),
-                    (' to copy the logical state:\n\n', 'normal'),
-                    ('Circuit Structure:', 'title'),
-                    ('\n', 'normal'),
-                    ('   q0: ─────●─────●─────\n', 'math'),
-                    ('            │     │\n', 'math'),
-                    ('   q1: ─────⊕─────┼─────\n', 'math'),
-                    ('                  │\n', 'math'),
-                    ('   q2: ───────────⊕─────\n\n', 'math'),
-                    ('Error Detection:', 'title'),
-                    ('\n', 'normal'),
-                    ('• Parity checks compare adjacent qubits\n', 'normal'),
-                    ('• Syndrome reveals which qubit flipped\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('Majority voting', 'highlight'),
-                    (' corrects single errors', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_repetition_code'
-            },
-            # Step 7: Surface Code Mode (NEW)
-            {
-                'title': 'Surface Code Mode',
-                'content': [
-                    ('🔲 ', 'normal'),
-                    ('Surface Code View', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Press ', 'normal'),
-                    ('V', 'action'),
-                    (' to toggle between ', 'normal'),
-                    ('Circuit Mode', 'component'),
-                    (' and ', 'normal'),
-                    ('Surface Code Mode', 'ldpc'),
-                    ('!\n\n', 'normal'),
-                    ('Circuit Mode (Isometric 3D):', 'title'),
-                    ('\n', 'normal'),
-                    ('• Standard quantum circuit layout\n', 'normal'),
-                    ('• Qubit lanes run front-to-back\n', 'normal'),
-                    ('• Time flows left-to-right\n\n', 'normal'),
-                    ('Surface Code Mode (2D Lattice):', 'title'),
-                    ('\n', 'normal'),
-                    ('• Top-down view of a 2D qubit array\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('Burgundy squares', 'component'),
-                    (' = X-stabilizers (plaquettes)\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('Purple squares', 'ldpc'),
-                    (' = Z-stabilizers (vertices)\n', 'normal'),
-                    ('• Data qubits live on the ', 'normal'),
-                    ('edges', 'highlight'),
-                    (' between plaquettes\n\n', 'normal'),
-                    ('Click on plaquettes to place stabilizers, edges for data qubits.', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_repetition_code'
-            },
-            # Step 8: Loading Examples (was step 7)
-            {
-                'title': 'Exploring Pre-Built Circuits',
-                'content': [
-                    ('The ', 'normal'),
-                    ('saved_circuits/', 'action'),
-                    (' folder contains example circuits:\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('error_correction_demo.json', 'component'),
-                    ('\n   Basic LDPC with error injection\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('syndrome_extraction.json', 'component'),
-                    ('\n   DiVincenzo-Aliferis protocol\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('tutorial_repetition_code.json', 'component'),
-                    ('\n   3-qubit repetition code\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('tutorial_surface_code.json', 'component'),
-                    ('\n   Surface code structure\n\n', 'normal'),
-                    ('To load: Click "', 'normal'),
-                    ('Load Circuit', 'action'),
-                    ('" and browse to saved_circuits/', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_loading_examples'
-            },
-            # Step 9: Keyboard Shortcuts (was step 8) - updated with V hotkey
-            {
-                'title': 'Keyboard Shortcuts & Tips',
-                'content': [
-                    ('⌨️ ', 'normal'),
-                    ('Keyboard Shortcuts:', 'title'),
-                    ('\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('V', 'action'),
-                    (' — Toggle Surface Code / Circuit mode\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('C', 'action'),
-                    (' — Clear entire circuit\n', 'normal'),
-                    ('• Delete — Remove selected component\n', 'normal'),
-                    ('• Ctrl+C — Copy (duplicate adjacent)\n', 'normal'),
-                    ('• Ctrl+S — Save circuit to file\n', 'normal'),
-                    ('• Ctrl+O — Open/load circuit\n\n', 'normal'),
-                    ('🖱️ ', 'normal'),
-                    ('Mouse Actions:', 'title'),
-                    ('\n\n', 'normal'),
-                    ('• Left-click — Place or select component\n', 'normal'),
-                    ('• Drag — Move component\n', 'normal'),
-                    ('• Right-click — Context menu (rotate, delete, properties)\n', 'normal'),
-                    ('• Middle-click + drag — Pan the grid view\n', 'normal'),
-                    ('• Scroll wheel — Zoom in/out\n\n', 'normal'),
-                    ('The Status Panel (bottom-right) shows computation results.', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_keyboard_shortcuts'
-            },
-            # Step 10: Final (was step 9)
-            {
-                'title': 'You\'re Ready to Build!',
-                'content': [
-                    ('🎉 Congratulations! You\'re ready to build quantum circuits.\n\n', 'normal'),
-                    ('📋 ', 'normal'),
-                    ('Quick Start Checklist:', 'title'),
-                    ('\n\n', 'normal'),
-                    ('□ Place some ', 'normal'),
-                    ('Data Qubits', 'component'),
-                    (' (green blocks)\n', 'normal'),
-                    ('□ Add gates (H, X, CNOT) to create a circuit\n', 'normal'),
-                    ('□ Press ', 'normal'),
-                    ('V', 'action'),
-                    (' to explore Surface Code mode\n', 'normal'),
-                    ('□ Try "Simulate Evolution" to see quantum states\n', 'normal'),
-                    ('□ Load example circuits to learn more!\n\n', 'normal'),
-                    ('For advanced topics like LDPC codes and hypergraph\n', 'normal'),
-                    ('products, check the ', 'normal'),
-                    ('Surface Code Tutorial', 'ldpc'),
-                    (' from the Help menu.\n\n', 'normal'),
-                    ('Click ', 'normal'),
-                    ('Finish', 'action'),
-                    (' to start building.', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_final'
-            },
-        ]
+    @classmethod
+    def _get_steps(cls) -> List[Dict[str, Any]]:
+        """Return the compiled tutorial steps, building them on first use."""
+        if cls._steps_cache is None:
+            cls._steps_cache = compile_tutorial_steps(cls._create_tutorial_steps())
+        return cls._steps_cache
+    
+    @classmethod
+    def _create_tutorial_steps(cls) -> List[Dict[str, Any]]:
+        """Load the tutorial content with tagged text for coloring."""
+        return load_tutorial_steps('TutorialScreen')
     
     def show(self):
         """Display the tutorial window."""
@@ -583,8 +437,7 @@ class TutorialScreen:
         
         # Position to the RIGHT side of screen so grid is visible on the left
         self.tutorial_window.update_idletasks()
-        screen_width = self.tutorial_window.winfo_screenwidth()
-        screen_height = self.tutorial_window.winfo_screenheight()
+        screen_width, screen_height = screen_dims(self.parent)
         # Place tutorial on right side, leaving space for grid visibility
         x = screen_width - 680  # 650 width + 30 margin
         y = (screen_height - 520) // 2
@@ -679,7 +532,7 @@ class TutorialScreen:
             padx=25,
             pady=8,
             cursor='hand2',
-            command=self._next_step
+            command=functools.partial(self._nav, 1)
         )
         self.next_btn.pack(side=tk.RIGHT)
         
@@ -696,7 +549,7 @@ class TutorialScreen:
             padx=15,
             pady=8,
             cursor='hand2',
-            command=self._prev_step
+            command=functools.partial(self._nav, -1)
         )
         self.prev_btn.pack(side=tk.RIGHT, padx=(0, 10))
         
@@ -716,6 +569,19 @@ class TutorialScreen:
             command=self._toggle_hint
         )
         self.hint_btn.pack(side=tk.RIGHT, padx=(0, 10))
+        self._hint_btn_packed = True
+        
+        # Last options applied per widget, to skip no-op reconfigures
+        self._applied_config: Dict[str, Any] = {}
+        # Step whose content is currently in content_text
+        self._rendered_step: Optional[int] = None
+        # Pending after_idle id for a coalesced navigation redraw
+        self._update_after_id: Optional[str] = None
+        # Demo action whose components are currently on the canvas
+        self._shown_demo: Optional[str] = None
+        # Draw signatures and selection recorded when that demo was placed
+        self._demo_signatures: List[tuple] = []
+        self._demo_selection: Optional[Component3D] = None
         
         # === CONTENT AREA - Pack AFTER nav so it fills remaining space ===
         self.content_frame = tk.Frame(self.main_frame, bg='#0f0f23', bd=1, relief='solid')
@@ -742,9 +608,7 @@ class TutorialScreen:
         self.content_text.config(yscrollcommand=scrollbar.set)
         
         # Configure text tags for colors
-        for tag_name, color in self.COLORS.items():
-            self.content_text.tag_configure(tag_name, foreground=color)
-        self.content_text.tag_configure('normal', foreground='#cccccc')
+        configure_text_tags(self.content_text, self.COLORS)
         
         # Display first step
         self._update_display()
@@ -752,64 +616,94 @@ class TutorialScreen:
         # Handle window close
         self.tutorial_window.protocol("WM_DELETE_WINDOW", self._skip_tutorial)
     
+    def _schedule_update(self):
+        """Coalesce rapid navigation into one _update_display on the next idle tick."""
+        if self._update_after_id is None:
+            self._update_after_id = self.tutorial_window.after_idle(self._update_display)
+    
     def _update_display(self):
         """Update the display for the current step."""
+        self._update_after_id = None
         step_data = self.steps[self.current_step]
         
+        self._refresh_content(step_data)
+        self._refresh_buttons()
+        
+        # Execute demo action for this step
+        if 'demo_action' in step_data:
+            self._execute_demo(step_data['demo_action'])
+    
+    def _refresh_content(self, step_data: Dict[str, Any]):
+        """Update the title, progress indicators and text for the current step."""
         # Update title
-        self.title_label.config(text=step_data['title'])
+        self._config_if_changed('title', self.title_label, text=step_data['title'])
         
         # Update step indicator
-        self.step_label.config(text=f"Step {self.current_step + 1} of {len(self.steps)}")
+        self._config_if_changed('step', self.step_label, text=self._step_labels[self.current_step])
         
         # Update progress bar
-        progress = (self.current_step + 1) / len(self.steps)
-        self.progress_bar.place(x=0, y=0, relheight=1, relwidth=progress)
-        
-        # Update content
-        self.content_text.config(state='normal')
-        self.content_text.delete('1.0', tk.END)
+        progress = self._progress_table[self.current_step]
+        if progress != self._applied_config.get('progress'):
+            self.progress_bar.place(x=0, y=0, relheight=1, relwidth=progress)
+            self._applied_config['progress'] = progress
         
-        for text, tag in step_data['content']:
-            self.content_text.insert(tk.END, text, tag)
-        
-        self.content_text.config(state='disabled')
-        
-        # Update button states
-        self.prev_btn.config(state='normal' if self.current_step > 0 else 'disabled')
+        # Update content, unless this step is already shown
+        if self._rendered_step != self.current_step:
+            self.content_text.config(state='normal')
+            self.content_text.delete('1.0', tk.END)
+            
+            self.content_text.insert(tk.END, *step_data['content'])
+            
+            self.content_text.config(state='disabled')
+            self._rendered_step = self.current_step
+    
+    def _refresh_buttons(self):
+        """Update the navigation and hint buttons for the current step."""
+        self._config_if_changed('prev', self.prev_btn,
+                                state='normal' if self.current_step > 0 else 'disabled')
         
         # Show hint button only on step 4 (Building Your First LDPC Code)
         # and step 9 (final checklist)
         if self.current_step in [4, 9] and self.circuit_builder is not None:
-            self.hint_btn.pack(side=tk.RIGHT, padx=(0, 10))
+            if not self._hint_btn_packed:
+                self.hint_btn.pack(side=tk.RIGHT, padx=(0, 10))
+                self._hint_btn_packed = True
             # Update hint button text based on state
             if self.hint_active:
-                self.hint_btn.config(text="↩ Remove Hint", fg='#ff6b6b')
+                self._config_if_changed('hint', self.hint_btn, text="↩ Remove Hint", fg='#ff6b6b')
             else:
-                self.hint_btn.config(text="💡 Show Hint", fg='#ffd93d')
-        else:
+                self._config_if_changed('hint', self.hint_btn, text="💡 Show Hint", fg='#ffd93d')
+        elif self._hint_btn_packed:
             self.hint_btn.pack_forget()
+            self._hint_btn_packed = False
         
         # Change next button text on last step
-        if self.current_step == len(self.steps) - 1:
-            self.next_btn.config(text="Finish ✓", bg='#27ae60')
+        if self.current_step == self._n_steps - 1:
+            self._config_if_changed('next', self.next_btn, text="Finish ✓", bg='#27ae60')
         else:
-            self.next_btn.config(text="Next →", bg='#e94560')
-        
-        # Execute demo action for this step
-        if 'demo_action' in step_data:
-            self._execute_demo(step_data['demo_action'])
+            self._config_if_changed('next', self.next_btn, text="Next →", bg='#e94560')
+    
+    def _config_if_changed(self, key: str, widget, **options):
+        """Configure a widget only if the options differ from those last applied under key."""
+        if self._applied_config.get(key) != options:
+            widget.config(**options)
+            self._applied_config[key] = options
     
     def _execute_demo(self, action: str):
         """Execute the demo action for the current step."""
         if not self.circuit_builder:
             return
         
+        # Consecutive steps sharing a demo keep the scene already on the canvas
+        if action == self._shown_demo and self._demo_intact():
+            return
+        
         # Clear any selection from previous step
         self.circuit_builder.selected_component = None
         
         # Clear previous demo components
         self._clear_demo_components()
+        self._shown_demo = action
         
         # Map actions to demo methods
         demo_map = {
@@ -827,32 +721,54 @@ class TutorialScreen:
         
         if action in demo_map:
             demo_map[action]()
+        
+        builder = self.circuit_builder
+        self._demo_signatures = [builder._draw_signature(c) for c in self.demo_components]
+        self._demo_selection = builder.selected_component
+    
+    def _demo_intact(self) -> bool:
+        """Whether the placed demo is still in the circuit exactly as it was placed."""
+        if not self.demo_components:
+            return False
+        builder = self.circuit_builder
+        if builder.selected_component is not self._demo_selection:
+            return False
+        placed_ids = {id(c) for c in builder.components}
+        if not all(id(c) in placed_ids for c in self.demo_components):
+            return False
+        return [builder._draw_signature(c) for c in self.demo_components] == self._demo_signatures
     
     def _clear_demo_components(self):
         """Clear previously placed demo components."""
-        if not self.circuit_builder:
+        self._shown_demo = None
+        self._demo_signatures = []
+        self._demo_selection = None
+        if not self.circuit_builder or not self.demo_components:
             return
-        for comp in self.demo_components:
-            if comp in self.circuit_builder.components:
-                self.circuit_builder.components.remove(comp)
+        demo_ids = {id(c) for c in self.demo_components}
+        self.circuit_builder.components[:] = [
+            c for c in self.circuit_builder.components if id(c) not in demo_ids
+        ]
         self.demo_components = []
-        self.circuit_builder._redraw_circuit()
+        self.circuit_builder._schedule_redraw()
     
     def _place_demo_components(self, specs):
         """Place demo components from specs list."""
         if not self.circuit_builder:
             return
         
-        two_qubit_types = [ComponentType.CNOT_GATE, ComponentType.CZ_GATE, ComponentType.SWAP_GATE]
+        # Snapshot occupied cells once so each spec is an O(1) lookup
+        occupied_positions = {c.position for c in self.circuit_builder.components}
+        get_color = self.circuit_builder._get_component_color
         
         for comp_type, position in specs:
             # Check position not occupied
-            occupied = any(c.position == position for c in self.circuit_builder.components)
-            if occupied:
+            if position in occupied_positions:
                 continue
+            occupied_positions.add(position)
             
-            color = self.circuit_builder._get_component_color(comp_type)
-            size = (1.0, 1.0, 2.0) if comp_type in two_qubit_types else (1.0, 1.0, 1.0)
+            color = get_color(comp_type)
+            size = (1.0, 1.0, 2.0) if comp_type in _TWO_QUBIT_TYPES else (1.0, 1.0, 1.0)
             
             comp = Component3D(
                 component_type=comp_type,
@@ -863,7 +779,7 @@ class TutorialScreen:
             self.circuit_builder.components.append(comp)
             self.demo_components.append(comp)
         
-        self.circuit_builder._redraw_circuit()
+        self.circuit_builder._schedule_redraw()
     
     def _demo_welcome(self):
         """Demo for welcome screen - simple Bell state circuit with clear structure."""
@@ -904,7 +820,7 @@ class TutorialScreen:
             for comp in self.demo_components:
                 if comp.component_type == ComponentType.H_GATE:
                     self.circuit_builder.selected_component = comp
-                    self.circuit_builder._redraw_circuit()
+                    self.circuit_builder._schedule_redraw()
                     break
     
     def _demo_qubit_positions(self):
@@ -1066,19 +982,14 @@ class TutorialScreen:
         ]
         self._place_demo_components(specs)
     
-    def _next_step(self):
-        """Go to the next tutorial step or finish."""
-        if self.current_step < len(self.steps) - 1:
-            self.current_step += 1
-            self._update_display()
-        else:
+    def _nav(self, delta: int):
+        """Move delta steps through the tutorial, finishing past the last step."""
+        step = self.current_step + delta
+        if step >= self._n_steps:
             self._finish_tutorial()
-    
-    def _prev_step(self):
-        """Go to the previous tutorial step."""
-        if self.current_step > 0:
-            self.current_step -= 1
-            self._update_display()
+        elif step >= 0:
+            self.current_step = step
+            self._schedule_update()
     
     def _skip_tutorial(self):
         """Skip the tutorial."""
@@ -1086,6 +997,11 @@ class TutorialScreen:
     
     def _finish_tutorial(self):
         """Close the tutorial and call the completion callback."""
+        # Drop any navigation redraw still waiting for idle
+        if self._update_after_id is not None:
+            self.tutorial_window.after_cancel(self._update_after_id)
+            self._update_after_id = None
+        
         # Remove any hint components before closing
         if self.hint_active:
             self._remove_hint_components()
@@ -1110,67 +1026,32 @@ class TutorialScreen:
             self._place_hint_components()
         
         self.hint_active = not self.hint_active
-        self._update_display()  # Update button text
+        self._refresh_buttons()  # Update button text
     
     def _place_hint_components(self):
         """Place the example LDPC circuit components for the hint."""
         if not self.circuit_builder:
             return
         
-        # Define a simple LDPC demo circuit matching saved_circuits/error_correction_demo.json:
-        # Layout follows quantum circuit convention:
-        #   x-axis = time/operations (left to right)
-        #   y-axis = qubit lanes (stacked vertically)
-        #
-        # Time step 0: Data qubits (column x=0)
-        # Time step 1: Parity checks (column x=1) 
-        # Time step 2: X gate error (column x=2)
-        #
-        #   y=0: [Data0] [Parity0] 
-        #   y=1: [Data1] [Parity1] [X Gate]
-        #   y=2: [Data2]
-        
-        hint_specs = [
-            # Data qubits in a column (x=0, varying y)
-            (ComponentType.DATA_QUBIT, (0, 0, 0)),
-            (ComponentType.DATA_QUBIT, (0, 1, 0)),
-            (ComponentType.DATA_QUBIT, (0, 2, 0)),
-            # Parity checks adjacent (x=1)
-            (ComponentType.PARITY_CHECK, (1, 0, 0)),
-            (ComponentType.PARITY_CHECK, (1, 1, 0)),
-            # X gate (error) on middle data qubit line (x=2, y=1)
-            (ComponentType.X_GATE, (2, 1, 0)),
-        ]
-        
-        self.hint_components = []
-        
-        two_qubit_types = [ComponentType.CNOT_GATE, ComponentType.CZ_GATE, ComponentType.SWAP_GATE]
+        # Snapshot occupied cells once so each hint spec is an O(1) lookup;
+        # _HINT_SPECS positions are distinct, so the snapshot stays valid
+        occupied_positions = {c.position for c in self.circuit_builder.components}
+        get_color = self.circuit_builder._get_component_color
         
-        for comp_type, position in hint_specs:
-            # Check if position is free
-            occupied = False
-            for existing in self.circuit_builder.components:
-                if existing.position == position:
-                    occupied = True
-                    break
-            
-            if not occupied:
-                color = self.circuit_builder._get_component_color(comp_type)
-                # Two-qubit gates span 2 lanes
-                if comp_type in two_qubit_types:
-                    size = (1.0, 1.0, 2.0)  # (width, height, depth) - depth=2 for Y direction
-                else:
-                    size = (1.0, 1.0, 1.0)
-                component = Component3D(
-                    component_type=comp_type,
-                    position=position,
-                    color=color,
-                    size=size
-                )
-                self.circuit_builder.components.append(component)
-                self.hint_components.append(component)
+        self.hint_components = [
+            Component3D(
+                component_type=comp_type,
+                position=position,
+                color=get_color(comp_type),
+                # Two-qubit gates span 2 lanes (depth=2 in the Y direction)
+                size=(1.0, 1.0, 2.0) if comp_type in _TWO_QUBIT_TYPES else (1.0, 1.0, 1.0),
+            )
+            for comp_type, position in _HINT_SPECS
+            if position not in occupied_positions
+        ]
+        self.circuit_builder.components.extend(self.hint_components)
         
-        # Redraw the circuit
+        # Incremental redraw: only the new hint components get canvas items
         self.circuit_builder._redraw_circuit()
         self.circuit_builder._log_status("Hint: Example LDPC circuit placed (3 data qubits + 2 parity checks + X gate)")
     
@@ -1179,39 +1060,37 @@ class TutorialScreen:
         if not self.circuit_builder:
             return
         
-        # Remove hint components from the circuit builder
-        for hint_comp in self.hint_components:
-            if hint_comp in self.circuit_builder.components:
-                self.circuit_builder.components.remove(hint_comp)
-        
-        self.hint_components = []
+        # Remove hint components from the circuit builder in a single pass
+        hint_ids = {id(c) for c in self.hint_components}
+        self.circuit_builder.components[:] = [
+            c for c in self.circuit_builder.components if id(c) not in hint_ids
+        ]
         
-        # Redraw the circuit
+        # Incremental redraw: only the hint components' items are deleted
         self.circuit_builder._redraw_circuit()
+        self.hint_components = []
         self.circuit_builder._log_status("Hint circuit removed")
     
     @staticmethod
     def should_show_tutorial() -> bool:
         """Check if tutorial should be shown based on saved preferences."""
-        config_path = os.path.join(os.path.dirname(__file__), '.tutorial_config.json')
-        try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    return config.get('show_tutorial', True)
-        except:
-            pass
-        return True
+        return _load_tutorial_preference()
     
     @staticmethod
     def save_tutorial_preference(show_on_startup: bool):
         """Save the tutorial display preference."""
-        config_path = os.path.join(os.path.dirname(__file__), '.tutorial_config.json')
+        # Skip the disk write when the checkbox was left unchanged
+        if show_on_startup == _load_tutorial_preference():
+            return
+        # Write to a temp file and swap it in so the config is never left half-written
+        tmp_path = _TUTORIAL_CONFIG_PATH + '.tmp'
         try:
-            with open(config_path, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 json.dump({'show_tutorial': show_on_startup}, f)
-        except:
+            os.replace(tmp_path, _TUTORIAL_CONFIG_PATH)
+        except OSError:
             pass
+        _load_tutorial_preference.cache_clear()
 
 
 class SurfaceCodeTutorialScreen:
@@ -1234,6 +1113,9 @@ class SurfaceCodeTutorialScreen:
         'gate': '#ffaa00',         # Orange for gates
     }
     
+    # Compiled steps shared by all instances (see _get_steps)
+    _steps_cache: Optional[List[Dict[str, Any]]] = None
+    
     def __init__(self, parent: tk.Tk, circuit_builder=None):
         """
         Initialize the surface code tutorial.
@@ -1247,237 +1129,26 @@ class SurfaceCodeTutorialScreen:
         self.current_step = 0
         self.tutorial_window = None
         self.demo_components = []  # Track components placed for demonstration
-        self.original_components = []  # Store original circuit state
         
         # Define surface code tutorial steps
-        self.steps = self._create_tutorial_steps()
+        self.steps = self._get_steps()
     
-    def _create_tutorial_steps(self) -> List[Dict[str, Any]]:
-        """Create the Surface Code tutorial content."""
-        return [
-            # Step 0: What is the Surface Code?
-            {
-                'title': 'What is the Surface Code?',
-                'content': [
-                    ('The ', 'normal'),
-                    ('Surface Code', 'ldpc'),
-                    (' is the most promising quantum error correction code!\n\n', 'normal'),
-                    ('🔲 ', 'normal'),
-                    ('Key Idea:', 'title'),
-                    ('\n', 'normal'),
-                    ('Qubits are arranged on a 2D grid (lattice). Errors are\n', 'normal'),
-                    ('detected by measuring local ', 'normal'),
-                    ('stabilizers', 'highlight'),
-                    (' - groups of nearby qubits.\n\n', 'normal'),
-                    ('Why Surface Codes?', 'title'),
-                    ('\n', 'normal'),
-                    ('• Only need ', 'normal'),
-                    ('local operations', 'component'),
-                    (' - nearest-neighbor gates\n', 'normal'),
-                    ('• High error threshold: ~1% per gate\n', 'normal'),
-                    ('• Actively pursued by Google, IBM, and others\n\n', 'normal'),
-                    ('Press ', 'normal'),
-                    ('V', 'action'),
-                    (' in the main window to enter Surface Code Mode!', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_surface_intro'
-            },
-            # Step 1: The Lattice Structure (Rotated Surface Code)
-            {
-                'title': 'The Rotated Surface Code',
-                'content': [
-                    ('Understanding the Rotated Lattice', 'title'),
-                    ('\n\n', 'normal'),
-                    ('In the ', 'normal'),
-                    ('rotated surface code', 'highlight'),
-                    (':\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('Data Qubits', 'component'),
-                    (' (grey circles): At ', 'normal'),
-                    ('odd', 'highlight'),
-                    (' coordinates (1,1), (1,3), etc.\n', 'normal'),
-                    ('   → These store your quantum information\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('X-Stabilizers', 'ldpc'),
-                    (' (red diamonds): At ', 'normal'),
-                    ('even', 'highlight'),
-                    (' coordinates\n', 'normal'),
-                    ('   → Detect Z (phase) errors on neighboring data qubits\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('Z-Stabilizers', 'ldpc'),
-                    (' (blue crosses): At ', 'normal'),
-                    ('even', 'highlight'),
-                    (' coordinates\n', 'normal'),
-                    ('   → Detect X (bit-flip) errors on neighboring data qubits\n\n', 'normal'),
-                    ('Click on data qubit positions (odd coords) to place qubits.', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_surface_lattice'
-            },
-            # Step 2: Stabilizer Measurements
-            {
-                'title': 'Measuring Stabilizers',
-                'content': [
-                    ('How Stabilizers Work', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Each stabilizer measures 4 neighboring data qubits:\n\n', 'normal'),
-                    ('X-Stabilizer Measurement:', 'title'),
-                    ('\n', 'normal'),
-                    ('1. Prepare ancilla in |0⟩\n', 'normal'),
-                    ('2. Apply ', 'normal'),
-                    ('Hadamard', 'component'),
-                    (' to ancilla → |+⟩\n', 'normal'),
-                    ('3. Apply ', 'normal'),
-                    ('CNOT', 'component'),
-                    (' from ancilla to each data qubit\n', 'normal'),
-                    ('4. Apply Hadamard, then ', 'normal'),
-                    ('Measure', 'component'),
-                    ('\n\n', 'normal'),
-                    ('Z-Stabilizer Measurement:', 'title'),
-                    ('\n', 'normal'),
-                    ('1. Prepare ancilla in |0⟩\n', 'normal'),
-                    ('2. Apply CNOT from each data qubit to ancilla\n', 'normal'),
-                    ('3. Measure ancilla\n\n', 'normal'),
-                    ('Result:', 'warning'),
-                    (' Outcome of 1 indicates an error nearby!', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_stabilizer_circuit'
-            },
-            # Step 3: Error Detection
-            {
-                'title': 'Detecting Errors',
-                'content': [
-                    ('The Syndrome Pattern', 'title'),
-                    ('\n\n', 'normal'),
-                    ('When an error occurs on a data qubit:\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('X error (bit-flip)', 'warning'),
-                    (': Detected by adjacent ', 'normal'),
-                    ('Z-stabilizers', 'ldpc'),
-                    ('\n', 'normal'),
-                    ('   → The two Z-checks sharing that qubit flip to -1\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('Z error (phase-flip)', 'warning'),
-                    (': Detected by adjacent ', 'normal'),
-                    ('X-stabilizers', 'ldpc'),
-                    ('\n', 'normal'),
-                    ('   → The two X-checks sharing that qubit flip to -1\n\n', 'normal'),
-                    ('Try It:', 'title'),
-                    ('\n', 'normal'),
-                    ('Use the ', 'normal'),
-                    ('Defects tab', 'action'),
-                    (' to place X, Z, or Y errors on data qubits.\n', 'normal'),
-                    ('Then click ', 'normal'),
-                    ('Highlight Syndrome', 'action'),
-                    (' to see which stabilizers detect them!', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_error_detection'
-            },
-            # Step 4: Using Surface Code Mode
-            {
-                'title': 'Placing Components',
-                'content': [
-                    ('How to Place Components', 'title'),
-                    ('\n\n', 'normal'),
-                    ('1. Select a tool from the toolbox (left panel)\n\n', 'normal'),
-                    ('2. Click on the lattice to place:\n\n', 'normal'),
-                    ('   • ', 'normal'),
-                    ('Data Qubits', 'component'),
-                    (': Click at ', 'normal'),
-                    ('odd', 'highlight'),
-                    (' coordinates (grey circles)\n', 'normal'),
-                    ('   • ', 'normal'),
-                    ('Stabilizers', 'ldpc'),
-                    (': Click at ', 'normal'),
-                    ('even', 'highlight'),
-                    (' coordinates (diamonds/crosses)\n', 'normal'),
-                    ('   • ', 'normal'),
-                    ('Errors', 'warning'),
-                    (': Click on data qubit positions\n\n', 'normal'),
-                    ('Tips:', 'title'),
-                    ('\n', 'normal'),
-                    ('• Background shows where components can go\n', 'normal'),
-                    ('• Red diamonds = X-stabilizer positions\n', 'normal'),
-                    ('• Blue crosses = Z-stabilizer positions\n', 'normal'),
-                    ('• Grey circles = data qubit positions', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_surface_demo'
-            },
-            # Step 5: Code Distance and Logical Qubits
-            {
-                'title': 'Code Distance & Logical Qubits',
-                'content': [
-                    ('Scaling the Surface Code', 'title'),
-                    ('\n\n', 'normal'),
-                    ('The ', 'normal'),
-                    ('code distance d', 'math'),
-                    (' determines error protection:\n\n', 'normal'),
-                    ('• d = 3: Can correct 1 error\n', 'normal'),
-                    ('• d = 5: Can correct 2 errors\n', 'normal'),
-                    ('• d = 7: Can correct 3 errors\n\n', 'normal'),
-                    ('Resource Requirements:', 'title'),
-                    ('\n', 'normal'),
-                    ('For distance d, you need ', 'normal'),
-                    ('~2d² physical qubits', 'math'),
-                    ('\n', 'normal'),
-                    ('per logical qubit.\n\n', 'normal'),
-                    ('Examples:', 'title'),
-                    ('\n', 'normal'),
-                    ('• d=3:  ~18 physical qubits per logical\n', 'normal'),
-                    ('• d=5:  ~50 physical qubits per logical\n', 'normal'),
-                    ('• d=17: ~578 physical qubits per logical\n\n', 'normal'),
-                    ('This is why ', 'normal'),
-                    ('LDPC codes', 'warning'),
-                    (' are exciting - they need far fewer qubits!', 'normal'),
-                ],
-                'image': None,
-                'demo_action': 'show_code_distance'
-            },
-            # Step 6: Ready to Build!
-            {
-                'title': 'Try Example Circuits!',
-                'content': [
-                    ('🎉 You\'re ready to explore Surface Codes!\n\n', 'normal'),
-                    ('Load Example Circuits:', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Click ', 'normal'),
-                    ('Load Circuit', 'action'),
-                    (' and navigate to ', 'normal'),
-                    ('saved_circuits/surface/', 'highlight'),
-                    (':\n\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('error_chain_demo.json', 'component'),
-                    (' - Test syndrome highlighting\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('syndrome_correction_demo.json', 'component'),
-                    (' - Test the decoder\n', 'normal'),
-                    ('• ', 'normal'),
-                    ('distance_3_patch.json', 'component'),
-                    (' - Complete distance-3 code\n\n', 'normal'),
-                    ('After Loading:', 'title'),
-                    ('\n', 'normal'),
-                    ('1. Click ', 'normal'),
-                    ('Highlight Syndrome', 'action'),
-                    (' to see detection\n', 'normal'),
-                    ('2. Click ', 'normal'),
-                    ('Run Decoder', 'action'),
-                    (' to find corrections\n\n', 'normal'),
-                    ('Try it now! Load error_chain_demo.json', 'warning'),
-                ],
-                'image': None,
-                'demo_action': 'load_error_demo'
-            },
-        ]
+    @classmethod
+    def _get_steps(cls) -> List[Dict[str, Any]]:
+        """Return the compiled tutorial steps, building them on first use."""
+        if cls._steps_cache is None:
+            cls._steps_cache = compile_tutorial_steps(cls._create_tutorial_steps())
+        return cls._steps_cache
+    
+    @classmethod
+    def _create_tutorial_steps(cls) -> List[Dict[str, Any]]:
+        """Load the Surface Code tutorial content."""
+        return load_tutorial_steps('SurfaceCodeTutorialScreen')
     
     def show(self):
         """Display the Surface Code tutorial window."""
-        # Store original circuit state and view mode
+        # Checkpoint original view mode
         if self.circuit_builder:
-            self.original_components = list(self.circuit_builder.components)
             self.original_view_mode = self.circuit_builder.view_mode
             # Switch to Surface Code Mode for this tutorial
             if self.circuit_builder.view_mode != ViewMode.SURFACE_CODE_2D:
@@ -1492,7 +1163,7 @@ class SurfaceCodeTutorialScreen:
         # Position to the left of screen
         self.tutorial_window.update_idletasks()
         x = 50
-        y = (self.tutorial_window.winfo_screenheight() - 480) // 2
+        y = (screen_dims(self.parent)[1] - 480) // 2
         self.tutorial_window.geometry(f"600x480+{x}+{y}")
         
         # Main container
@@ -1612,9 +1283,7 @@ class SurfaceCodeTutorialScreen:
         self.content_text.config(yscrollcommand=scrollbar.set)
         
         # Configure text tags
-        for tag_name, color in self.COLORS.items():
-            self.content_text.tag_configure(tag_name, foreground=color)
-        self.content_text.tag_configure('normal', foreground='#cccccc')
+        configure_text_tags(self.content_text, self.COLORS)
         
         # Display first step
         self._update_display()
@@ -1640,8 +1309,7 @@ class SurfaceCodeTutorialScreen:
         self.content_text.config(state='normal')
         self.content_text.delete('1.0', tk.END)
         
-        for text, tag in step_data['content']:
-            self.content_text.insert(tk.END, text, tag)
+        self.content_text.insert(tk.END, *step_data['content'])
         
         self.content_text.config(state='disabled')
         
@@ -1829,19 +1497,23 @@ class SurfaceCodeTutorialScreen:
         if not self.circuit_builder:
             return
         
+        # Lattice sites taken by non-error components (errors may stack on data)
+        occupied_sites = {
+            (c.position[0], c.position[1]) for c in self.circuit_builder.components
+            if c.component_type not in _SURFACE_ERROR_TYPES
+        }
+        
         for comp_type, position in specs:
             # Use integer coordinates for rotated surface code
             x, y, z = int(position[0]), int(position[1]), int(position[2])
             
             # Check if position is already occupied (allow errors to stack on data)
-            is_error = comp_type in [ComponentType.SURFACE_X_ERROR, ComponentType.SURFACE_Z_ERROR, ComponentType.SURFACE_Y_ERROR]
-            occupied = any(
-                c.position[0] == x and c.position[1] == y and 
-                c.component_type not in [ComponentType.SURFACE_X_ERROR, ComponentType.SURFACE_Z_ERROR, ComponentType.SURFACE_Y_ERROR]
-                for c in self.circuit_builder.components
-            ) if not is_error else False
+            is_error = comp_type in _SURFACE_ERROR_TYPES
+            occupied = (x, y) in occupied_sites if not is_error else False
             
             if not occupied:
+                if not is_error:
+                    occupied_sites.add((x, y))
                 color = self.circuit_builder._get_component_color(comp_type)
                 component = Component3D(
                     component_type=comp_type,
@@ -1852,7 +1524,7 @@ class SurfaceCodeTutorialScreen:
                 self.circuit_builder.components.append(component)
                 self.demo_components.append(component)
         
-        self.circuit_builder._redraw_circuit()
+        self.circuit_builder._schedule_redraw()
     
     def _demo_welcome(self):
         """Fallback - redirect to surface intro."""
@@ -1886,15 +1558,16 @@ class SurfaceCodeTutorialScreen:
     
     def _clear_demo_components(self):
         """Remove all demo components from the surface lattice."""
-        if not self.circuit_builder:
+        if not self.circuit_builder or not self.demo_components:
             return
         
-        for comp in self.demo_components:
-            if comp in self.circuit_builder.components:
-                self.circuit_builder.components.remove(comp)
+        demo_ids = {id(c) for c in self.demo_components}
+        self.circuit_builder.components[:] = [
+            c for c in self.circuit_builder.components if id(c) not in demo_ids
+        ]
         
         self.demo_components = []
-        self.circuit_builder._redraw_circuit()
+        self.circuit_builder._schedule_redraw()
     
     def _next_step(self):
         """Go to the next step or finish."""
@@ -1912,12 +1585,10 @@ class SurfaceCodeTutorialScreen:
     
     def _close_tutorial(self):
         """Close the tutorial and clean up."""
-        # Remove demo components
+        # Remove demo components; this queues a redraw only if any were placed
         self._clear_demo_components()
         
-        # Just redraw the circuit (components are surface mode compatible)
         if self.circuit_builder:
-            self.circuit_builder._redraw_circuit()
             self.circuit_builder._log_status("Surface Code tutorial closed. Press V to switch back to circuit mode.")
         
         self.tutorial_window.destroy()
@@ -1954,6 +1625,9 @@ class AdvancedLargeCircuitsTutorial:
         'correct': '#ffdd33',
     }
     
+    # Compiled steps shared by all instances (see _get_steps)
+    _steps_cache: Optional[List[Dict[str, Any]]] = None
+    
     def __init__(self, parent: tk.Tk, circuit_builder=None):
         self.parent = parent
         self.circuit_builder = circuit_builder
@@ -1961,240 +1635,19 @@ class AdvancedLargeCircuitsTutorial:
         self.tutorial_window = None
         self.original_grid_size = 20
         
-        self.steps = self._create_tutorial_steps()
+        self.steps = self._get_steps()
     
-    def _create_tutorial_steps(self) -> List[Dict[str, Any]]:
-        """Create advanced circuit-mode tutorial with 8 large practical quantum circuits."""
-        return [
-            {
-                'title': 'Advanced Circuit Tutorial',
-                'content': [
-                    ('Welcome to ', 'normal'),
-                    ('Advanced Large Circuits', 'title'),
-                    ('!\n\n', 'normal'),
-                    ('This tutorial demonstrates ', 'normal'),
-                    ('8 large practical quantum circuits', 'highlight'),
-                    ('.\n\n', 'normal'),
-                    ('We will cover:\n\n', 'normal'),
-                    ('1. ', 'normal'), ('Quantum Teleportation', 'quantum'), (' - Transfer quantum state\n', 'normal'),
-                    ('2. ', 'normal'), ('Superdense Coding', 'quantum'), (' - 2 bits via 1 qubit\n', 'normal'),
-                    ('3. ', 'normal'), ('GHZ State', 'quantum'), (' - Multi-qubit entanglement\n', 'normal'),
-                    ('4. ', 'normal'), ('Quantum Fourier Transform', 'ldpc'), (' - 3-qubit QFT\n', 'normal'),
-                    ('5. ', 'normal'), ("Grover's Search", 'ldpc'), (' - 2-qubit oracle search\n', 'normal'),
-                    ('6. ', 'normal'), ('Deutsch-Jozsa', 'action'), (' - Quantum parallelism\n', 'normal'),
-                    ('7. ', 'normal'), ('Entanglement Swapping', 'action'), (' - Teleport entanglement\n', 'normal'),
-                    ('8. ', 'normal'), ("Shor's 9-Qubit Encoder", 'highlight'), (' - Full QEC circuit\n\n', 'normal'),
-                    ('💡 ', 'warning'),
-                    ('Grid expanded to 50 for visibility!', 'action'),
-                ],
-                'demo_action': 'intro'
-            },
-            {
-                'title': 'Quantum Teleportation',
-                'content': [
-                    ('Quantum Teleportation', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Transfer a quantum state using ', 'normal'),
-                    ('entanglement + classical communication', 'highlight'),
-                    ('.\n\n', 'normal'),
-                    ('Protocol:\n', 'action'),
-                    ('1. Alice & Bob share Bell pair |Φ⁺⟩\n', 'normal'),
-                    ('2. Alice has unknown |ψ⟩ to teleport\n', 'normal'),
-                    ('3. Alice: Bell measurement (CNOT + H + measure)\n', 'normal'),
-                    ('4. Alice sends 2 classical bits to Bob\n', 'normal'),
-                    ('5. Bob applies X/Z correction\n\n', 'normal'),
-                    ('Circuit: (3 qubits, ~15 gates)\n', 'quantum'),
-                    ('q0: |ψ⟩ ─────●─H─M═══════════\n', 'code'),
-                    ('q1: |0⟩ ─H─●─X───M═══╗═══════\n', 'code'),
-                    ('q2: |0⟩ ───X─────────X───Z──\n\n', 'code'),
-                    ('Applications: ', 'math'),
-                    ('Quantum internet, distributed QC\n', 'normal'),
-                    ('Building circuit...', 'warning'),
-                ],
-                'demo_action': 'teleportation'
-            },
-            {
-                'title': 'Superdense Coding',
-                'content': [
-                    ('Superdense Coding', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Send ', 'normal'),
-                    ('2 classical bits', 'highlight'),
-                    (' using only 1 qubit!\n\n', 'normal'),
-                    ('The "reverse" of teleportation.\n\n', 'action'),
-                    ('Protocol:\n', 'quantum'),
-                    ('1. Alice & Bob share Bell pair |Φ⁺⟩\n', 'normal'),
-                    ('2. Alice encodes 2 bits by applying gates:\n', 'normal'),
-                    ('   00 → I, 01 → X, 10 → Z, 11 → XZ\n', 'code'),
-                    ('3. Alice sends her qubit to Bob\n', 'normal'),
-                    ('4. Bob performs Bell measurement\n\n', 'normal'),
-                    ('Circuit Structure:\n', 'math'),
-                    ('• Create Bell pair (H + CNOT)\n', 'code'),
-                    ("• Alice's encoding: X and/or Z\n", 'code'),
-                    ("• Bob's decode: CNOT + H + measure both\n\n", 'code'),
-                    ('Building superdense circuit...', 'warning'),
-                ],
-                'demo_action': 'superdense'
-            },
-            {
-                'title': 'GHZ State Preparation',
-                'content': [
-                    ('GHZ State (N-Qubit Entanglement)', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Create maximally entangled ', 'normal'),
-                    ('N-qubit GHZ state', 'highlight'),
-                    (':\n\n', 'normal'),
-                    ('|GHZ⟩ = (|00...0⟩ + |11...1⟩)/√2\n\n', 'code'),
-                    ('Properties:\n', 'action'),
-                    ('• All qubits correlated\n', 'normal'),
-                    ('• Measure one → all collapse\n', 'normal'),
-                    ('• Used in quantum metrology, secret sharing\n\n', 'normal'),
-                    ('Circuit (5-qubit):\n', 'quantum'),
-                    ('q0: |0⟩ ─H─●─●─●─●─\n', 'code'),
-                    ('q1: |0⟩ ───X─────────\n', 'code'),
-                    ('q2: |0⟩ ─────X───────\n', 'code'),
-                    ('q3: |0⟩ ───────X─────\n', 'code'),
-                    ('q4: |0⟩ ─────────X───\n\n', 'code'),
-                    ('Building 5-qubit GHZ...', 'warning'),
-                ],
-                'demo_action': 'ghz_state'
-            },
-            {
-                'title': '3-Qubit QFT',
-                'content': [
-                    ('Quantum Fourier Transform', 'title'),
-                    ('\n\n', 'normal'),
-                    ('The quantum analog of ', 'normal'),
-                    ('Discrete Fourier Transform', 'highlight'),
-                    (' - key to many algorithms.\n\n', 'normal'),
-                    ('Transform:\n', 'action'),
-                    ('|j⟩ → Σₖ e^(2πijk/N) |k⟩ / √N\n\n', 'code'),
-                    ('3-Qubit Circuit:\n', 'quantum'),
-                    ('q0: ─H─R₂─R₃───×─\n', 'code'),
-                    ('q1: ───●──H─R₂─×─\n', 'code'),
-                    ('q2: ──────●──H─×─\n\n', 'code'),
-                    ('Where Rₖ = phase gate with θ = 2π/2^k\n\n', 'math'),
-                    ('Applications:\n', 'normal'),
-                    ("• Shor's algorithm (factoring)\n", 'code'),
-                    ('• Quantum phase estimation\n', 'code'),
-                    ('• Amplitude estimation\n\n', 'code'),
-                    ('Building 3-qubit QFT...', 'warning'),
-                ],
-                'demo_action': 'qft_3'
-            },
-            {
-                'title': "Grover's Search (2-qubit)",
-                'content': [
-                    ("Grover's Search Algorithm", 'title'),
-                    ('\n\n', 'normal'),
-                    ('Find marked item in ', 'normal'),
-                    ('O(√N)', 'highlight'),
-                    (' queries vs O(N) classical.\n\n', 'normal'),
-                    ('Components:\n', 'action'),
-                    ('1. Superposition: H⊗ⁿ |0⟩\n', 'normal'),
-                    ('2. Oracle: O|x⟩ = (-1)^f(x)|x⟩\n', 'normal'),
-                    ('3. Diffusion: 2|ψ⟩⟨ψ| - I\n\n', 'normal'),
-                    ('2-Qubit Oracle (marks |11⟩):\n', 'quantum'),
-                    ('q0: ─H─────●─────H─X─●─X─H─M─\n', 'code'),
-                    ('q1: ─H─────Z─────H─X─Z─X─H─M─\n\n', 'code'),
-                    ('One iteration sufficient for 2 qubits!\n', 'math'),
-                    ('Probability of |11⟩: 100%\n\n', 'code'),
-                    ('Building Grover circuit...', 'warning'),
-                ],
-                'demo_action': 'grover_2'
-            },
-            {
-                'title': 'Deutsch-Jozsa Algorithm',
-                'content': [
-                    ('Deutsch-Jozsa Algorithm', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Determine if f(x) is ', 'normal'),
-                    ('constant or balanced', 'highlight'),
-                    (' in ONE query!\n\n', 'normal'),
-                    ('Classical: needs 2^(n-1)+1 queries worst case\n\n', 'action'),
-                    ('Circuit Structure:\n', 'quantum'),
-                    ('1. Prepare |0⟩⊗ⁿ|1⟩\n', 'normal'),
-                    ('2. Apply H⊗(n+1)\n', 'normal'),
-                    ('3. Apply oracle Uₐ\n', 'normal'),
-                    ('4. Apply H⊗ⁿ on first n qubits\n', 'normal'),
-                    ('5. Measure: |0⟩⊗ⁿ ↔ constant\n\n', 'normal'),
-                    ('Oracle Examples:\n', 'math'),
-                    ('• Constant: f(x)=0 → identity\n', 'code'),
-                    ('• Balanced: f(x)=x → CNOT\n\n', 'code'),
-                    ('Building balanced oracle circuit...', 'warning'),
-                ],
-                'demo_action': 'deutsch_jozsa'
-            },
-            {
-                'title': 'Entanglement Swapping',
-                'content': [
-                    ('Entanglement Swapping', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Create entanglement between qubits that ', 'normal'),
-                    ('never interacted', 'highlight'),
-                    ('!\n\n', 'normal'),
-                    ('Setup:\n', 'action'),
-                    ('• Alice-Bob share Bell pair (q0-q1)\n', 'normal'),
-                    ('• Charlie-Diana share Bell pair (q2-q3)\n', 'normal'),
-                    ('• Bob & Charlie perform Bell measurement\n', 'normal'),
-                    ('• Result: Alice-Diana entangled!\n\n', 'normal'),
-                    ('Circuit: (4 qubits)\n', 'quantum'),
-                    ('q0: ─H─●─────────────────\n', 'code'),
-                    ('q1: ───X───●─H─M═╗═══════\n', 'code'),
-                    ('q2: ─H─●───X───M═╬═X─────\n', 'code'),
-                    ('q3: ───X─────────╚═══Z───\n\n', 'code'),
-                    ('Application: Quantum repeaters!\n', 'math'),
-                    ('Building entanglement swapping...', 'warning'),
-                ],
-                'demo_action': 'entangle_swap'
-            },
-            {
-                'title': "Shor's 9-Qubit Code",
-                'content': [
-                    ("Shor's [[9,1,3]] Code Encoder", 'title'),
-                    ('\n\n', 'normal'),
-                    ('The ', 'normal'),
-                    ('first complete QEC code', 'highlight'),
-                    (' (1995)!\n\n', 'normal'),
-                    ('Corrects ANY single-qubit error.\n\n', 'action'),
-                    ('Construction:\n', 'quantum'),
-                    ('• Outer: 3-qubit phase-flip code\n', 'normal'),
-                    ('• Inner: 3-qubit bit-flip code (per block)\n', 'normal'),
-                    ('• Total: 9 physical → 1 logical\n\n', 'normal'),
-                    ('Encoder Steps:\n', 'math'),
-                    ('1. CNOT q0→q3, q0→q6 (phase encode)\n', 'code'),
-                    ('2. H on q0, q3, q6\n', 'code'),
-                    ('3. CNOT qᵢ→qᵢ₊₁, qᵢ→qᵢ₊₂ (bit encode)\n\n', 'code'),
-                    ('|0⟩ → (|000⟩+|111⟩)(|000⟩+|111⟩)(|000⟩+|111⟩)/2√2\n', 'code'),
-                    ('\nBuilding full 9-qubit encoder...', 'warning'),
-                ],
-                'demo_action': 'shor_9'
-            },
-            {
-                'title': 'Tutorial Complete!',
-                'content': [
-                    ('🎉 ', 'normal'),
-                    ('Advanced Tutorial Complete!', 'title'),
-                    ('\n\n', 'normal'),
-                    ('You explored 8 practical quantum circuits:\n\n', 'normal'),
-                    ('✓ ', 'action'), ('Teleportation', 'quantum'), (' - State transfer\n', 'normal'),
-                    ('✓ ', 'action'), ('Superdense Coding', 'quantum'), (' - 2 bits via 1 qubit\n', 'normal'),
-                    ('✓ ', 'action'), ('GHZ State', 'quantum'), (' - N-qubit entanglement\n', 'normal'),
-                    ('✓ ', 'action'), ('QFT', 'ldpc'), (' - Quantum Fourier\n', 'normal'),
-                    ('✓ ', 'action'), ("Grover's", 'ldpc'), (' - Quantum search\n', 'normal'),
-                    ('✓ ', 'action'), ('Deutsch-Jozsa', 'action'), (' - Quantum speedup\n', 'normal'),
-                    ('✓ ', 'action'), ('Entanglement Swap', 'action'), (' - Quantum repeaters\n', 'normal'),
-                    ('✓ ', 'action'), ("Shor's Code", 'highlight'), (' - Full QEC encoder\n\n', 'normal'),
-                    ('Next Steps:\n', 'warning'),
-                    ('• Try Surface mode (V key) for 2D codes\n', 'normal'),
-                    ('• Try LDPC mode (B key) for Tanner graphs\n', 'normal'),
-                    ('• Place errors from "Errors" tab\n', 'normal'),
-                    ('• Save circuits with Ctrl+S\n\n', 'normal'),
-                    ('Happy quantum computing!', 'highlight'),
-                ],
-                'demo_action': 'complete'
-            },
-        ]
+    @classmethod
+    def _get_steps(cls) -> List[Dict[str, Any]]:
+        """Return the compiled tutorial steps, building them on first use."""
+        if cls._steps_cache is None:
+            cls._steps_cache = compile_tutorial_steps(cls._create_tutorial_steps())
+        return cls._steps_cache
+    
+    @classmethod
+    def _create_tutorial_steps(cls) -> List[Dict[str, Any]]:
+        """Load advanced circuit-mode tutorial with 8 large practical quantum circuits."""
+        return load_tutorial_steps('AdvancedLargeCircuitsTutorial')
     
     def show(self):
         """Display the advanced tutorial window - larger size for circuit visibility."""
@@ -2209,8 +1662,7 @@ class AdvancedLargeCircuitsTutorial:
         
         # Larger window positioned on LEFT side so grid is visible on RIGHT
         self.tutorial_window.update_idletasks()
-        screen_width = self.tutorial_window.winfo_screenwidth()
-        screen_height = self.tutorial_window.winfo_screenheight()
+        screen_width, screen_height = screen_dims(self.parent)
         
         # Window size: wider to fit content, but not too tall
         win_width = 500
@@ -2304,9 +1756,7 @@ class AdvancedLargeCircuitsTutorial:
         self.content_text.config(yscrollcommand=scrollbar.set)
         
         # Configure text tags
-        for tag_name, color in self.COLORS.items():
-            self.content_text.tag_configure(tag_name, foreground=color)
-        self.content_text.tag_configure('normal', foreground='#cccccc')
+        configure_text_tags(self.content_text, self.COLORS)
         
         self._update_display()
         self.tutorial_window.protocol("WM_DELETE_WINDOW", self._close_tutorial)
@@ -2326,8 +1776,7 @@ class AdvancedLargeCircuitsTutorial:
         self.content_text.config(state='normal')
         self.content_text.delete('1.0', tk.END)
         
-        for text, tag in step['content']:
-            self.content_text.insert(tk.END, text, tag)
+        self.content_text.insert(tk.END, *step['content'])
         
         self.content_text.config(state='disabled')
         
@@ -2926,239 +2375,28 @@ class SurfaceCodeTutorial:
         'correct': '#ffdd33',
     }
     
+    # Compiled steps shared by all instances (see _get_steps)
+    _steps_cache: Optional[List[Dict[str, Any]]] = None
+    
     def __init__(self, parent: tk.Tk, circuit_builder=None):
         self.parent = parent
         self.circuit_builder = circuit_builder
         self.current_step = 0
         self.tutorial_window = None
         
-        self.steps = self._create_tutorial_steps()
+        self.steps = self._get_steps()
     
-    def _create_tutorial_steps(self) -> List[Dict[str, Any]]:
-        """Create surface code tutorial with visual QEC demos."""
-        return [
-            {
-                'title': 'Surface Code Tutorial',
-                'content': [
-                    ('Welcome to the ', 'normal'),
-                    ('Surface Code Tutorial', 'title'),
-                    ('!\n\n', 'normal'),
-                    ('This tutorial demonstrates ', 'normal'),
-                    ('2D topological error correction', 'highlight'),
-                    (' visualization.\n\n', 'normal'),
-                    ('We will cover:\n\n', 'normal'),
-                    ('1. ', 'normal'), ('Code Anatomy', 'surface'), (' - Data qubits & stabilizers\n', 'normal'),
-                    ('2. ', 'normal'), ('X Error Detection', 'x_stab'), (' - Z-stabilizer syndrome\n', 'normal'),
-                    ('3. ', 'normal'), ('Z Error Detection', 'z_stab'), (' - X-stabilizer syndrome\n', 'normal'),
-                    ('4. ', 'normal'), ('Error Chains', 'error'), (' - Multi-error patterns\n', 'normal'),
-                    ('5. ', 'normal'), ('Syndrome Highlight', 'warning'), (' - Yellow button demo\n', 'normal'),
-                    ('6. ', 'normal'), ('Correction Cycle', 'correct'), (' - Full QEC workflow\n\n', 'normal'),
-                    ('💡 ', 'warning'),
-                    ('Watch the grid - circuits appear in real-time!', 'action'),
-                ],
-                'demo_action': 'intro'
-            },
-            {
-                'title': 'Surface Code Anatomy',
-                'content': [
-                    ('Rotated Surface Code (d=3)', 'title'),
-                    ('\n\n', 'normal'),
-                    ('The ', 'normal'),
-                    ('rotated surface code', 'highlight'),
-                    (' is the leading candidate for fault-tolerant QC.\n\n', 'normal'),
-                    ('Components:\n', 'action'),
-                    ('• ', 'data'), ('Data Qubits', 'data'), (' (cyan circles) - Store quantum info\n', 'normal'),
-                    ('• ', 'x_stab'), ('X-Stabilizers', 'x_stab'), (' (red) - Detect Z errors\n', 'normal'),
-                    ('• ', 'z_stab'), ('Z-Stabilizers', 'z_stab'), (' (purple) - Detect X errors\n\n', 'normal'),
-                    ('Parameters:\n', 'math'),
-                    ('• Distance d = 3 (corrects ⌊(d-1)/2⌋ = 1 error)\n', 'code'),
-                    ('• 9 data qubits arranged in 3×3 grid\n', 'code'),
-                    ('• 4 X-type + 4 Z-type stabilizer checks\n', 'code'),
-                    ('• 2 boundaries: rough (X) and smooth (Z)\n\n', 'code'),
-                    ('Threshold: ', 'warning'),
-                    ('~1% physical error rate!\n', 'normal'),
-                    ('Building d=3 patch now...', 'highlight'),
-                ],
-                'demo_action': 'build_d3'
-            },
-            {
-                'title': 'Single X Error',
-                'content': [
-                    ('X (Bit-Flip) Error Detection', 'title'),
-                    ('\n\n', 'normal'),
-                    ('An ', 'normal'),
-                    ('X error', 'highlight'),
-                    (' on a data qubit anti-commutes with adjacent ', 'normal'),
-                    ('Z-stabilizers', 'z_stab'),
-                    ('.\n\n', 'normal'),
-                    ('Detection Mechanism:\n', 'action'),
-                    ('• X error on qubit q\n', 'normal'),
-                    ('• Adjacent Z-stabilizers detect the flip\n', 'normal'),
-                    ('• Syndrome: stabilizer returns -1 (violated)\n\n', 'normal'),
-                    ('Visual:\n', 'surface'),
-                    ('• Error appears as ', 'normal'),
-                    ('black X', 'error'),
-                    (' on data qubit\n', 'normal'),
-                    ('• Neighboring Z-stabilizers turn ', 'normal'),
-                    ('yellow', 'correct'),
-                    (' (violated)\n\n', 'normal'),
-                    ('Formula: ', 'math'),
-                    ('X·Z = -Z·X (anti-commutation)\n\n', 'code'),
-                    ('Placing X error on center qubit...', 'warning'),
-                ],
-                'demo_action': 'single_x_error'
-            },
-            {
-                'title': 'Single Z Error',
-                'content': [
-                    ('Z (Phase-Flip) Error Detection', 'title'),
-                    ('\n\n', 'normal'),
-                    ('A ', 'normal'),
-                    ('Z error', 'highlight'),
-                    (' on a data qubit anti-commutes with adjacent ', 'normal'),
-                    ('X-stabilizers', 'x_stab'),
-                    ('.\n\n', 'normal'),
-                    ('Detection Mechanism:\n', 'action'),
-                    ('• Z error on qubit q\n', 'normal'),
-                    ('• Adjacent X-stabilizers detect the phase flip\n', 'normal'),
-                    ('• Syndrome: X-stabilizer returns -1\n\n', 'normal'),
-                    ('Visual:\n', 'surface'),
-                    ('• Error appears as ', 'normal'),
-                    ('black Z', 'error'),
-                    (' on data qubit\n', 'normal'),
-                    ('• Neighboring X-stabilizers turn ', 'normal'),
-                    ('yellow', 'correct'),
-                    (' (violated)\n\n', 'normal'),
-                    ('Key Insight:\n', 'math'),
-                    ('X-type checks detect Z-type errors (and vice versa)\n', 'code'),
-                    ('This is the CSS code structure!\n\n', 'normal'),
-                    ('Placing Z error...', 'warning'),
-                ],
-                'demo_action': 'single_z_error'
-            },
-            {
-                'title': 'Error Chain',
-                'content': [
-                    ('Error Chains and Logical Errors', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Multiple errors can form ', 'normal'),
-                    ('error chains', 'highlight'),
-                    (' across the lattice.\n\n', 'normal'),
-                    ('Chain Properties:\n', 'action'),
-                    ('• Interior errors: detected at both endpoints\n', 'normal'),
-                    ('• Boundary errors: detected only at interior end\n', 'normal'),
-                    ('• Chain connecting boundaries: LOGICAL ERROR!\n\n', 'normal'),
-                    ('Decoding Challenge:\n', 'surface'),
-                    ('• Syndrome only shows endpoints (violated checks)\n', 'normal'),
-                    ('• Must infer chain path from boundary conditions\n', 'normal'),
-                    ('• MWPM finds minimum-weight matching\n\n', 'normal'),
-                    ('Logical Error Condition:\n', 'warning'),
-                    ('Error chain spans ', 'normal'),
-                    ('rough → rough', 'x_stab'),
-                    (' or ', 'normal'),
-                    ('smooth → smooth', 'z_stab'),
-                    (' boundary\n\n', 'normal'),
-                    ('Building error chain demo...', 'highlight'),
-                ],
-                'demo_action': 'error_chain'
-            },
-            {
-                'title': 'Syndrome Highlight',
-                'content': [
-                    ('Using Syndrome Highlight', 'title'),
-                    ('\n\n', 'normal'),
-                    ('The ', 'normal'),
-                    ('yellow "Highlight Syndrome"', 'correct'),
-                    (' button shows violated stabilizers.\n\n', 'normal'),
-                    ('How It Works:\n', 'action'),
-                    ('1. Place errors on data qubits\n', 'normal'),
-                    ('2. Click "Highlight Syndrome" (yellow button)\n', 'normal'),
-                    ('3. Violated stabilizers turn yellow\n', 'normal'),
-                    ('4. Count violations to identify error location\n\n', 'normal'),
-                    ('Syndrome Analysis:\n', 'surface'),
-                    ('• 2 adjacent yellow Z-stabs → X error between them\n', 'code'),
-                    ('• 2 adjacent yellow X-stabs → Z error between them\n', 'code'),
-                    ('• 1 yellow at boundary → error on boundary qubit\n\n', 'code'),
-                    ('Try It:\n', 'warning'),
-                    ('After tutorial, place errors and click the button!\n', 'normal'),
-                    ('The syndrome pattern reveals error locations.\n\n', 'normal'),
-                    ('Demo: highlighting current errors...', 'highlight'),
-                ],
-                'demo_action': 'syndrome_demo'
-            },
-            {
-                'title': 'Surface Mode Buttons',
-                'content': [
-                    ('Surface Mode Operations', 'title'),
-                    ('\n\n', 'normal'),
-                    ('Surface mode has ', 'normal'),
-                    ('specialized QEC buttons', 'highlight'),
-                    (' in the sidebar:\n\n', 'normal'),
-                    ('Yellow QEC Buttons:\n', 'warning'),
-                    ('• ', 'correct'), ('Highlight Syndrome', 'correct'), (' - Shows violated stabilizers\n', 'normal'),
-                    ('• ', 'correct'), ('Run Decoder', 'correct'), (' - Runs MWPM matching algorithm\n', 'normal'),
-                    ('• ', 'correct'), ('Apply Correction', 'correct'), (' - Places recovery gates\n', 'normal'),
-                    ('• ', 'correct'), ('Clear Highlights', 'correct'), (' - Resets syndrome display\n\n', 'normal'),
-                    ('Errors Tab (Toolbox):\n', 'action'),
-                    ('• X Error - Bit-flip error (black)\n', 'normal'),
-                    ('• Z Error - Phase-flip error (black)\n', 'normal'),
-                    ('• Y Error - Combined X+Z error\n\n', 'normal'),
-                    ('Workflow:\n', 'surface'),
-                    ('1. Place errors from "Errors" toolbox tab\n', 'code'),
-                    ('2. Click "Highlight Syndrome"\n', 'code'),
-                    ('3. Click "Run Decoder" → "Apply Correction"\n', 'code'),
-                    ('4. Click "Clear Highlights" to reset\n\n', 'code'),
-                    ('Try the buttons now!', 'highlight'),
-                ],
-                'demo_action': 'buttons_demo'
-            },
-            {
-                'title': 'Full Correction Cycle',
-                'content': [
-                    ('Complete QEC Workflow', 'title'),
-                    ('\n\n', 'normal'),
-                    ('The full ', 'normal'),
-                    ('surface code QEC cycle', 'highlight'),
-                    (':\n\n', 'normal'),
-                    ('1. ', 'action'), ('Initialize', 'action'), (' - Prepare logical |0⟩ or |+⟩\n', 'normal'),
-                    ('2. ', 'action'), ('Gate Operations', 'action'), (' - Apply logical gates\n', 'normal'),
-                    ('3. ', 'action'), ('Error Occurs', 'error'), (' - Physical errors on data\n', 'normal'),
-                    ('4. ', 'action'), ('Syndrome Measure', 'correct'), (' - Extract stabilizer values\n', 'normal'),
-                    ('5. ', 'action'), ('Decode', 'surface'), (' - MWPM identifies error chain\n', 'normal'),
-                    ('6. ', 'action'), ('Correct', 'correct'), (' - Apply recovery operations\n', 'normal'),
-                    ('7. ', 'action'), ('Readout', 'action'), (' - Measure logical qubit\n\n', 'normal'),
-                    ('In This Demo:\n', 'warning'),
-                    ('• Error placed → syndrome highlighted → correction shown\n', 'code'),
-                    ('• Yellow marks show syndrome (detection)\n', 'code'),
-                    ('• Correction gate appears at error location\n\n', 'code'),
-                    ('Building full cycle demo...', 'highlight'),
-                ],
-                'demo_action': 'full_cycle'
-            },
-            {
-                'title': 'Tutorial Complete!',
-                'content': [
-                    ('🎉 ', 'normal'),
-                    ('Surface Code Tutorial Complete!', 'title'),
-                    ('\n\n', 'normal'),
-                    ('You have learned:\n\n', 'normal'),
-                    ('✓ ', 'action'), ('Code Anatomy', 'surface'), (' - Data, X/Z stabilizers\n', 'normal'),
-                    ('✓ ', 'action'), ('Error Detection', 'x_stab'), (' - Anti-commutation syndrome\n', 'normal'),
-                    ('✓ ', 'action'), ('Error Chains', 'error'), (' - Multi-qubit patterns\n', 'normal'),
-                    ('✓ ', 'action'), ('Syndrome Analysis', 'correct'), (' - Yellow highlight tool\n', 'normal'),
-                    ('✓ ', 'action'), ('QEC Cycle', 'highlight'), (' - Full correction workflow\n\n', 'normal'),
-                    ('Now Try:\n', 'warning'),
-                    ('• Place errors using "Errors" toolbox tab\n', 'normal'),
-                    ('• Click yellow "Highlight Syndrome" button\n', 'normal'),
-                    ('• Observe which stabilizers are violated\n', 'normal'),
-                    ('• Click "Apply Decoder" to see corrections\n\n', 'normal'),
-                    ('For LDPC codes, switch to LDPC mode (B key).\n', 'math'),
-                    ('For circuit diagrams, switch to Circuit mode (C key).\n\n', 'normal'),
-                    ('Happy quantum error correcting!', 'highlight'),
-                ],
-                'demo_action': 'complete'
-            },
-        ]
+    @classmethod
+    def _get_steps(cls) -> List[Dict[str, Any]]:
+        """Return the compiled tutorial steps, building them on first use."""
+        if cls._steps_cache is None:
+            cls._steps_cache = compile_tutorial_steps(cls._create_tutorial_steps())
+        return cls._steps_cache
+    
+    @classmethod
+    def _create_tutorial_steps(cls) -> List[Dict[str, Any]]:
+        """Load surface code tutorial with visual QEC demos."""
+        return load_tutorial_steps('SurfaceCodeTutorial')
     
     def show(self):
         """Display the surface code tutorial window."""
@@ -3169,8 +2407,7 @@ class SurfaceCodeTutorial:
         
         # Position on left side
         self.tutorial_window.update_idletasks()
-        screen_width = self.tutorial_window.winfo_screenwidth()
-        screen_height = self.tutorial_window.winfo_screenheight()
+        screen_width, screen_height = screen_dims(self.parent)
         
         win_width = 480
         win_height = 480
@@ -3260,9 +2497,7 @@ class SurfaceCodeTutorial:
         self.content_text.config(yscrollcommand=scrollbar.set)
         
         # Configure text tags
-        for tag_name, color in self.COLORS.items():
-            self.content_text.tag_configure(tag_name, foreground=color)
-        self.content_text.tag_configure('normal', foreground='#cccccc')
+        configure_text_tags(self.content_text, self.COLORS)
         
         self._update_display()
         self.tutorial_window.protocol("WM_DELETE_WINDOW", self._close_tutorial)
@@ -3280,8 +2515,7 @@ class SurfaceCodeTutorial:
         self.content_text.config(state='normal')
         self.content_text.delete('1.0', tk.END)
         
-        for text, tag in step['content']:
-            self.content_text.insert(tk.END, text, tag)
+        self.content_text.insert(tk.END, *step['content'])
         
         self.content_text.config(state='disabled')
         
@@ -3539,16 +2773,19 @@ class SurfaceCodeTutorial:
         self.tutorial_window.destroy()
 
 
-# Import shared types from package modules (avoiding duplication)
-from qldpc.components import ViewMode, ComponentType, Component3D
-from qldpc.config import COMPONENT_COLORS, LDPC_COLORS, ColorPalette
-from qldpc.processor import QuantumLDPCProcessor
-from qldpc.builder.renderers.isometric import IsometricRenderer
-
-
 # ==================== COMMAND PATTERN FOR UNDO/REDO ====================
 # Lightweight implementation integrated into the main file
 
+def _index_of(components: List[Component3D], component: Component3D) -> int:
+    """Position of this very component object in components, or -1.
+    
+    Matches by identity: list.index/in/remove fall back to the dataclass
+    field-by-field __eq__ for every other element, which is slower and could
+    match a different but equal component.
+    """
+    return next((i for i, c in enumerate(components) if c is component), -1)
+
+
 class Command:
     """Base class for undoable commands."""
     def execute(self): raise NotImplementedError
@@ -3562,12 +2799,13 @@ class PlaceComponentCommand(Command):
         self.component = component
     
     def execute(self):
-        if self.component not in self.builder.components:
+        if _index_of(self.builder.components, self.component) < 0:
             self.builder.components.append(self.component)
     
     def undo(self):
-        if self.component in self.builder.components:
-            self.builder.components.remove(self.component)
+        index = _index_of(self.builder.components, self.component)
+        if index >= 0:
+            del self.builder.components[index]
 
 
 class DeleteComponentCommand(Command):
@@ -3578,9 +2816,9 @@ class DeleteComponentCommand(Command):
         self.index = -1
     
     def execute(self):
-        if self.component in self.builder.components:
-            self.index = self.builder.components.index(self.component)
-            self.builder.components.remove(self.component)
+        self.index = _index_of(self.builder.components, self.component)
+        if self.index >= 0:
+            del self.builder.components[self.index]
     
     def undo(self):
         if self.index >= 0:
@@ -3656,6 +2894,40 @@ class CircuitBuilder3D:
     the rendering system and quantum computation backend.
     """
     
+    # Legend icon geometry as flat (x, y, ...) offsets from the icon centre
+    _BBOX_OFFSETS = (-12, -12, 12, 12)
+    _DIAMOND_OFFSETS = (0, -12, 12, 0, 0, 12, -12, 0)
+    _CROSS_OFFSETS_A = (-6, -6, 6, 6)
+    _CROSS_OFFSETS_B = (-6, 6, 6, -6)
+    _PLUS_OFFSETS_H = (-6, 0, 6, 0)
+    _PLUS_OFFSETS_V = (0, -6, 0, 6)
+    _DOT_LEFT_OFFSETS = (-8, -6, -4, 6)
+    _DOT_RIGHT_OFFSETS = (4, -6, 8, 6)
+    _DOT_LINK_OFFSETS = (-4, 0, 4, 0)
+    _NEEDLE_OFFSETS = (0, 0, 6, -8)
+    _BOUNDARY_OFFSETS = (-12, 0, 12, 0)
+    _BOUNDARY_CAP_LEFT_OFFSETS = (-12, -4, -12, 4)
+    _BOUNDARY_CAP_RIGHT_OFFSETS = (12, -4, 12, 4)
+    
+    # White overlay marks drawn on top of legend icons, as line segments
+    _OVERLAY_SEGMENTS = {
+        'plus': (_PLUS_OFFSETS_H, _PLUS_OFFSETS_V),
+        'cross': (_CROSS_OFFSETS_A, _CROSS_OFFSETS_B),
+    }
+    _OVERLAY_SIZE = 16  # Overlay image width/height in pixels
+    
+    # Shared legend item options (fill colour is added per icon where it varies)
+    _LEGEND_SHAPE_KW = {'outline': '#444', 'width': 2}
+    _LEGEND_MARK_KW = {'fill': '#ffffff', 'width': 2}
+    _LEGEND_LABEL_KW = {'fill': '#ffffff', 'font': ('Arial', 10, 'bold')}
+    _LEGEND_ERROR_LABEL_KW = {'fill': '#ffffff', 'font': ('Arial', 9, 'bold')}
+    _LEGEND_ERROR_LABEL_DARK_KW = {'fill': '#000000', 'font': ('Arial', 9, 'bold')}  # On yellow
+    
+    # Polygon legend icons: component type -> flat vertex offset template
+    _POLY_TEMPLATES = {
+        ComponentType.PARITY_CHECK: _DIAMOND_OFFSETS,
+    }
+    
     def __init__(self):
         """Initialize the circuit builder application."""
         self.root = self._setup_gui()
@@ -3689,12 +2961,39 @@ class CircuitBuilder3D:
         self._dirty_components: set = set()  # Components needing redraw
         self._full_redraw_needed: bool = True  # Force full redraw on first draw
         self._component_canvas_items: dict = {}  # Map component -> canvas item IDs
+        self._redraw_scheduled: bool = False  # An idle-time _redraw_circuit is pending
+        self._log_buffer: List[str] = []  # Status lines not yet written to status_text
+        # Isometric view: draw signature per component id currently on the canvas,
+        # and the (scale, offset) the canvas items were projected with
+        self._drawn_signatures: Dict[int, tuple] = {}
+        self._drawn_view: Optional[Tuple[float, float, float]] = None
+        # Last painter's-order ordering of self.components, re-sorted in place
+        self._depth_order: List[Component3D] = []
+        
+        # Legend icon coordinates keyed by (offsets, cx, cy); legend layout is static
+        self._legend_coord_cache: Dict[Tuple, Tuple[float, ...]] = {}
+        self._legend_pending_icons: List[Tuple[tk.Frame, Any]] = []  # (row, draw) not yet visible
+        self._overlay_images: Dict[str, Any] = {}  # Overlay name -> PhotoImage (kept alive here)
+        self.legend_window = None
+        self._legend_view_mode = None  # View mode the legend window was built for
         
         # Drag and drop state
         self.dragging = False
         self.drag_start_x = 0
         self.drag_start_y = 0
         self.drag_component = None
+        # Cells held by other components while dragging; nothing else moves mid-drag
+        self._drag_occupied: Dict[Tuple[int, int], Component3D] = {}
+        
+        # Component context menu, built on first use and shared by every component;
+        # its fixed entries act on _context_target
+        self._context_menu: Optional[tk.Menu] = None
+        self._context_target: Optional[Component3D] = None
+        self._context_has_control = False  # Menu starts with a control entry + separator
+        # Component properties dialog, built on first use and withdrawn when closed
+        self._props_window: Optional[tk.Toplevel] = None
+        self._props_labels: Dict[str, ttk.Label] = {}  # Fixed field -> its label
+        self._props_custom_frame: Optional[ttk.Frame] = None  # Per-component properties
         
         # Grid panning state
         self.panning = False
@@ -4562,7 +3861,7 @@ class CircuitBuilder3D:
         """Undo the last action."""
         if self.command_history.undo():
             self._log_status("↶ Undo")
-            self._redraw_circuit()
+            self._schedule_redraw()
         else:
             self._log_status("Nothing to undo")
     
@@ -4570,7 +3869,7 @@ class CircuitBuilder3D:
         """Redo the last undone action."""
         if self.command_history.redo():
             self._log_status("↷ Redo")
-            self._redraw_circuit()
+            self._schedule_redraw()
         else:
             self._log_status("Nothing to redo")
         # Zoom keybindings
@@ -4615,7 +3914,7 @@ class CircuitBuilder3D:
         self._update_mode_indicator()
         
         # Refresh legend window if it's open
-        if hasattr(self, 'legend_window') and self.legend_window and self.legend_window.winfo_exists():
+        if self._legend_is_shown():
             self.legend_window.destroy()
             self._show_legend()
     
@@ -4669,7 +3968,7 @@ class CircuitBuilder3D:
         self._update_mode_indicator()
         
         # Refresh legend window if it's open
-        if hasattr(self, 'legend_window') and self.legend_window and self.legend_window.winfo_exists():
+        if self._legend_is_shown():
             self.legend_window.destroy()
             self._show_legend()
     
@@ -4712,7 +4011,7 @@ class CircuitBuilder3D:
         self._redraw_circuit()
         self._update_mode_indicator()
         
-        if hasattr(self, 'legend_window') and self.legend_window and self.legend_window.winfo_exists():
+        if self._legend_is_shown():
             self.legend_window.destroy()
             self._show_legend()
     
@@ -4729,6 +4028,8 @@ class CircuitBuilder3D:
             self._draw_ldpc_physical_lattice()
         else:
             self._draw_isometric_grid()
+            # Component items may survive a redraw, so keep the grid beneath them
+            self.canvas.tag_lower("grid")
     
     def _draw_isometric_grid(self):
         """Draw the isometric grid for circuit mode."""
@@ -4738,21 +4039,10 @@ class CircuitBuilder3D:
         grid_range = self.grid_size // 2  # Use configurable grid size
         grid_z = -0.05  # Draw grid slightly below z=0 so cubes sit on top
         
-        for i in range(-grid_range, grid_range + 1):
-            for j in range(-grid_range, grid_range + 1):
-                x1, y1 = self.renderer.project_3d_to_2d(i, j, grid_z)
-                x2, y2 = self.renderer.project_3d_to_2d(i + 1, j, grid_z)
-                x3, y3 = self.renderer.project_3d_to_2d(i, j + 1, grid_z)
-                
-                # Use boundary color for edge lines
-                is_boundary = (i == -grid_range or i == grid_range or 
-                              j == -grid_range or j == grid_range)
-                color = boundary_color if is_boundary else grid_color
-                
-                if i < grid_range:  # Don't draw beyond the boundary
-                    self.canvas.create_line(x1, y1, x2, y2, fill=color, tags="grid")
-                if j < grid_range:  # Don't draw beyond the boundary
-                    self.canvas.create_line(x1, y1, x3, y3, fill=color, tags="grid")
+        # One line per straight run of cell edges rather than one per cell edge
+        for coords, is_boundary in self.renderer.grid_lines(grid_range, grid_z):
+            color = boundary_color if is_boundary else grid_color
+            self.canvas.create_line(*coords, fill=color, tags="grid")
     
     def _draw_surface_code_lattice(self):
         """Draw the rotated surface code lattice with node-link visualization.
@@ -5857,6 +5147,9 @@ class CircuitBuilder3D:
             self.drag_start_x = event.x
             self.drag_start_y = event.y
             self.drag_component = clicked_component
+            self._drag_occupied = {
+                c.position[:2]: c for c in self.components if c is not clicked_component
+            }
         else:
             # Place new component
             self._place_component(grid_x, grid_y, 0)
@@ -6166,20 +5459,28 @@ class CircuitBuilder3D:
                 return  # Don't allow dragging outside grid
             
             # Check if new position is occupied by another component
-            existing_component = self._get_component_at_position(grid_x, grid_y)
-            if existing_component and existing_component != self.drag_component:
+            if (grid_x, grid_y) in self._drag_occupied:
                 return  # Don't allow stacking components
             
             # Update component position
             old_pos = self.drag_component.position
-            self.drag_component.position = (grid_x, grid_y, old_pos[2])
+            new_pos = (grid_x, grid_y, old_pos[2])
+            if new_pos == old_pos:
+                return  # Still inside the same cell
             
-            self._redraw_circuit()
+            drawn_as_is = self._is_drawn_as_is(self.drag_component)
+            self.drag_component.position = new_pos
+            
+            if drawn_as_is and not self._has_absolute_lanes(self.drag_component):
+                self._move_drawn_component(self.drag_component, old_pos)
+            else:
+                self._redraw_circuit()
     
     def _on_canvas_release(self, event):
         """Handle canvas button release events."""
         self.dragging = False
         self.drag_component = None
+        self._drag_occupied = {}
     
     def _on_right_click(self, event):
         """Handle right-click context menu."""
@@ -6202,12 +5503,24 @@ class CircuitBuilder3D:
             dy = event.y - self.pan_start_y
             
             # Update renderer offset
+            old_view = (self.renderer.scale, self.renderer.offset_x, self.renderer.offset_y)
             self.renderer.offset_x += dx
             self.renderer.offset_y += dy
             
-            # Redraw grid and components
-            self._draw_grid()
-            self._redraw_circuit()
+            if self.view_mode == ViewMode.ISOMETRIC_3D:
+                # Panning is a pure translation: shift the existing items in Tk
+                # rather than re-projecting and recreating them
+                self.canvas.move("grid", dx, dy)
+                self.canvas.move("component", dx, dy)
+                self.canvas.move("selection", dx, dy)
+                if self._drawn_view == old_view:
+                    self._drawn_view = (self.renderer.scale, self.renderer.offset_x, self.renderer.offset_y)
+                else:
+                    self._redraw_circuit()
+            else:
+                # Redraw grid and components
+                self._draw_grid()
+                self._redraw_circuit()
             
             # Update pan start position
             self.pan_start_x = event.x
@@ -6233,11 +5546,8 @@ class CircuitBuilder3D:
     
     def _get_component_at_position(self, grid_x: int, grid_y: int) -> Optional[Component3D]:
         """Get component at specified grid position."""
-        for component in self.components:
-            comp_x, comp_y, comp_z = component.position
-            if comp_x == grid_x and comp_y == grid_y:
-                return component
-        return None
+        cell = (grid_x, grid_y)
+        return next((c for c in self.components if c.position[:2] == cell), None)
     
     def _place_component(self, grid_x: int, grid_y: int, grid_z: int):
         """Place a new component at the specified grid position."""
@@ -6257,8 +5567,7 @@ class CircuitBuilder3D:
             return
         
         # Determine if this is a two-qubit gate (spans 2 lanes)
-        two_qubit_types = [ComponentType.CNOT_GATE, ComponentType.CZ_GATE, ComponentType.SWAP_GATE]
-        is_two_qubit = self.current_tool in two_qubit_types
+        is_two_qubit = self.current_tool in _TWO_QUBIT_TYPES
         
         # Two-qubit gates: placed at control lane (Option A), extend to target lane
         # Control is at grid_y, target is at grid_y + 1
@@ -6301,64 +5610,65 @@ class CircuitBuilder3D:
         self._log_status(f"Placed {self.current_tool.value} at ({grid_x}, {grid_y}, {grid_z})")
         self._redraw_circuit()
     
+    # Component colors by type, built once at class creation
+    _COLOR_BY_TYPE: Dict[ComponentType, Tuple[float, float, float]] = {
+        # Single qubit gates - DISTINCT colors for easy identification
+        ComponentType.X_GATE: (0.95, 0.3, 0.3),    # Red - bit flip
+        ComponentType.Z_GATE: (0.2, 0.5, 0.9),     # Blue - phase flip
+        ComponentType.Y_GATE: (0.7, 0.3, 0.8),     # Purple - combined
+        ComponentType.H_GATE: (1.0, 0.85, 0.2),    # Gold/Yellow - superposition
+        ComponentType.S_GATE: (0.2, 0.75, 0.6),    # Teal - phase
+        ComponentType.T_GATE: (0.95, 0.55, 0.2),   # Orange - T gate
+        
+        # Two qubit gates - distinct purple/magenta shades
+        ComponentType.CNOT_GATE: (0.8, 0.2, 0.6),  # Magenta
+        ComponentType.CZ_GATE: (0.5, 0.2, 0.8),    # Purple
+        ComponentType.SWAP_GATE: (0.9, 0.4, 0.7),  # Pink
+        
+        # LDPC components (circuit mode) - distinct green/orange shades
+        ComponentType.PARITY_CHECK: (0.9, 0.5, 0.1),   # Orange
+        ComponentType.DATA_QUBIT: (0.2, 0.9, 0.3),     # Bright green
+        ComponentType.ANCILLA_QUBIT: (0.6, 0.8, 0.1),  # Yellow-green
+        
+        # Measurement - distinct red shades
+        ComponentType.MEASURE: (0.9, 0.1, 0.1),    # Bright red
+        ComponentType.RESET: (0.7, 0.3, 0.2),      # Dark red
+        
+        # Circuit mode errors - BLACK for visibility
+        ComponentType.CIRCUIT_X_ERROR: (0.15, 0.15, 0.15),   # Near black
+        ComponentType.CIRCUIT_Z_ERROR: (0.15, 0.15, 0.15),   # Near black
+        ComponentType.CIRCUIT_Y_ERROR: (0.15, 0.15, 0.15),   # Near black
+        ComponentType.CIRCUIT_CORRECTION: (1.0, 0.85, 0.2),  # Yellow
+        
+        # Surface code components - matching app's burgundy theme with clear distinction
+        # Data qubits: Light cyan/teal (clearly different from stabilizers)
+        ComponentType.SURFACE_DATA: (0.4, 0.8, 0.9),          # Cyan (#66ccdd)
+        # X-stabilizers: Burgundy/red (matches background hints at (i+j) % 2 == 0 cells)
+        ComponentType.SURFACE_X_STABILIZER: (0.91, 0.27, 0.38), # Burgundy (#e94560)
+        # Z-stabilizers: Deep purple (matches background hints at (i+j) % 2 == 1 cells)
+        ComponentType.SURFACE_Z_STABILIZER: (0.42, 0.18, 0.36), # Purple (#6b2d5c)
+        # Boundary: Orange for visibility
+        ComponentType.SURFACE_BOUNDARY: (0.9, 0.6, 0.2),      # Orange
+        # Error markers: Distinct bright colors
+        ComponentType.SURFACE_X_ERROR: (1.0, 0.2, 0.2),       # Bright red
+        ComponentType.SURFACE_Z_ERROR: (0.2, 0.2, 1.0),       # Bright blue
+        ComponentType.SURFACE_Y_ERROR: (0.9, 0.9, 0.1),       # Bright yellow
+        
+        # LDPC specific components (Tanner graph and physical layout)
+        # Using cohesive color palette based on color theory
+        ComponentType.LDPC_DATA_QUBIT: (0.18, 0.77, 0.71),    # Teal #2EC4B6
+        ComponentType.LDPC_X_CHECK: (1.0, 0.42, 0.42),        # Coral #FF6B6B
+        ComponentType.LDPC_Z_CHECK: (1.0, 0.85, 0.24),        # Gold #FFD93D
+        ComponentType.LDPC_ANCILLA: (0.61, 0.37, 0.90),       # Lavender #9B5DE5
+        ComponentType.LDPC_X_ANCILLA: (0.88, 0.48, 0.37),     # Terracotta #E07A5F
+        ComponentType.LDPC_Z_ANCILLA: (0.51, 0.70, 0.60),     # Sage #81B29A
+        ComponentType.LDPC_EDGE: (0.42, 0.45, 0.50),          # Slate #6B7280
+        ComponentType.LDPC_CAVITY_BUS: (0.24, 0.35, 0.50),    # Navy #3D5A80
+    }
+    
     def _get_component_color(self, component_type: ComponentType) -> Tuple[float, float, float]:
         """Get color for component type."""
-        color_map = {
-            # Single qubit gates - DISTINCT colors for easy identification
-            ComponentType.X_GATE: (0.95, 0.3, 0.3),    # Red - bit flip
-            ComponentType.Z_GATE: (0.2, 0.5, 0.9),     # Blue - phase flip
-            ComponentType.Y_GATE: (0.7, 0.3, 0.8),     # Purple - combined
-            ComponentType.H_GATE: (1.0, 0.85, 0.2),    # Gold/Yellow - superposition
-            ComponentType.S_GATE: (0.2, 0.75, 0.6),    # Teal - phase
-            ComponentType.T_GATE: (0.95, 0.55, 0.2),   # Orange - T gate
-            
-            # Two qubit gates - distinct purple/magenta shades
-            ComponentType.CNOT_GATE: (0.8, 0.2, 0.6),  # Magenta
-            ComponentType.CZ_GATE: (0.5, 0.2, 0.8),    # Purple
-            ComponentType.SWAP_GATE: (0.9, 0.4, 0.7),  # Pink
-            
-            # LDPC components (circuit mode) - distinct green/orange shades
-            ComponentType.PARITY_CHECK: (0.9, 0.5, 0.1),   # Orange
-            ComponentType.DATA_QUBIT: (0.2, 0.9, 0.3),     # Bright green
-            ComponentType.ANCILLA_QUBIT: (0.6, 0.8, 0.1),  # Yellow-green
-            
-            # Measurement - distinct red shades
-            ComponentType.MEASURE: (0.9, 0.1, 0.1),    # Bright red
-            ComponentType.RESET: (0.7, 0.3, 0.2),      # Dark red
-            
-            # Circuit mode errors - BLACK for visibility
-            ComponentType.CIRCUIT_X_ERROR: (0.15, 0.15, 0.15),   # Near black
-            ComponentType.CIRCUIT_Z_ERROR: (0.15, 0.15, 0.15),   # Near black
-            ComponentType.CIRCUIT_Y_ERROR: (0.15, 0.15, 0.15),   # Near black
-            ComponentType.CIRCUIT_CORRECTION: (1.0, 0.85, 0.2),  # Yellow
-            
-            # Surface code components - matching app's burgundy theme with clear distinction
-            # Data qubits: Light cyan/teal (clearly different from stabilizers)
-            ComponentType.SURFACE_DATA: (0.4, 0.8, 0.9),          # Cyan (#66ccdd)
-            # X-stabilizers: Burgundy/red (matches background hints at (i+j) % 2 == 0 cells)
-            ComponentType.SURFACE_X_STABILIZER: (0.91, 0.27, 0.38), # Burgundy (#e94560)
-            # Z-stabilizers: Deep purple (matches background hints at (i+j) % 2 == 1 cells)
-            ComponentType.SURFACE_Z_STABILIZER: (0.42, 0.18, 0.36), # Purple (#6b2d5c)
-            # Boundary: Orange for visibility
-            ComponentType.SURFACE_BOUNDARY: (0.9, 0.6, 0.2),      # Orange
-            # Error markers: Distinct bright colors
-            ComponentType.SURFACE_X_ERROR: (1.0, 0.2, 0.2),       # Bright red
-            ComponentType.SURFACE_Z_ERROR: (0.2, 0.2, 1.0),       # Bright blue
-            ComponentType.SURFACE_Y_ERROR: (0.9, 0.9, 0.1),       # Bright yellow
-            
-            # LDPC specific components (Tanner graph and physical layout)
-            # Using cohesive color palette based on color theory
-            ComponentType.LDPC_DATA_QUBIT: (0.18, 0.77, 0.71),    # Teal #2EC4B6
-            ComponentType.LDPC_X_CHECK: (1.0, 0.42, 0.42),        # Coral #FF6B6B
-            ComponentType.LDPC_Z_CHECK: (1.0, 0.85, 0.24),        # Gold #FFD93D
-            ComponentType.LDPC_ANCILLA: (0.61, 0.37, 0.90),       # Lavender #9B5DE5
-            ComponentType.LDPC_X_ANCILLA: (0.88, 0.48, 0.37),     # Terracotta #E07A5F
-            ComponentType.LDPC_Z_ANCILLA: (0.51, 0.70, 0.60),     # Sage #81B29A
-            ComponentType.LDPC_EDGE: (0.42, 0.45, 0.50),          # Slate #6B7280
-            ComponentType.LDPC_CAVITY_BUS: (0.24, 0.35, 0.50),    # Navy #3D5A80
-        }
-        
-        return color_map.get(component_type, (0.5, 0.5, 0.5))
+        return self._COLOR_BY_TYPE.get(component_type, (0.5, 0.5, 0.5))
     
     def _mark_dirty(self, component: Component3D = None) -> None:
         """Mark a component as needing redraw, or request full redraw.
@@ -6381,182 +5691,307 @@ class CircuitBuilder3D:
         return self._full_redraw_needed or id(component) in self._dirty_components
     
     def _redraw_circuit(self) -> None:
-        """Redraw the circuit with optimized dirty-region tracking.
+        """Bring the canvas in line with self.components.
         
-        Uses dirty-region tracking (#18) to only redraw components that
-        have changed, improving performance for large circuits.
+        In the isometric view only components whose draw signature changed
+        since the last redraw are deleted and drawn again; the rest keep their
+        canvas items. Zooming or panning invalidates everything.
         """
-        # For now, we do full redraws but the infrastructure supports selective updates
-        # Full implementation would track canvas item IDs per component
-        
-        # Clear previous components
-        self.canvas.delete("component")
-        self.canvas.delete("selection")  # Clear selection highlight
-        
         # Handle surface code mode differently
         if self.view_mode == ViewMode.SURFACE_CODE_2D:
+            self._clear_drawn_components()
             self._redraw_surface_components()
             return
         
         # Handle LDPC modes
         if self.view_mode in [ViewMode.LDPC_TANNER, ViewMode.LDPC_PHYSICAL]:
+            self._clear_drawn_components()
             self._draw_placed_ldpc_components()
             return
         
+        view = (self.renderer.scale, self.renderer.offset_x, self.renderer.offset_y)
+        if view != self._drawn_view:
+            self._clear_drawn_components()
+            self._drawn_view = view
+        
         # Sort components by depth for proper rendering (Painter's Algorithm)
-        sorted_components = sorted(
-            self.components, 
-            key=lambda c: (c.position[0] + c.position[1], c.position[2])
-        )
+        sorted_components = self._depth_ordered()
         
-        # Draw all components from back to front
+        previous = self._drawn_signatures
+        current: Dict[int, tuple] = {}
+        stale = []
         for component in sorted_components:
-            x, y, z = component.position
-            w, h, d = component.size
-            
-            # Draw the component cube
-            items = self.renderer.draw_cube(x, y, z, w, h, d, component.color)
-            
-            # Tag items for deletion and selection
-            for item in items:
-                self.canvas.addtag_withtag("component", item)
-            
-            # Draw control/target symbols for two-qubit gates (● for control, ⊕ for target)
-            two_qubit_types = [ComponentType.CNOT_GATE, ComponentType.CZ_GATE, ComponentType.SWAP_GATE]
-            controlled_gate_types = getattr(self, 'CONTROLLED_GATE_TYPES', [])
+            signature = self._draw_signature(component)
+            current[id(component)] = signature
+            if previous.get(id(component)) != signature:
+                stale.append(component)
+        
+        # Remove components that are gone or changed
+        for comp_id in previous.keys() - current.keys():
+            self.canvas.delete(f"comp_{comp_id}")
+        for component in stale:
+            if id(component) in previous:
+                self.canvas.delete(self._component_tag(component))
+        self._drawn_signatures = current
+        if not stale:
+            return
+        
+        # Project the cubes to draw in one batch
+        boxes = np.array([(*c.position, *c.size) for c in stale], dtype=float)
+        cube_faces = self.renderer.project_cube_faces(boxes).tolist()
+        
+        # Draw back to front, so stale components stack correctly among themselves
+        for component, faces in zip(stale, cube_faces):
+            self._draw_component(component, faces)
             
-            if component.component_type in two_qubit_types:
-                control_y = component.properties.get('control', y)
-                target_y = component.properties.get('target', y + 1)
-                
+            # Draw selection highlight for selected component (#4)
+            if component is self.selected_component:
+                self._draw_selection_highlight(component)
+                self.canvas.addtag_withtag(self._component_tag(component), "selection")
+        
+        if len(stale) == len(sorted_components):
+            return
+        
+        # Walking front to back, slot each redrawn component below the one in
+        # front of it; redrawn components in front of every kept one are
+        # already in place
+        stale_ids = {id(c) for c in stale}
+        kept_in_front = False
+        in_front = None
+        for component in reversed(sorted_components):
+            if id(component) not in stale_ids:
+                kept_in_front = True
+            elif kept_in_front:
+                self.canvas.tag_lower(self._component_tag(component),
+                                      self._component_tag(in_front))
+            in_front = component
+    
+    def _is_drawn_as_is(self, component: Component3D) -> bool:
+        """Whether the isometric canvas items of component match its current state."""
+        view = (self.renderer.scale, self.renderer.offset_x, self.renderer.offset_y)
+        return (self.view_mode == ViewMode.ISOMETRIC_3D and view == self._drawn_view and
+                self._drawn_signatures.get(id(component)) == self._draw_signature(component))
+    
+    @staticmethod
+    def _has_absolute_lanes(component: Component3D) -> bool:
+        """Whether some of the component's symbols sit on fixed lanes rather than follow it."""
+        props = component.properties
+        return 'control' in props or 'target' in props or 'control_y' in props
+    
+    def _move_drawn_component(self, component: Component3D, old_position: Tuple[int, int, int]) -> None:
+        """Translate an already drawn component's items to its new position and restack it.
+        
+        Only valid when every item of the component is drawn relative to its
+        position (see _has_absolute_lanes) and nothing else about it changed.
+        """
+        old_x, old_y = self.renderer.project_3d_to_2d(*old_position)
+        new_x, new_y = self.renderer.project_3d_to_2d(*component.position)
+        tag = self._component_tag(component)
+        self.canvas.move(tag, new_x - old_x, new_y - old_y)
+        self._drawn_signatures[id(component)] = self._draw_signature(component)
+        
+        # Restack at the component's new painter's-order slot
+        ordered = self._depth_ordered()
+        index = next(i for i, c in enumerate(ordered) if c is component)
+        if index + 1 < len(ordered):
+            self.canvas.tag_lower(tag, self._component_tag(ordered[index + 1]))
+        elif index > 0:
+            self.canvas.tag_raise(tag, self._component_tag(ordered[index - 1]))
+    
+    def _clear_drawn_components(self) -> None:
+        """Delete every component item and forget what the isometric view drew."""
+        self.canvas.delete("component")
+        self.canvas.delete("selection")
+        self._drawn_signatures = {}
+        self._drawn_view = None
+    
+    def _draw_signature(self, component: Component3D) -> tuple:
+        """Everything _draw_component reads, so equal signatures draw identically."""
+        return (component.component_type, component.position, component.size,
+                component.color, component.rotation, dict(component.properties),
+                component is self.selected_component)
+    
+    def _schedule_redraw(self) -> None:
+        """Coalesce redraw requests into one _redraw_circuit on the next idle tick."""
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.canvas.after_idle(self._do_scheduled_redraw)
+    
+    def _do_scheduled_redraw(self) -> None:
+        """Run the redraw queued by _schedule_redraw."""
+        self._redraw_scheduled = False
+        self._redraw_circuit()
+    
+    def _depth_ordered(self) -> List[Component3D]:
+        """self.components in painter's order.
+        
+        The previous ordering is kept and re-sorted in place: between redraws
+        only a few components move, and the sort is close to linear on a list
+        that is already nearly in order.
+        """
+        ordered = self._depth_order
+        current = {id(c) for c in self.components}
+        if len(ordered) != len(current) or any(id(c) not in current for c in ordered):
+            ordered = [c for c in ordered if id(c) in current]
+            known = {id(c) for c in ordered}
+            ordered.extend(c for c in self.components if id(c) not in known)
+            self._depth_order = ordered
+        ordered.sort(key=self._depth_key)
+        return ordered
+    
+    @staticmethod
+    def _depth_key(component: Component3D) -> Tuple[float, float]:
+        """Painter's-algorithm sort key: back-to-front along x+y, then bottom-up in z."""
+        return (component.position[0] + component.position[1], component.position[2])
+    
+    @staticmethod
+    def _component_tag(component: Component3D) -> str:
+        """Canvas tag shared by every item drawn for one component."""
+        return f"comp_{id(component)}"
+    
+    def _draw_component(self, component: Component3D, faces: List[List[float]] = None) -> None:
+        """Draw a single circuit-mode component (cube, gate symbols, label).
+        
+        Args:
+            component: Component to draw
+            faces: Cube face coordinates from renderer.project_cube_faces, if batched
+        """
+        tags = ("component", self._component_tag(component))
+        x, y, z = component.position
+        w, h, d = component.size
+        
+        # Draw the component cube
+        items = self.renderer.draw_cube(x, y, z, w, h, d, component.color, faces=faces)
+        
+        # Tag items for deletion and selection
+        for item in items:
+            self.canvas.itemconfigure(item, tags=tags)
+        
+        # Draw control/target symbols for two-qubit gates (● for control, ⊕ for target)
+        controlled_gate_types = getattr(self, 'CONTROLLED_GATE_TYPES', [])
+        
+        if component.component_type in _TWO_QUBIT_TYPES:
+            control_y = component.properties.get('control', y)
+            target_y = component.properties.get('target', y + 1)
+            
+            # Control position (●)
+            ctrl_x, ctrl_y_2d = self.renderer.project_3d_to_2d(x + w/2, control_y + 0.5, z + h/2)
+            # Target position (⊕)
+            tgt_x, tgt_y_2d = self.renderer.project_3d_to_2d(x + w/2, target_y + 0.5, z + h/2)
+            
+            # Draw connecting line
+            self.canvas.create_line(ctrl_x, ctrl_y_2d, tgt_x, tgt_y_2d,
+                                   fill="#ffffff", width=2, tags=tags)
+            
+            # Draw control dot (●) - filled circle
+            dot_radius = 6
+            self.canvas.create_oval(ctrl_x - dot_radius, ctrl_y_2d - dot_radius,
+                                   ctrl_x + dot_radius, ctrl_y_2d + dot_radius,
+                                   fill="#ffffff", outline="#000000", width=1, tags=tags)
+            
+            # Draw target symbol based on gate type
+            if component.component_type == ComponentType.CNOT_GATE:
+                # CNOT target: ⊕ (circle with plus)
+                target_radius = 10
+                self.canvas.create_oval(tgt_x - target_radius, tgt_y_2d - target_radius,
+                                       tgt_x + target_radius, tgt_y_2d + target_radius,
+                                       fill="", outline="#ffffff", width=2, tags=tags)
+                # Plus inside
+                self.canvas.create_line(tgt_x - target_radius + 2, tgt_y_2d,
+                                       tgt_x + target_radius - 2, tgt_y_2d,
+                                       fill="#ffffff", width=2, tags=tags)
+                self.canvas.create_line(tgt_x, tgt_y_2d - target_radius + 2,
+                                       tgt_x, tgt_y_2d + target_radius - 2,
+                                       fill="#ffffff", width=2, tags=tags)
+            elif component.component_type == ComponentType.CZ_GATE:
+                # CZ: both controls (● ●)
+                self.canvas.create_oval(tgt_x - dot_radius, tgt_y_2d - dot_radius,
+                                       tgt_x + dot_radius, tgt_y_2d + dot_radius,
+                                       fill="#ffffff", outline="#000000", width=1, tags=tags)
+            elif component.component_type == ComponentType.SWAP_GATE:
+                # SWAP: × at both positions
+                swap_size = 6
+                self.canvas.create_line(tgt_x - swap_size, tgt_y_2d - swap_size,
+                                       tgt_x + swap_size, tgt_y_2d + swap_size,
+                                       fill="#ffffff", width=2, tags=tags)
+                self.canvas.create_line(tgt_x - swap_size, tgt_y_2d + swap_size,
+                                       tgt_x + swap_size, tgt_y_2d - swap_size,
+                                       fill="#ffffff", width=2, tags=tags)
+                # Also × at control
+                self.canvas.create_line(ctrl_x - swap_size, ctrl_y_2d - swap_size,
+                                       ctrl_x + swap_size, ctrl_y_2d + swap_size,
+                                       fill="#ffffff", width=2, tags=tags)
+                self.canvas.create_line(ctrl_x - swap_size, ctrl_y_2d + swap_size,
+                                       ctrl_x + swap_size, ctrl_y_2d - swap_size,
+                                       fill="#ffffff", width=2, tags=tags)
+        
+        # Draw control/target for user-created controlled gates (CH, CY, CS, CT, CSWAP)
+        if hasattr(component, 'properties') and component.properties.get('is_controlled'):
+            control_y = component.properties.get('control_y')
+            if control_y is not None:
                 # Control position (●)
                 ctrl_x, ctrl_y_2d = self.renderer.project_3d_to_2d(x + w/2, control_y + 0.5, z + h/2)
-                # Target position (⊕)
-                tgt_x, tgt_y_2d = self.renderer.project_3d_to_2d(x + w/2, target_y + 0.5, z + h/2)
+                # Target is at the gate's position
+                tgt_x, tgt_y_2d = self.renderer.project_3d_to_2d(x + w/2, y + d/2, z + h/2)
                 
                 # Draw connecting line
                 self.canvas.create_line(ctrl_x, ctrl_y_2d, tgt_x, tgt_y_2d,
-                                       fill="#ffffff", width=2, tags="component")
+                                       fill="#ffffff", width=2, tags=tags)
                 
-                # Draw control dot (●) - filled circle
+                # Draw control dot (●)
                 dot_radius = 6
                 self.canvas.create_oval(ctrl_x - dot_radius, ctrl_y_2d - dot_radius,
                                        ctrl_x + dot_radius, ctrl_y_2d + dot_radius,
-                                       fill="#ffffff", outline="#000000", width=1, tags="component")
-                
-                # Draw target symbol based on gate type
-                if component.component_type == ComponentType.CNOT_GATE:
-                    # CNOT target: ⊕ (circle with plus)
-                    target_radius = 10
-                    self.canvas.create_oval(tgt_x - target_radius, tgt_y_2d - target_radius,
-                                           tgt_x + target_radius, tgt_y_2d + target_radius,
-                                           fill="", outline="#ffffff", width=2, tags="component")
-                    # Plus inside
-                    self.canvas.create_line(tgt_x - target_radius + 2, tgt_y_2d,
-                                           tgt_x + target_radius - 2, tgt_y_2d,
-                                           fill="#ffffff", width=2, tags="component")
-                    self.canvas.create_line(tgt_x, tgt_y_2d - target_radius + 2,
-                                           tgt_x, tgt_y_2d + target_radius - 2,
-                                           fill="#ffffff", width=2, tags="component")
-                elif component.component_type == ComponentType.CZ_GATE:
-                    # CZ: both controls (● ●)
-                    self.canvas.create_oval(tgt_x - dot_radius, tgt_y_2d - dot_radius,
-                                           tgt_x + dot_radius, tgt_y_2d + dot_radius,
-                                           fill="#ffffff", outline="#000000", width=1, tags="component")
-                elif component.component_type == ComponentType.SWAP_GATE:
-                    # SWAP: × at both positions
-                    swap_size = 6
-                    self.canvas.create_line(tgt_x - swap_size, tgt_y_2d - swap_size,
-                                           tgt_x + swap_size, tgt_y_2d + swap_size,
-                                           fill="#ffffff", width=2, tags="component")
-                    self.canvas.create_line(tgt_x - swap_size, tgt_y_2d + swap_size,
-                                           tgt_x + swap_size, tgt_y_2d - swap_size,
-                                           fill="#ffffff", width=2, tags="component")
-                    # Also × at control
-                    self.canvas.create_line(ctrl_x - swap_size, ctrl_y_2d - swap_size,
-                                           ctrl_x + swap_size, ctrl_y_2d + swap_size,
-                                           fill="#ffffff", width=2, tags="component")
-                    self.canvas.create_line(ctrl_x - swap_size, ctrl_y_2d + swap_size,
-                                           ctrl_x + swap_size, ctrl_y_2d - swap_size,
-                                           fill="#ffffff", width=2, tags="component")
-            
-            # Draw control/target for user-created controlled gates (CH, CY, CS, CT, CSWAP)
-            if hasattr(component, 'properties') and component.properties.get('is_controlled'):
-                control_y = component.properties.get('control_y')
-                if control_y is not None:
-                    # Control position (●)
-                    ctrl_x, ctrl_y_2d = self.renderer.project_3d_to_2d(x + w/2, control_y + 0.5, z + h/2)
-                    # Target is at the gate's position
-                    tgt_x, tgt_y_2d = self.renderer.project_3d_to_2d(x + w/2, y + d/2, z + h/2)
-                    
-                    # Draw connecting line
-                    self.canvas.create_line(ctrl_x, ctrl_y_2d, tgt_x, tgt_y_2d,
-                                           fill="#ffffff", width=2, tags="component")
-                    
-                    # Draw control dot (●)
-                    dot_radius = 6
-                    self.canvas.create_oval(ctrl_x - dot_radius, ctrl_y_2d - dot_radius,
-                                           ctrl_x + dot_radius, ctrl_y_2d + dot_radius,
-                                           fill="#ffffff", outline="#000000", width=1, tags="component")
-            
-            # Add component label - use black text for bright components (orange, yellow only)
-            center_x, center_y = self.renderer.project_3d_to_2d(x + w/2, y + d/2, z + h + 0.2)
-            # Determine text color based on component brightness
-            # Only orange/yellow components need black text for readability
-            # Green components (DATA_QUBIT, ANCILLA_QUBIT) keep white text
-            bright_components = [
-                ComponentType.H_GATE,      # Gold/Yellow
-                ComponentType.T_GATE,      # Orange
-                ComponentType.PARITY_CHECK,  # Orange
-                ComponentType.CIRCUIT_CORRECTION,  # Yellow
-            ]
-            text_color = "#000000" if component.component_type in bright_components else "#ffffff"
-            
-            # For correction components, show the gate label (X, Z, Y) instead of "Correct"
-            if component.component_type == ComponentType.CIRCUIT_CORRECTION:
-                display_label = component.properties.get('label', 'X')
-            else:
-                display_label = component.component_type.value
-            
-            self.canvas.create_text(center_x, center_y, text=display_label,
-                                  fill=text_color, font=("Arial", 8), tags="component")
-            
-            # Add rotation indicator if component is rotated
-            if component.rotation != 0:
-                arrow_length = 15
+                                       fill="#ffffff", outline="#000000", width=1, tags=tags)
+        
+        # Add component label - use black text for bright components (orange, yellow only)
+        center_x, center_y = self.renderer.project_3d_to_2d(x + w/2, y + d/2, z + h + 0.2)
+        # Determine text color based on component brightness
+        # Only orange/yellow components need black text for readability
+        # Green components (DATA_QUBIT, ANCILLA_QUBIT) keep white text
+        bright_components = [
+            ComponentType.H_GATE,      # Gold/Yellow
+            ComponentType.T_GATE,      # Orange
+            ComponentType.PARITY_CHECK,  # Orange
+            ComponentType.CIRCUIT_CORRECTION,  # Yellow
+        ]
+        text_color = "#000000" if component.component_type in bright_components else "#ffffff"
+        
+        # For correction components, show the gate label (X, Z, Y) instead of "Correct"
+        if component.component_type == ComponentType.CIRCUIT_CORRECTION:
+            display_label = component.properties.get('label', 'X')
+        else:
+            display_label = component.component_type.value
+        
+        self.canvas.create_text(center_x, center_y, text=display_label,
+                              fill=text_color, font=("Arial", 8), tags=tags)
+        
+        # Add rotation indicator if component is rotated
+        if component.rotation:
+            arrow_length = 15
+            trig = _ROTATION_TRIG.get(component.rotation)
+            if trig is None:
                 angle_rad = math.radians(component.rotation)
-                arrow_end_x = center_x + arrow_length * math.cos(angle_rad)
-                arrow_end_y = center_y + arrow_length * math.sin(angle_rad)
-                
-                self.canvas.create_line(center_x, center_y, arrow_end_x, arrow_end_y,
-                                      fill="#ffff00", width=2, arrow=tk.LAST, tags="component")
-                self.canvas.create_text(center_x + 20, center_y - 10, text=f"{component.rotation}°",
-                                      fill="#ffff00", font=("Arial", 7), tags="component")
+                trig = (math.cos(angle_rad), math.sin(angle_rad))
+            arrow_end_x = center_x + arrow_length * trig[0]
+            arrow_end_y = center_y + arrow_length * trig[1]
             
-            # Draw selection highlight for selected component (#4)
-            if component == self.selected_component:
-                self._draw_selection_highlight(component)
+            self.canvas.create_line(center_x, center_y, arrow_end_x, arrow_end_y,
+                                  fill="#ffff00", width=2, arrow=tk.LAST, tags=tags)
+            self.canvas.create_text(center_x + 20, center_y - 10, text=f"{component.rotation}°",
+                                  fill="#ffff00", font=("Arial", 7), tags=tags)
     
     def _draw_selection_highlight(self, component: Component3D):
         """Draw a clean single-line selection highlight around a component."""
         x, y, z = component.position
         w, h, d = component.size
         
-        # Single clean selection outline
+        # Single clean selection outline: the component's box grown by offset,
+        # projected in one batch (corners in IsometricRenderer._UNIT_VERTS order)
         offset = 0.08
-        corners = [
-            (x - offset, y - offset, z - offset),
-            (x + w + offset, y - offset, z - offset),
-            (x + w + offset, y + d + offset, z - offset),
-            (x - offset, y + d + offset, z - offset),
-            (x - offset, y - offset, z + h + offset),
-            (x + w + offset, y - offset, z + h + offset),
-            (x + w + offset, y + d + offset, z + h + offset),
-            (x - offset, y + d + offset, z + h + offset),
-        ]
-        
-        # Project to 2D
-        projected = [self.renderer.project_3d_to_2d(*c) for c in corners]
+        box = np.array([[x - offset, y - offset, z - offset,
+                         w + 2 * offset, h + 2 * offset, d + 2 * offset]])
+        projected = self.renderer.project_cubes(box)[0].tolist()
         
         # Draw edges of the selection box - single line
         edges = [
@@ -6597,40 +6032,47 @@ class CircuitBuilder3D:
     
     def _show_context_menu(self, event, component: Component3D):
         """Show context menu for component operations."""
-        context_menu = tk.Menu(self.root, tearoff=0, bg='#404040', fg='#ffffff',
-                              activebackground='#606060', activeforeground='#ffffff')
-        
-        # Add "Add Control" option for controllable gates
-        controllable_gates = [
-            ComponentType.X_GATE, ComponentType.Y_GATE, ComponentType.Z_GATE,
-            ComponentType.H_GATE, ComponentType.S_GATE, ComponentType.T_GATE,
-            ComponentType.SWAP_GATE
-        ]
-        
-        if component.component_type in controllable_gates:
+        context_menu = self._context_menu
+        if context_menu is None:
+            context_menu = self._context_menu = self._build_context_menu()
+        self._context_target = component
+        
+        # The control entry depends on the component: drop the previous one and
+        # add the one this component needs at the top of the menu
+        if self._context_has_control:
+            context_menu.delete(0, 1)
+            self._context_has_control = False
+        
+        if component.component_type in _CONTROLLABLE_TYPES:
             # Check if already controlled
             if component.properties.get('is_controlled'):
-                context_menu.add_command(label="✓ Remove Control",
-                                       command=lambda: self._remove_control(component))
+                context_menu.insert_command(0, label="✓ Remove Control",
+                                            command=lambda: self._remove_control(component))
             else:
-                context_menu.add_command(label="● Add Control",
-                                       command=lambda: self._start_add_control_mode(component, event))
-            context_menu.add_separator()
+                context_menu.insert_command(0, label="● Add Control",
+                                            command=lambda: self._start_add_control_mode(component, event))
+            context_menu.insert_separator(1)
+            self._context_has_control = True
         
+        try:
+            context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            context_menu.grab_release()
+    
+    def _build_context_menu(self) -> tk.Menu:
+        """Create the shared component context menu; its commands act on _context_target."""
+        context_menu = tk.Menu(self.root, tearoff=0, bg='#404040', fg='#ffffff',
+                              activebackground='#606060', activeforeground='#ffffff')
         context_menu.add_command(label="Rotate", 
-                               command=lambda: self._rotate_component(component))
+                               command=lambda: self._rotate_component(self._context_target))
         context_menu.add_command(label="Duplicate", 
-                               command=lambda: self._duplicate_component(component))
+                               command=lambda: self._duplicate_component(self._context_target))
         context_menu.add_command(label="Delete", 
-                               command=lambda: self._delete_component(component))
+                               command=lambda: self._delete_component(self._context_target))
         context_menu.add_separator()
         context_menu.add_command(label="Properties", 
-                               command=lambda: self._show_properties(component))
-        
-        try:
-            context_menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            context_menu.grab_release()
+                               command=lambda: self._show_properties(self._context_target))
+        return context_menu
     
     def _start_add_control_mode(self, component: Component3D, event):
         """Start the mode to add a control qubit to a gate.
@@ -6884,7 +6326,7 @@ class CircuitBuilder3D:
         """Rotate a component by 90 degrees."""
         component.rotation = (component.rotation + 90) % 360
         self._log_status(f"Rotated {component.component_type.value} to {component.rotation}°")
-        self._redraw_circuit()
+        self._schedule_redraw()
     
     def _duplicate_component(self, component: Component3D):
         """Duplicate a component at an adjacent position."""
@@ -6893,13 +6335,16 @@ class CircuitBuilder3D:
         # Try to find an adjacent free position
         adjacent_positions = [(x + 1, y, z), (x - 1, y, z), (x, y + 1, z), (x, y - 1, z)]
         
+        # Occupied (x, y) cells, collected in one pass for all candidates
+        occupied = {c.position[:2] for c in self.components}
+        
         for new_x, new_y, new_z in adjacent_positions:
             # Check grid boundaries
             if (new_x < -10 or new_x > 10 or new_y < -10 or new_y > 10):
                 continue
                 
             # Check if position is free
-            if not self._get_component_at_position(new_x, new_y):
+            if (new_x, new_y) not in occupied:
                 new_component = Component3D(
                     component_type=component.component_type,
                     position=(new_x, new_y, new_z),
@@ -6912,7 +6357,7 @@ class CircuitBuilder3D:
                 
                 self.components.append(new_component)
                 self._log_status(f"Duplicated {component.component_type.value} at ({new_x}, {new_y}, {new_z})")
-                self._redraw_circuit()
+                self._schedule_redraw()
                 return
         
         # No free adjacent position found
@@ -6920,15 +6365,15 @@ class CircuitBuilder3D:
     
     def _delete_component(self, component: Component3D):
         """Delete a component from the circuit."""
-        if component in self.components:
+        if _index_of(self.components, component) >= 0:
             # Use command pattern for undo/redo support
             cmd = DeleteComponentCommand(self, component)
             self.command_history.execute(cmd)
             
-            if self.selected_component == component:
+            if self.selected_component is component:
                 self.selected_component = None
             self._log_status(f"Deleted {component.component_type.value}")
-            self._redraw_circuit()
+            self._schedule_redraw()
     
     def _delete_selected(self, event):
         """Delete currently selected component."""
@@ -6977,12 +6422,8 @@ class CircuitBuilder3D:
                 return
             
             # Find component type
-            comp_type = None
             type_str = component_data.get('type', '')
-            for ct in ComponentType:
-                if ct.value == type_str or ct.name == type_str:
-                    comp_type = ct
-                    break
+            comp_type = ComponentType.get_by_value_or_name(type_str)
             
             if not comp_type:
                 self._log_status(f"Unknown component type: {type_str}")
@@ -7015,7 +6456,7 @@ class CircuitBuilder3D:
             
             self.selected_component = component
             self._log_status(f"📋 Pasted {comp_type.value} at {paste_pos}")
-            self._redraw_circuit()
+            self._schedule_redraw()
             
         except tk.TclError:
             # Clipboard is empty or not accessible
@@ -7056,35 +6497,57 @@ class CircuitBuilder3D:
             self._log_status(f"Failed to copy circuit: {e}")
     
     def _show_properties(self, component: Component3D):
-        """Show component properties dialog."""
-        props_window = tk.Toplevel(self.root)
-        props_window.title(f"{component.component_type.value} Properties")
-        props_window.configure(bg='#2b2b2b')
-        props_window.geometry("300x400")
+        """Show component properties dialog.
         
-        # Properties display
-        props_frame = ttk.Frame(props_window, style='Dark.TFrame')
-        props_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        The dialog is built once and withdrawn when closed; later calls only
+        refill its labels and the custom properties section.
+        """
+        if self._props_window is None or not self._props_window.winfo_exists():
+            self._build_properties_window()
+        props_window = self._props_window
+        props_window.title(f"{component.component_type.value} Properties")
         
         # Component info
-        ttk.Label(props_frame, text=f"Type: {component.component_type.value}",
-                 style='Dark.TLabel').pack(anchor=tk.W, pady=2)
-        ttk.Label(props_frame, text=f"Position: {component.position}",
-                 style='Dark.TLabel').pack(anchor=tk.W, pady=2)
-        ttk.Label(props_frame, text=f"Rotation: {component.rotation}°",
-                 style='Dark.TLabel').pack(anchor=tk.W, pady=2)
-        ttk.Label(props_frame, text=f"Size: {component.size}",
-                 style='Dark.TLabel').pack(anchor=tk.W, pady=2)
-        
-        # Additional properties
+        self._props_labels['type'].config(text=f"Type: {component.component_type.value}")
+        self._props_labels['position'].config(text=f"Position: {component.position}")
+        self._props_labels['rotation'].config(text=f"Rotation: {component.rotation}°")
+        self._props_labels['size'].config(text=f"Size: {component.size}")
+        
+        # Additional properties (these differ per component, so rebuild them)
+        custom_frame = self._props_custom_frame
+        for child in custom_frame.winfo_children():
+            child.destroy()
         if component.properties:
-            ttk.Separator(props_frame, orient='horizontal').pack(fill=tk.X, pady=10)
-            ttk.Label(props_frame, text="Custom Properties:",
+            ttk.Separator(custom_frame, orient='horizontal').pack(fill=tk.X, pady=10)
+            ttk.Label(custom_frame, text="Custom Properties:",
                      style='Dark.TLabel').pack(anchor=tk.W, pady=2)
             
             for key, value in component.properties.items():
-                ttk.Label(props_frame, text=f"{key}: {value}",
+                ttk.Label(custom_frame, text=f"{key}: {value}",
                          style='Dark.TLabel').pack(anchor=tk.W, pady=1)
+        
+        props_window.deiconify()
+        props_window.lift()
+    
+    def _build_properties_window(self) -> None:
+        """Create the reusable properties dialog with empty labels."""
+        props_window = self._props_window = tk.Toplevel(self.root)
+        props_window.configure(bg='#2b2b2b')
+        props_window.geometry("300x400")
+        props_window.protocol("WM_DELETE_WINDOW", props_window.withdraw)
+        
+        # Properties display
+        props_frame = ttk.Frame(props_window, style='Dark.TFrame')
+        props_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        self._props_labels = {}
+        for field_name in ('type', 'position', 'rotation', 'size'):
+            label = ttk.Label(props_frame, style='Dark.TLabel')
+            label.pack(anchor=tk.W, pady=2)
+            self._props_labels[field_name] = label
+        
+        self._props_custom_frame = ttk.Frame(props_frame, style='Dark.TFrame')
+        self._props_custom_frame.pack(fill=tk.X)
     
     def _clear_circuit(self) -> None:
         """Clear all components from the circuit."""
@@ -7092,35 +6555,23 @@ class CircuitBuilder3D:
         self.selected_component = None
         self._update_circuit_title("New Circuit")
         self._log_status("Circuit cleared")
-        self._redraw_circuit()
+        self._schedule_redraw()
     
     def _save_circuit(self) -> None:
         """Save current circuit to file."""
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            filetypes=[("JSON files", "*.json"), ("QLDPC binary", "*.qldpc"), ("All files", "*.*")],
             title="Save Circuit"
         )
         
         if filename:
             try:
-                circuit_data = {
-                    'components': [
-                        {
-                            'type': comp.component_type.value,
-                            'position': comp.position,
-                            'rotation': comp.rotation,
-                            'size': comp.size,
-                            'color': comp.color,
-                            'connections': comp.connections,
-                            'properties': comp.properties
-                        }
-                        for comp in self.components
-                    ]
-                }
-                
-                with open(filename, 'w') as f:
-                    json.dump(circuit_data, f, indent=2)
+                if filename.lower().endswith(_BINARY_CIRCUIT_EXT):
+                    _write_circuit_binary(filename, self.components)
+                else:
+                    # Components are serialized by the encoder as it writes them out
+                    _write_circuit_json(filename, {'components': self.components})
                 
                 # Update circuit title
                 circuit_name = os.path.basename(filename)
@@ -7152,14 +6603,14 @@ class CircuitBuilder3D:
         
         filename = filedialog.askopenfilename(
             initialdir=initial_dir,
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            filetypes=[("Circuit files", "*.json *.qldpc"), ("JSON files", "*.json"),
+                       ("QLDPC binary", "*.qldpc"), ("All files", "*.*")],
             title="Load Circuit"
         )
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    circuit_data = json.load(f)
+                circuit_data = _read_circuit_file(filename)
                 
                 # Validate JSON structure (#21)
                 validation_result = self._validate_circuit_json(circuit_data, filename)
@@ -7188,23 +6639,17 @@ class CircuitBuilder3D:
                 elif not is_surface_circuit and self.view_mode == ViewMode.SURFACE_CODE_2D:
                     self._toggle_view_mode()
                 
-                # Clear current circuit
-                self.components.clear()
+                # Load components into a new list, then swap it in as a whole
+                loaded: List[Component3D] = []
                 
-                # Load components
                 for comp_data in circuit_data.get('components', []):
                     # Find component type - check both value and name
-                    comp_type = None
                     type_str = comp_data.get('type', '')
-                    for ct in ComponentType:
-                        if ct.value == type_str or ct.name == type_str:
-                            comp_type = ct
-                            break
+                    comp_type = ComponentType.get_by_value_or_name(type_str)
                     
                     if comp_type:
                         # Determine correct size based on gate type
-                        two_qubit_types = [ComponentType.CNOT_GATE, ComponentType.CZ_GATE, ComponentType.SWAP_GATE]
-                        if comp_type in two_qubit_types:
+                        if comp_type in _TWO_QUBIT_TYPES:
                             size = (1.0, 1.0, 2.0)  # Two-qubit gates span 2 Y lanes
                         else:
                             size = tuple(comp_data.get('size', (1.0, 1.0, 1.0)))
@@ -7218,7 +6663,9 @@ class CircuitBuilder3D:
                             connections=comp_data.get('connections', []),
                             properties=comp_data.get('properties', {})
                         )
-                        self.components.append(component)
+                        loaded.append(component)
+                
+                self.components[:] = loaded
                 
                 # Update circuit title
                 circuit_name = os.path.basename(filename)
@@ -7226,7 +6673,7 @@ class CircuitBuilder3D:
                 self._update_circuit_title(formatted_title)
                 
                 self._log_status(f"Circuit loaded from {filename}")
-                self._redraw_circuit()
+                self._schedule_redraw()
                 
             except json.JSONDecodeError as e:
                 error_info = ErrorContext.get_user_friendly_error(e, "Loading circuit file")
@@ -7274,9 +6721,6 @@ class CircuitBuilder3D:
             if data['view_mode'] not in valid_modes:
                 warnings.append(f"Unknown view_mode '{data['view_mode']}', will use default")
         
-        # Valid component types
-        valid_types = set(ct.value for ct in ComponentType) | set(ct.name for ct in ComponentType)
-        
         # Validate each component
         for i, comp in enumerate(data['components']):
             comp_prefix = f"Component [{i}]"
@@ -7288,7 +6732,7 @@ class CircuitBuilder3D:
             # Required field: type
             if 'type' not in comp:
                 errors.append(f"{comp_prefix}: Missing required 'type' field")
-            elif comp['type'] not in valid_types:
+            elif ComponentType.get_by_value_or_name(comp['type']) is None:
                 warnings.append(f"{comp_prefix}: Unknown type '{comp['type']}'")
             
             # Required field: position
@@ -7340,8 +6784,7 @@ class CircuitBuilder3D:
     def _load_circuit_from_path(self, filepath: str):
         """Load circuit from a specific file path (used by tutorials and demos)."""
         try:
-            with open(filepath, 'r') as f:
-                circuit_data = json.load(f)
+            circuit_data = _read_circuit_file(filepath)
             
             # Validate JSON structure (#21)
             validation_result = self._validate_circuit_json(circuit_data, filepath)
@@ -7364,8 +6807,8 @@ class CircuitBuilder3D:
             elif not is_surface_circuit and self.view_mode == ViewMode.SURFACE_CODE_2D:
                 self._toggle_view_mode()
             
-            # Clear current circuit
-            self.components.clear()
+            # Load components into a new list, then swap it in as a whole
+            loaded: List[Component3D] = []
             
             # Track loading statistics
             loaded_count = 0
@@ -7375,17 +6818,12 @@ class CircuitBuilder3D:
             # Load components
             for comp_data in circuit_data.get('components', []):
                 # Find component type - check both value and name
-                comp_type = None
                 type_str = comp_data.get('type', '')
-                for ct in ComponentType:
-                    if ct.value == type_str or ct.name == type_str:
-                        comp_type = ct
-                        break
+                comp_type = ComponentType.get_by_value_or_name(type_str)
                 
                 if comp_type:
                     # Determine correct size based on gate type
-                    two_qubit_types = [ComponentType.CNOT_GATE, ComponentType.CZ_GATE, ComponentType.SWAP_GATE]
-                    if comp_type in two_qubit_types:
+                    if comp_type in _TWO_QUBIT_TYPES:
                         size = (1.0, 1.0, 2.0)  # Two-qubit gates span 2 Y lanes
                     else:
                         size = tuple(comp_data.get('size', (1.0, 1.0, 1.0)))
@@ -7399,7 +6837,7 @@ class CircuitBuilder3D:
                         connections=comp_data.get('connections', []),
                         properties=comp_data.get('properties', {})
                     )
-                    self.components.append(component)
+                    loaded.append(component)
                     loaded_count += 1
                 else:
                     # Log unknown component types (improvement #20)
@@ -7407,6 +6845,8 @@ class CircuitBuilder3D:
                     if type_str not in skipped_types:
                         skipped_types.append(type_str)
             
+            self.components[:] = loaded
+            
             # Update circuit title
             circuit_name = os.path.basename(filepath)
             formatted_title = self._format_circuit_title(circuit_name)
@@ -7417,7 +6857,7 @@ class CircuitBuilder3D:
             if skipped_count > 0:
                 self._log_status(f"⚠ Skipped {skipped_count} unknown component(s): {', '.join(skipped_types)}")
             
-            self._redraw_circuit()
+            self._schedule_redraw()
             
         except Exception as e:
             raise Exception(f"Failed to load circuit: {e}")
@@ -7425,23 +6865,25 @@ class CircuitBuilder3D:
     def _calculate_syndrome(self):
         """Calculate syndrome for current circuit."""
         try:
-            syndrome = self.processor.calculate_syndrome(self.components)
+            groups = group_by_type(self.components)
+            syndrome = self.processor.calculate_syndrome(self.components, groups)
             
             if len(syndrome) > 0:
                 # Count circuit components for context
-                data_qubits = len([c for c in self.components if c.component_type == ComponentType.DATA_QUBIT])
-                ancilla_qubits = len([c for c in self.components if c.component_type == ComponentType.ANCILLA_QUBIT])
-                parity_checks = len([c for c in self.components if c.component_type == ComponentType.PARITY_CHECK])
+                data_qubits = len(groups[ComponentType.DATA_QUBIT])
+                ancilla_qubits = len(groups[ComponentType.ANCILLA_QUBIT])
+                parity_checks = len(groups[ComponentType.PARITY_CHECK])
                 
                 self._log_status(f"=== Syndrome Calculation ===")
                 self._log_status(f"Data qubits: {data_qubits}, Ancilla qubits: {ancilla_qubits}, Parity checks: {parity_checks}")
                 self._log_status(f"Syndrome: {syndrome}")
-                self._log_status(f"Syndrome weight: {np.sum(syndrome)} / {len(syndrome)}")
+                syndrome_weight = int(np.count_nonzero(syndrome))
+                self._log_status(f"Syndrome weight: {syndrome_weight} / {len(syndrome)}")
                 
-                if np.sum(syndrome) == 0:
+                if syndrome_weight == 0:
                     self._log_status("✓ No errors detected (all syndrome bits are 0)")
                 else:
-                    self._log_status(f"⚠ Errors detected (syndrome weight: {np.sum(syndrome)})")
+                    self._log_status(f"⚠ Errors detected (syndrome weight: {syndrome_weight})")
             else:
                 self._log_status("No syndrome extractors found. Need ancilla qubits or parity check components.")
                 
@@ -7517,14 +6959,15 @@ class CircuitBuilder3D:
         """Run error correction algorithm."""
         try:
             # First calculate syndrome
-            syndrome = self.processor.calculate_syndrome(self.components)
+            groups = group_by_type(self.components)
+            syndrome = self.processor.calculate_syndrome(self.components, groups)
             
             if len(syndrome) == 0:
                 self._log_status("No syndrome available for error correction. Need ancilla qubits or parity checks.")
                 return
             
             # Run error correction
-            result = self.processor.perform_error_correction(syndrome, self.components)
+            result = self.processor.perform_error_correction(syndrome, self.components, groups)
             
             if result['success']:
                 correction = result['correction']
@@ -7560,13 +7003,12 @@ class CircuitBuilder3D:
                 self._log_status("Failed to build quantum circuit")
                 return
             
-            if QISKIT_AVAILABLE and hasattr(circuit, 'num_qubits'):
+            if hasattr(circuit, 'num_qubits') and _ensure_qiskit():
                 # Run actual quantum simulation
                 simulator = AerSimulator()
                 
                 # Add measurements if not present
-                if not any(instr.operation.name == 'measure' for instr in circuit.data):
-                    circuit.measure_all()
+                circuit = self.processor.with_measurements(circuit)
                 
                 # Execute circuit
                 transpiled = transpile(circuit, simulator)
@@ -7800,29 +7242,30 @@ class CircuitBuilder3D:
         text_widget.tag_configure('info', foreground='#6bcb77')
         text_widget.tag_configure('header', foreground='#4fc3f7', font=('Consolas', 10, 'bold'))
         
+        # Build the report as (chars, tags) pairs for a single insert;
+        # each section's lines share one tag, so they are joined up front
+        parts = []
+        
         # Add errors
         if errors:
-            text_widget.insert(tk.END, "ERRORS:\n", 'header')
-            for error in errors:
-                text_widget.insert(tk.END, f"  ✗ {error}\n", 'error')
-            text_widget.insert(tk.END, "\n")
+            parts += ["ERRORS:\n", 'header',
+                      ''.join(f"  ✗ {error}\n" for error in errors), 'error', "\n", '']
         
         # Add warnings
         if warnings:
-            text_widget.insert(tk.END, "WARNINGS:\n", 'header')
-            for warning in warnings:
-                text_widget.insert(tk.END, f"  ⚠ {warning}\n", 'warning')
-            text_widget.insert(tk.END, "\n")
+            parts += ["WARNINGS:\n", 'header',
+                      ''.join(f"  ⚠ {warning}\n" for warning in warnings), 'warning', "\n", '']
         
         # Add info
         if info:
-            text_widget.insert(tk.END, "INFO:\n", 'header')
-            for item in info:
-                text_widget.insert(tk.END, f"  ✓ {item}\n", 'info')
+            parts += ["INFO:\n", 'header',
+                      ''.join(f"  ✓ {item}\n" for item in info), 'info']
         
         # If no issues at all
         if not errors and not warnings:
-            text_widget.insert(tk.END, "No issues found! Circuit is ready for simulation.\n", 'info')
+            parts += ["No issues found! Circuit is ready for simulation.\n", 'info']
+        
+        text_widget.insert(tk.END, *parts)
         
         text_widget.config(state=tk.DISABLED)
         
@@ -8742,10 +8185,14 @@ class CircuitBuilder3D:
             self._log_status("✓ No parity violations - all check nodes satisfied")
     
     def _log_status(self, message: str) -> None:
-        """Log a status message to the status display and terminal."""
-        self.status_text.insert(tk.END, f"{message}\n")
-        self.status_text.see(tk.END)
-        self.root.update_idletasks()
+        """Log a status message to the status display and terminal.
+        
+        Lines reach the status display on the next idle tick, so a burst of
+        messages from one command is inserted (and laid out) once.
+        """
+        if not self._log_buffer:
+            self.root.after_idle(self._flush_log)
+        self._log_buffer.append(f"{message}\n")
         # Also print to terminal for debugging (with encoding safety)
         try:
             print(f"[STATUS] {message}")
@@ -8754,6 +8201,12 @@ class CircuitBuilder3D:
             safe_message = message.encode('ascii', 'replace').decode('ascii')
             print(f"[STATUS] {safe_message}")
     
+    def _flush_log(self) -> None:
+        """Write the status lines buffered by _log_status."""
+        self.status_text.insert(tk.END, ''.join(self._log_buffer))
+        self.status_text.see(tk.END)
+        self._log_buffer = []
+    
     def _on_tutorial_complete(self, show_on_startup: bool) -> None:
         """Handle tutorial completion."""
         TutorialScreen.save_tutorial_preference(show_on_startup)
@@ -8807,10 +8260,10 @@ class CircuitBuilder3D:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Enable mouse wheel scrolling
+        # Enable mouse wheel scrolling within this dialog
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        dialog.bind("<MouseWheel>", on_mousewheel)
         
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -8885,24 +8338,32 @@ class CircuitBuilder3D:
         
         ttk.Button(close_frame, text="Close", command=dialog.destroy,
                   style='Dark.TButton').pack(side=tk.RIGHT)
-        
-        # Cleanup mouse wheel binding on close
-        def on_close():
-            canvas.unbind_all("<MouseWheel>")
-            dialog.destroy()
-        dialog.protocol("WM_DELETE_WINDOW", on_close)
     
     def _toggle_legend(self):
-        """Toggle the component legend panel."""
-        if hasattr(self, 'legend_window') and self.legend_window and self.legend_window.winfo_exists():
-            self.legend_window.destroy()
-            self.legend_window = None
+        """Toggle the component legend panel.
+        
+        Hiding withdraws the window so showing it again for the same view
+        mode reuses the already drawn legend instead of rebuilding it.
+        """
+        legend_open = getattr(self, 'legend_window', None) and self.legend_window.winfo_exists()
+        if self._legend_is_shown():
+            self.legend_window.withdraw()
+        elif legend_open and self._legend_view_mode == self.view_mode:
+            self.legend_window.deiconify()
         else:
+            if legend_open:
+                self.legend_window.destroy()
             self._show_legend()
     
+    def _legend_is_shown(self) -> bool:
+        """Check whether the legend window exists and is not withdrawn."""
+        return bool(getattr(self, 'legend_window', None) and self.legend_window.winfo_exists()
+                    and self.legend_window.state() != 'withdrawn')
+    
     def _show_legend(self):
         """Show the component legend panel with 3D cube previews."""
         self.legend_window = tk.Toplevel(self.root)
+        self._legend_view_mode = self.view_mode
         self.legend_window.title("Component Legend")
         self.legend_window.geometry("280x600")
         self.legend_window.configure(bg='#1a1a2e')
@@ -8955,7 +8416,11 @@ class CircuitBuilder3D:
         )
         
         legend_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        legend_canvas.configure(yscrollcommand=scrollbar.set)
+        # Icons are drawn as their rows scroll into view (see _draw_visible_legend_icons)
+        self._legend_pending_icons = []
+        legend_canvas.configure(
+            yscrollcommand=lambda first, last: self._on_legend_yview(
+                scrollbar, scrollable_frame, first, last))
         
         legend_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -9035,14 +8500,14 @@ class CircuitBuilder3D:
             for comp_type in components:
                 self._create_legend_item(scrollable_frame, comp_type)
         
-        # Enable mouse wheel scrolling
+        # Enable mouse wheel scrolling over the legend window only (a Toplevel
+        # binding reaches every widget inside it, and goes away with it)
         def _on_mousewheel(event):
             legend_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        legend_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        self.legend_window.bind("<MouseWheel>", _on_mousewheel)
         
         # Cleanup when window closes
         def on_close():
-            legend_canvas.unbind_all("<MouseWheel>")
             self.legend_window.destroy()
             self.legend_window = None
         
@@ -9053,14 +8518,8 @@ class CircuitBuilder3D:
         item_frame = tk.Frame(parent, bg='#0f0f23', bd=1, relief='solid')
         item_frame.pack(fill=tk.X, pady=2, padx=5)
         
-        # Check if this is a surface code component
-        surface_types = [ComponentType.SURFACE_DATA, ComponentType.SURFACE_X_STABILIZER,
-                        ComponentType.SURFACE_Z_STABILIZER, ComponentType.SURFACE_BOUNDARY]
-        is_surface = comp_type in surface_types
-        
         # Two-qubit gates get a wider preview canvas
-        two_qubit_types = [ComponentType.CNOT_GATE, ComponentType.CZ_GATE, ComponentType.SWAP_GATE]
-        is_two_qubit = comp_type in two_qubit_types
+        is_two_qubit = comp_type in _TWO_QUBIT_TYPES
         
         canvas_width = 70 if is_two_qubit else 50
         
@@ -9069,15 +8528,20 @@ class CircuitBuilder3D:
                                   bg='#0f0f23', highlightthickness=0)
         preview_canvas.pack(side=tk.LEFT, padx=5, pady=5)
         
-        # Draw preview based on view mode
+        # Draw preview based on view mode, deferred until the row is visible.
+        # All legend items share the "legend" tag for one-call delete/hide.
         color = self._get_component_color(comp_type)
+        tags = ("legend", f"legend_{comp_type.name}")
         if self.view_mode == ViewMode.SURFACE_CODE_2D:
             # In surface mode, use flat 2D shapes for ALL components
-            self._draw_mini_flat(preview_canvas, 25, 20, color, comp_type)
+            draw = functools.partial(self._draw_mini_flat, preview_canvas, 25, 20, color, comp_type,
+                                     tags=tags)
         else:
             # In isometric mode, draw mini cubes
             depth = 2.0 if is_two_qubit else 1.0
-            self._draw_mini_cube(preview_canvas, 25, 25, color, depth=depth)
+            draw = functools.partial(self._draw_mini_cube, preview_canvas, 25, 25, color, depth=depth,
+                                     tags=tags)
+        self._legend_pending_icons.append((item_frame, draw))
         
         # Component name and description
         text_frame = tk.Frame(item_frame, bg='#0f0f23')
@@ -9089,34 +8553,45 @@ class CircuitBuilder3D:
         name_label.pack(anchor=tk.W)
         
         # Add description based on component type
-        descriptions = {
-            ComponentType.X_GATE: "Bit-flip gate (Pauli-X)",
-            ComponentType.Y_GATE: "Pauli-Y rotation",
-            ComponentType.Z_GATE: "Phase-flip gate (Pauli-Z)",
-            ComponentType.H_GATE: "Hadamard superposition",
-            ComponentType.S_GATE: "Phase gate (√Z)",
-            ComponentType.T_GATE: "π/8 gate (√S)",
-            ComponentType.CNOT_GATE: "Controlled-NOT gate",
-            ComponentType.CZ_GATE: "Controlled-Z gate",
-            ComponentType.SWAP_GATE: "Swap two qubits",
-            ComponentType.PARITY_CHECK: "LDPC parity check node",
-            ComponentType.DATA_QUBIT: "Data qubit (stores info)",
-            ComponentType.ANCILLA_QUBIT: "Ancilla (syndrome helper)",
-            ComponentType.MEASURE: "Measurement operation",
-            ComponentType.RESET: "Reset to |0⟩ state",
-            ComponentType.SURFACE_DATA: "Surface code data qubit (edge)",
-            ComponentType.SURFACE_X_STABILIZER: "X-stabilizer (plaquette)",
-            ComponentType.SURFACE_Z_STABILIZER: "Z-stabilizer (vertex)",
-            ComponentType.SURFACE_BOUNDARY: "Lattice boundary marker",
-        }
-        
-        desc = descriptions.get(comp_type, "Quantum component")
+        desc = _LEGEND_DESCRIPTIONS.get(comp_type, "Quantum component")
         desc_label = tk.Label(text_frame, text=desc,
                             font=('Segoe UI', 7),
                             fg='#888888', bg='#0f0f23', anchor='w')
         desc_label.pack(anchor=tk.W)
     
-    def _draw_mini_cube(self, canvas, cx, cy, color, depth=1.0):
+    def _on_legend_yview(self, scrollbar, scrollable_frame, first, last):
+        """Legend scroll callback: update the scrollbar and draw newly visible icons."""
+        scrollbar.set(first, last)
+        self._draw_visible_legend_icons(scrollable_frame, float(first), float(last))
+    
+    def _draw_visible_legend_icons(self, scrollable_frame, first: float, last: float,
+                                   margin: int = 40) -> None:
+        """
+        Draw pending legend icons whose rows intersect the visible band.
+        
+        Args:
+            scrollable_frame: Frame holding the legend rows
+            first, last: Visible fraction of the frame, as passed to yscrollcommand
+            margin: Extra pixels above and below the band to draw ahead of scrolling
+        """
+        if not self._legend_pending_icons:
+            return
+        content_height = scrollable_frame.winfo_height()
+        if content_height <= 1:
+            return  # Not laid out yet; the next yscrollcommand will retry
+        top = first * content_height - margin
+        bottom = last * content_height + margin
+        
+        pending = []
+        for item_frame, draw in self._legend_pending_icons:
+            y = item_frame.winfo_y()
+            if y + item_frame.winfo_height() >= top and y <= bottom:
+                draw()
+            else:
+                pending.append((item_frame, draw))
+        self._legend_pending_icons = pending
+    
+    def _draw_mini_cube(self, canvas, cx, cy, color, depth=1.0, tags=()):
         """Draw a small isometric cube on a canvas for the legend.
         
         Args:
@@ -9124,174 +8599,187 @@ class CircuitBuilder3D:
             cx, cy: Center position
             color: RGB color tuple
             depth: Depth multiplier (2.0 for two-qubit gates)
+            tags: Canvas tags applied to every face
         """
-        # Mini isometric projection
-        size = 12
-        size_depth = size * depth  # Extend in Y direction for two-qubit gates
-        cos30 = math.cos(math.radians(30))
-        sin30 = math.sin(math.radians(30))
-        
-        # Calculate vertices for mini cube
-        def project(x, y, z):
-            iso_x = (x - y) * cos30 + cx
-            iso_y = (x + y) * sin30 - z + cy
-            return iso_x, iso_y
-        
-        # 8 vertices of the cube (depth extended for two-qubit gates)
-        v = [
-            project(0, 0, 0),                # 0: bottom-front-left
-            project(size, 0, 0),             # 1: bottom-front-right
-            project(size, size_depth, 0),    # 2: bottom-back-right
-            project(0, size_depth, 0),       # 3: bottom-back-left
-            project(0, 0, size),             # 4: top-front-left
-            project(size, 0, size),          # 5: top-front-right
-            project(size, size_depth, size), # 6: top-back-right
-            project(0, size_depth, size),    # 7: top-back-left
-        ]
-        
-        # Helper to brighten color
-        def brighten(c, factor):
-            return tuple(min(1.0, x * factor) for x in c)
-        
-        def to_hex(c):
-            return f"#{int(c[0]*255):02x}{int(c[1]*255):02x}{int(c[2]*255):02x}"
-        
-        # Draw all 6 faces (back to front, Painter's Algorithm)
-        outline = '#444'
-        
-        # Bottom face (darkest)
-        canvas.create_polygon(v[0][0], v[0][1], v[1][0], v[1][1],
-                             v[2][0], v[2][1], v[3][0], v[3][1],
-                             fill=to_hex(brighten(color, 0.5)), outline=outline)
-        
-        # Back-right face (facing +y)
-        canvas.create_polygon(v[2][0], v[2][1], v[3][0], v[3][1],
-                             v[7][0], v[7][1], v[6][0], v[6][1],
-                             fill=to_hex(brighten(color, 0.6)), outline=outline)
-        
-        # Back-left face (facing +x)
-        canvas.create_polygon(v[1][0], v[1][1], v[2][0], v[2][1],
-                             v[6][0], v[6][1], v[5][0], v[5][1],
-                             fill=to_hex(brighten(color, 0.55)), outline=outline)
-        
-        # Left face (front-left)
-        canvas.create_polygon(v[0][0], v[0][1], v[3][0], v[3][1], 
-                             v[7][0], v[7][1], v[4][0], v[4][1],
-                             fill=to_hex(brighten(color, 0.7)), outline=outline)
-        
-        # Right face (front-right)
-        canvas.create_polygon(v[0][0], v[0][1], v[1][0], v[1][1],
-                             v[5][0], v[5][1], v[4][0], v[4][1],
-                             fill=to_hex(brighten(color, 0.85)), outline=outline)
-        
-        # Top face (lightest)
-        canvas.create_polygon(v[4][0], v[4][1], v[5][0], v[5][1],
-                             v[6][0], v[6][1], v[7][0], v[7][1],
-                             fill=to_hex(brighten(color, 1.1)), outline=outline)
-    
-    def _draw_mini_flat(self, canvas, cx, cy, color, comp_type: ComponentType):
+        # Face coordinates depend only on the centre and depth, so are shared
+        face_coords = _mini_cube_faces(cx, cy, depth)
+        
+        # Draw all 6 faces (back to front, Painter's Algorithm) in one Tcl batch,
+        # with the per-color face fills the renderer already caches
+        fills = IsometricRenderer._face_hexes(tuple(color))
+        self._run_canvas_batch(canvas, [
+            ('polygon', coords, {'fill': fill, 'outline': '#444'})
+            for coords, fill in zip(face_coords, fills)
+        ], tags=tags)
+    
+    def _draw_mini_flat(self, canvas, cx, cy, color, comp_type: ComponentType, tags=()):
         """Draw a flat 2D shape for components in the legend (surface mode).
         
+        The icon's canvas items are collected first and created with a single
+        Tcl script via _run_canvas_batch.
+        
         Args:
             canvas: Canvas to draw on
             cx, cy: Center position
             color: RGB color tuple
             comp_type: The component type to determine shape
+            tags: Canvas tags applied to every item of the icon
         """
         def to_hex(c):
             return f"#{int(c[0]*255):02x}{int(c[1]*255):02x}{int(c[2]*255):02x}"
         
-        outline = '#444'
         fill_color = to_hex(color)
-        size = 12
+        coords = self._legend_coords
+        bbox = coords(self._BBOX_OFFSETS, cx, cy)
+        shape = dict(self._LEGEND_SHAPE_KW, fill=fill_color)
+        items = []
         
         if comp_type == ComponentType.SURFACE_DATA:
             # Data qubits are circles (like on lattice edges)
-            canvas.create_oval(cx - size, cy - size, cx + size, cy + size,
-                             fill=fill_color, outline=outline, width=2)
+            items.append(('oval', bbox, shape))
         elif comp_type == ComponentType.SURFACE_X_STABILIZER:
             # X-stabilizers are squares with "X" label
-            canvas.create_rectangle(cx - size, cy - size, cx + size, cy + size,
-                                   fill=fill_color, outline=outline, width=2)
-            canvas.create_text(cx, cy, text="X", fill="#ffffff", 
-                             font=("Arial", 10, "bold"))
+            items.append(('rectangle', bbox, shape))
+            items.append(('text', (cx, cy), {'text': "X", **self._LEGEND_LABEL_KW}))
         elif comp_type == ComponentType.SURFACE_Z_STABILIZER:
             # Z-stabilizers are squares with "Z" label  
-            canvas.create_rectangle(cx - size, cy - size, cx + size, cy + size,
-                                   fill=fill_color, outline=outline, width=2)
-            canvas.create_text(cx, cy, text="Z", fill="#ffffff",
-                             font=("Arial", 10, "bold"))
+            items.append(('rectangle', bbox, shape))
+            items.append(('text', (cx, cy), {'text': "Z", **self._LEGEND_LABEL_KW}))
         elif comp_type == ComponentType.SURFACE_BOUNDARY:
             # Boundaries are thick lines
-            canvas.create_line(cx - size, cy, cx + size, cy,
-                             fill=fill_color, width=4)
-            canvas.create_line(cx - size, cy - 4, cx - size, cy + 4,
-                             fill=fill_color, width=2)
-            canvas.create_line(cx + size, cy - 4, cx + size, cy + 4,
-                             fill=fill_color, width=2)
+            items.append(('line', coords(self._BOUNDARY_OFFSETS, cx, cy),
+                          {'fill': fill_color, 'width': 4}))
+            items.append(('line', coords(self._BOUNDARY_CAP_LEFT_OFFSETS, cx, cy),
+                          {'fill': fill_color, 'width': 2}))
+            items.append(('line', coords(self._BOUNDARY_CAP_RIGHT_OFFSETS, cx, cy),
+                          {'fill': fill_color, 'width': 2}))
         elif comp_type in [ComponentType.DATA_QUBIT, ComponentType.ANCILLA_QUBIT]:
             # Qubits as circles
-            canvas.create_oval(cx - size, cy - size, cx + size, cy + size,
-                             fill=fill_color, outline=outline, width=2)
+            items.append(('oval', bbox, shape))
         elif comp_type in [ComponentType.H_GATE, ComponentType.X_GATE, ComponentType.Y_GATE,
                           ComponentType.Z_GATE, ComponentType.S_GATE, ComponentType.T_GATE]:
             # Single-qubit gates as rounded rectangles with letter
-            canvas.create_rectangle(cx - size, cy - size, cx + size, cy + size,
-                                   fill=fill_color, outline=outline, width=2)
+            items.append(('rectangle', bbox, shape))
             # Get the gate letter from the name (first character)
             gate_letter = comp_type.value[0].upper()
-            canvas.create_text(cx, cy, text=gate_letter, fill="#ffffff",
-                             font=("Arial", 10, "bold"))
+            items.append(('text', (cx, cy), {'text': gate_letter, **self._LEGEND_LABEL_KW}))
         elif comp_type == ComponentType.CNOT_GATE:
             # CNOT as circle with plus (control-target)
-            canvas.create_oval(cx - size, cy - size, cx + size, cy + size,
-                             fill=fill_color, outline=outline, width=2)
-            canvas.create_line(cx - 6, cy, cx + 6, cy, fill="#ffffff", width=2)
-            canvas.create_line(cx, cy - 6, cx, cy + 6, fill="#ffffff", width=2)
+            items.append(('oval', bbox, shape))
+            items.extend(self._overlay_items('plus', cx, cy))
         elif comp_type in [ComponentType.CZ_GATE, ComponentType.SWAP_GATE]:
             # Two-qubit gates as connected dots
-            canvas.create_oval(cx - size + 4, cy - 6, cx - 4, cy + 6,
-                             fill=fill_color, outline=outline, width=2)
-            canvas.create_oval(cx + 4, cy - 6, cx + size - 4, cy + 6,
-                             fill=fill_color, outline=outline, width=2)
-            canvas.create_line(cx - 4, cy, cx + 4, cy, fill=fill_color, width=2)
+            items.append(('oval', coords(self._DOT_LEFT_OFFSETS, cx, cy), shape))
+            items.append(('oval', coords(self._DOT_RIGHT_OFFSETS, cx, cy), shape))
+            items.append(('line', coords(self._DOT_LINK_OFFSETS, cx, cy), {'fill': fill_color, 'width': 2}))
         elif comp_type == ComponentType.MEASURE:
             # Measurement as dial/meter icon
-            canvas.create_arc(cx - size, cy - size, cx + size, cy + size,
-                            start=0, extent=180, fill=fill_color, outline=outline, width=2)
-            canvas.create_line(cx, cy, cx + 6, cy - 8, fill="#ffffff", width=2)
+            items.append(('arc', bbox, dict(shape, start=0, extent=180)))
+            items.append(('line', coords(self._NEEDLE_OFFSETS, cx, cy), self._LEGEND_MARK_KW))
         elif comp_type == ComponentType.RESET:
             # Reset as |0⟩ symbol
-            canvas.create_rectangle(cx - size, cy - size, cx + size, cy + size,
-                                   fill=fill_color, outline=outline, width=2)
-            canvas.create_text(cx, cy, text="0", fill="#ffffff",
-                             font=("Arial", 10, "bold"))
-        elif comp_type == ComponentType.PARITY_CHECK:
-            # Parity check as diamond
-            points = [cx, cy - size, cx + size, cy, cx, cy + size, cx - size, cy]
-            canvas.create_polygon(points, fill=fill_color, outline=outline, width=2)
+            items.append(('rectangle', bbox, shape))
+            items.append(('text', (cx, cy), {'text': "0", **self._LEGEND_LABEL_KW}))
+        elif comp_type in self._POLY_TEMPLATES:
+            # N-gon icons (parity check diamond) from precomputed vertex templates
+            items.append(('polygon', coords(self._POLY_TEMPLATES[comp_type], cx, cy), shape))
         elif comp_type == ComponentType.SURFACE_X_ERROR:
             # X error as circle with X mark
-            canvas.create_oval(cx - size, cy - size, cx + size, cy + size,
-                             fill=fill_color, outline=outline, width=2)
-            canvas.create_line(cx - 6, cy - 6, cx + 6, cy + 6, fill="#ffffff", width=2)
-            canvas.create_line(cx - 6, cy + 6, cx + 6, cy - 6, fill="#ffffff", width=2)
+            items.append(('oval', bbox, shape))
+            items.extend(self._overlay_items('cross', cx, cy))
         elif comp_type == ComponentType.SURFACE_Z_ERROR:
             # Z error as circle with Z mark
-            canvas.create_oval(cx - size, cy - size, cx + size, cy + size,
-                             fill=fill_color, outline=outline, width=2)
-            canvas.create_text(cx, cy, text="Z", fill="#ffffff",
-                             font=("Arial", 9, "bold"))
+            items.append(('oval', bbox, shape))
+            items.append(('text', (cx, cy), {'text': "Z", **self._LEGEND_ERROR_LABEL_KW}))
         elif comp_type == ComponentType.SURFACE_Y_ERROR:
-            # Y error as circle with Y mark
-            canvas.create_oval(cx - size, cy - size, cx + size, cy + size,
-                             fill=fill_color, outline=outline, width=2)
-            canvas.create_text(cx, cy, text="Y", fill="#000000",  # Black text on yellow
-                             font=("Arial", 9, "bold"))
+            # Y error as circle with Y mark (black text on yellow)
+            items.append(('oval', bbox, shape))
+            items.append(('text', (cx, cy), {'text': "Y", **self._LEGEND_ERROR_LABEL_DARK_KW}))
         else:
             # Default: simple square
-            canvas.create_rectangle(cx - size, cy - size, cx + size, cy + size,
-                                   fill=fill_color, outline=outline, width=2)
+            items.append(('rectangle', bbox, shape))
+        
+        self._run_canvas_batch(canvas, items, tags=tags)
+    
+    def _overlay_items(self, name: str, cx: float, cy: float) -> List[Tuple]:
+        """
+        Return batch items for a white legend overlay mark centred on (cx, cy).
+        
+        Uses one antialiased image item when Pillow is available, otherwise
+        falls back to one 2px line item per segment.
+        """
+        image = self._get_overlay_image(name)
+        if image is not None:
+            return [('image', (cx, cy), {'image': image})]
+        return [('line', self._legend_coords(segment, cx, cy), self._LEGEND_MARK_KW)
+                for segment in self._OVERLAY_SEGMENTS[name]]
+    
+    def _prebuild_legend_atlas(self) -> None:
+        """Render all legend overlay images ahead of the first legend open."""
+        for name in self._OVERLAY_SEGMENTS:
+            self._get_overlay_image(name)
+    
+    def _get_overlay_image(self, name: str):
+        """Render (once) and return the overlay PhotoImage, or None without Pillow."""
+        if name in self._overlay_images:
+            return self._overlay_images[name]
+        try:
+            from PIL import Image, ImageDraw, ImageTk
+        except ImportError:
+            self._overlay_images[name] = None
+            return None
+        
+        # Draw supersampled, then downsample for antialiased strokes
+        size, scale = self._OVERLAY_SIZE, 4
+        half = size // 2
+        big = Image.new('RGBA', (size * scale, size * scale), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(big)
+        for x0, y0, x1, y1 in self._OVERLAY_SEGMENTS[name]:
+            draw.line([((x0 + half) * scale, (y0 + half) * scale),
+                       ((x1 + half) * scale, (y1 + half) * scale)],
+                      fill=(255, 255, 255, 255), width=2 * scale)
+        image = ImageTk.PhotoImage(big.resize((size, size), Image.LANCZOS), master=self.root)
+        self._overlay_images[name] = image
+        return image
+    
+    @staticmethod
+    def _tcl_word(value) -> str:
+        """Format a Python option value as a single braced Tcl word."""
+        if isinstance(value, (tuple, list)):
+            value = ' '.join(str(v) for v in value)
+        return f"{{{value}}}"
+    
+    @classmethod
+    def _run_canvas_batch(cls, canvas, items, tags=()) -> None:
+        """Create several canvas items with one Tcl round-trip.
+        
+        Args:
+            canvas: Target canvas widget
+            items: Iterable of (item_type, coords, options) tuples, mirroring
+                canvas.create_<item_type>(*coords, **options)
+            tags: Canvas tags added to every created item
+        """
+        widget = str(canvas)
+        tag_opt = f" -tags {cls._tcl_word(tags)}" if tags else ""
+        lines = []
+        for item_type, item_coords, options in items:
+            opts = ' '.join(f"-{key} {cls._tcl_word(val)}" for key, val in options.items()) + tag_opt
+            lines.append(f"{widget} create {item_type} {' '.join(map(str, item_coords))} {opts}")
+        if lines:
+            canvas.tk.eval('\n'.join(lines))
+    
+    @staticmethod
+    def _translate(offsets: Tuple[int, ...], cx: float, cy: float) -> Tuple[float, ...]:
+        """Shift a flat (x0, y0, x1, y1, ...) offset template to centre (cx, cy)."""
+        return tuple(o + cx if i % 2 == 0 else o + cy for i, o in enumerate(offsets))
+    
+    def _legend_coords(self, offsets: Tuple[int, ...], cx: float, cy: float) -> Tuple[float, ...]:
+        """Return translated legend icon coordinates, computed once per centre."""
+        key = (offsets, cx, cy)
+        coords = self._legend_coord_cache.get(key)
+        if coords is None:
+            coords = self._legend_coord_cache[key] = self._translate(offsets, cx, cy)
+        return coords
     
     def run(self):
         """Start the application main loop."""
@@ -9302,6 +8790,11 @@ class CircuitBuilder3D:
         self._log_status("IMPROVEMENT: Grid boundaries enforced - components cannot be placed outside grid")
         self._log_status("IMPROVEMENT: Component stacking prevented - only one component per grid position")
         
+        # Warm caches while the event loop is idle so the first legend and
+        # tutorial open without build-up work
+        self.root.after_idle(self._prebuild_legend_atlas)
+        self.root.after_idle(TutorialScreen._get_steps)
+        
         # Show tutorial on startup if enabled
         if TutorialScreen.should_show_tutorial():
             # Schedule tutorial to show after main window is displayed
@@ -5,11 +5,14 @@ This module handles the 2.5D isometric projection of 3D components
 onto a 2D tkinter canvas.
 Author: Jeffrey Morais"""
 
+import functools
 import math
 import tkinter as tk
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
-from ..config import DEFAULT_CONFIG
+import numpy as np
+
+from ...config import DEFAULT_CONFIG
 
 
 class IsometricRenderer:
@@ -20,6 +23,23 @@ class IsometricRenderer:
     projections and render quantum circuit components as 3D blocks.
     """
     
+    # Unit-cube corners as multipliers of (width, depth, height):
+    # 0-3 bottom front-left, front-right, back-right, back-left; 4-7 the same on top
+    _UNIT_VERTS = (
+        (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+        (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+    )
+    _UNIT_ARRAY = np.array(_UNIT_VERTS, dtype=float)
+    
+    # Cube faces in back-to-front draw order (Painter's Algorithm):
+    # bottom, back-right, back-left, left, right, top
+    _FACE_INDICES = (
+        (0, 1, 2, 3), (2, 3, 7, 6), (1, 2, 6, 5),
+        (0, 3, 7, 4), (0, 1, 5, 4), (4, 5, 6, 7),
+    )
+    _FACE_ARRAY = np.array(_FACE_INDICES)
+    _FACE_BRIGHTNESS = (0.5, 0.6, 0.55, 0.7, 0.85, 1.1)
+    
     def __init__(self, canvas: tk.Canvas, scale: float = None, config=None):
         """
         Initialize the isometric renderer.
@@ -31,13 +51,26 @@ class IsometricRenderer:
         """
         self.canvas = canvas
         self.config = config or DEFAULT_CONFIG
-        self.scale = scale or self.config.grid.default_scale
-        self.offset_x = self.config.grid.default_offset_x
-        self.offset_y = self.config.grid.default_offset_y
         
         # Isometric projection angles (30 degrees)
         self.cos_30 = math.cos(math.radians(30))
         self.sin_30 = math.sin(math.radians(30))
+        
+        self.scale = scale or self.config.grid.default_scale
+        self.offset_x = self.config.grid.default_offset_x
+        self.offset_y = self.config.grid.default_offset_y
+    
+    @property
+    def scale(self) -> float:
+        """Pixels per grid unit."""
+        return self._scale
+    
+    @scale.setter
+    def scale(self, value: float) -> None:
+        # Keep the combined projection factors in step with zooming
+        self._scale = value
+        self._kx = self.cos_30 * value
+        self._ky = self.sin_30 * value
     
     def project_3d_to_2d(self, x: float, y: float, z: float) -> Tuple[float, float]:
         """
@@ -49,10 +82,53 @@ class IsometricRenderer:
         Returns:
             Tuple of 2D screen coordinates
         """
-        iso_x = (x - y) * self.cos_30 * self.scale + self.offset_x
-        iso_y = (x + y) * self.sin_30 * self.scale - z * self.scale + self.offset_y
+        iso_x = (x - y) * self._kx + self.offset_x
+        iso_y = (x + y) * self._ky - z * self._scale + self.offset_y
         return iso_x, iso_y
     
+    def project_batch(self, verts: np.ndarray) -> np.ndarray:
+        """
+        Project many 3D points at once.
+        
+        Args:
+            verts: Array of shape (N, 3) with x, y, z columns
+            
+        Returns:
+            Array of shape (N, 2) with screen x, y columns
+        """
+        xs, ys, zs = verts[:, 0], verts[:, 1], verts[:, 2]
+        return np.stack(((xs - ys) * self._kx + self.offset_x,
+                         (xs + ys) * self._ky - zs * self._scale + self.offset_y), axis=1)
+    
+    def project_cubes(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Project the eight corners of many cubes at once.
+        
+        Args:
+            boxes: Array of shape (N, 6) with x, y, z, width, height, depth
+                columns, matching the draw_cube arguments
+            
+        Returns:
+            Array of shape (N, 8, 2) with corners in _UNIT_VERTS order
+        """
+        origins = boxes[:, None, :3]
+        extents = boxes[:, None, [3, 5, 4]]  # width along x, depth along y, height along z
+        corners = origins + self._UNIT_ARRAY * extents
+        return self.project_batch(corners.reshape(-1, 3)).reshape(-1, 8, 2)
+    
+    def project_cube_faces(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Flat polygon coordinates for the six faces of many cubes.
+        
+        Args:
+            boxes: Array of shape (N, 6), as for project_cubes
+            
+        Returns:
+            Array of shape (N, 6, 8): x1, y1, ..., x4, y4 per face in
+            _FACE_INDICES order, ready to pass to create_polygon
+        """
+        return self.project_cubes(boxes)[:, self._FACE_ARRAY].reshape(-1, 6, 8)
+    
     def screen_to_grid(self, screen_x: float, screen_y: float) -> Tuple[int, int]:
         """
         Convert screen coordinates to grid coordinates.
@@ -79,7 +155,8 @@ class IsometricRenderer:
     def draw_cube(self, x: float, y: float, z: float, 
                   width: float, height: float, depth: float,
                   color: Tuple[float, float, float], 
-                  outline: str = "#333333") -> List[int]:
+                  outline: str = "#333333",
+                  faces: Sequence[Sequence[float]] = None) -> List[int]:
         """
         Draw a 3D cube using isometric projection.
         
@@ -93,97 +170,71 @@ class IsometricRenderer:
             width, height, depth: Cube dimensions (width=x, height=z, depth=y)
             color: RGB color tuple (0-1 range)
             outline: Outline color hex string
+            faces: Face coordinates already computed by project_cube_faces, if any
             
         Returns:
             List of canvas item IDs for the rendered cube
         """
-        # Define cube vertices
-        vertices = [
-            (x, y, z),                          # 0: bottom-front-left
-            (x + width, y, z),                  # 1: bottom-front-right
-            (x + width, y + depth, z),          # 2: bottom-back-right
-            (x, y + depth, z),                  # 3: bottom-back-left
-            (x, y, z + height),                 # 4: top-front-left
-            (x + width, y, z + height),         # 5: top-front-right
-            (x + width, y + depth, z + height), # 6: top-back-right
-            (x, y + depth, z + height)          # 7: top-back-left
-        ]
-        
-        # Project vertices to 2D
-        projected = [self.project_3d_to_2d(*v) for v in vertices]
-        
+        if faces is None:
+            # Scale and translate the unit-cube template, then project to 2D
+            # with the projection factors hoisted into locals
+            kx, ky, kz = self._kx, self._ky, self._scale
+            ox, oy = self.offset_x, self.offset_y
+            projected = []
+            for ux, uy, uz in self._UNIT_VERTS:
+                vx, vy = x + ux * width, y + uy * depth
+                projected.append(((vx - vy) * kx + ox, (vx + vy) * ky - (z + uz * height) * kz + oy))
+            faces = [[c for i in face for c in projected[i]] for face in self._FACE_INDICES]
+        
+        # Draw all 6 faces from back to front, darkest (bottom) to lightest (top);
+        # each face's flat coordinate list goes to Tk as a single argument
         items = []
-        
-        # Draw all 6 faces from back to front (Painter's Algorithm)
-        
-        # Bottom face (darkest)
-        bottom_color = self._brighten_color(color, 0.5)
-        bottom_hex = self._rgb_to_hex(bottom_color)
-        items.append(self.canvas.create_polygon(
-            projected[0][0], projected[0][1],
-            projected[1][0], projected[1][1],
-            projected[2][0], projected[2][1],
-            projected[3][0], projected[3][1],
-            fill=bottom_hex, outline=outline, width=1
-        ))
-        
-        # Back-right face
-        back_right_color = self._brighten_color(color, 0.6)
-        back_right_hex = self._rgb_to_hex(back_right_color)
-        items.append(self.canvas.create_polygon(
-            projected[2][0], projected[2][1],
-            projected[3][0], projected[3][1],
-            projected[7][0], projected[7][1],
-            projected[6][0], projected[6][1],
-            fill=back_right_hex, outline=outline, width=1
-        ))
-        
-        # Back-left face
-        back_left_color = self._brighten_color(color, 0.55)
-        back_left_hex = self._rgb_to_hex(back_left_color)
-        items.append(self.canvas.create_polygon(
-            projected[1][0], projected[1][1],
-            projected[2][0], projected[2][1],
-            projected[6][0], projected[6][1],
-            projected[5][0], projected[5][1],
-            fill=back_left_hex, outline=outline, width=1
-        ))
-        
-        # Left face (front-left)
-        left_color = self._brighten_color(color, 0.7)
-        left_hex = self._rgb_to_hex(left_color)
-        items.append(self.canvas.create_polygon(
-            projected[0][0], projected[0][1],
-            projected[3][0], projected[3][1],
-            projected[7][0], projected[7][1],
-            projected[4][0], projected[4][1],
-            fill=left_hex, outline=outline, width=1
-        ))
-        
-        # Right face (front-right)
-        right_color = self._brighten_color(color, 0.85)
-        right_hex = self._rgb_to_hex(right_color)
-        items.append(self.canvas.create_polygon(
-            projected[0][0], projected[0][1],
-            projected[1][0], projected[1][1],
-            projected[5][0], projected[5][1],
-            projected[4][0], projected[4][1],
-            fill=right_hex, outline=outline, width=1
-        ))
-        
-        # Top face (lightest)
-        top_color = self._brighten_color(color, 1.1)
-        top_hex = self._rgb_to_hex(top_color)
-        items.append(self.canvas.create_polygon(
-            projected[4][0], projected[4][1],
-            projected[5][0], projected[5][1],
-            projected[6][0], projected[6][1],
-            projected[7][0], projected[7][1],
-            fill=top_hex, outline=outline, width=1
-        ))
+        for coords, face_hex in zip(faces, self._face_hexes(tuple(color))):
+            items.append(self.canvas.create_polygon(
+                coords, fill=face_hex, outline=outline, width=1
+            ))
         
         return items
     
+    def grid_lines(self, grid_range: int, grid_z: float = -0.05) -> List[Tuple[Tuple[float, ...], bool]]:
+        """
+        Screen-space lines for the isometric grid, merged into straight runs.
+        
+        Each grid row and column is collinear, so it is returned as at most
+        two lines: the first cell edge, which is drawn as boundary, and the
+        rest of the run. Edge rows and columns are a single boundary line.
+        
+        Args:
+            grid_range: Grid spans -grid_range..grid_range on both axes
+            grid_z: Z-position of grid
+            
+        Returns:
+            List of ((x1, y1, x2, y2), is_boundary) tuples
+        """
+        if grid_range <= 0:
+            return []
+        lo, hi = -grid_range, grid_range
+        
+        # Endpoints in grid coordinates first, then one batch projection
+        ends = []
+        boundary = []
+        for k in range(lo, hi + 1):
+            # Row along x at y = k, then column along y at x = k
+            for start, inner, end in (((lo, k), (lo + 1, k), (hi, k)),
+                                      ((k, lo), (k, lo + 1), (k, hi))):
+                if k in (lo, hi):
+                    ends += (start, end)
+                    boundary.append(True)
+                else:
+                    ends += (start, inner, inner, end)
+                    boundary += (True, False)
+        
+        points = np.empty((len(ends), 3))
+        points[:, :2] = ends
+        points[:, 2] = grid_z
+        coords = self.project_batch(points).reshape(-1, 4).tolist()
+        return [(tuple(c), is_boundary) for c, is_boundary in zip(coords, boundary)]
+    
     def draw_grid(self, grid_range: int = None, grid_z: float = -0.05) -> None:
         """
         Draw the isometric grid for circuit mode.
@@ -198,21 +249,9 @@ class IsometricRenderer:
         grid_color = self.config.colors.grid_line
         boundary_color = self.config.colors.grid_boundary
         
-        for i in range(-grid_range, grid_range + 1):
-            for j in range(-grid_range, grid_range + 1):
-                x1, y1 = self.project_3d_to_2d(i, j, grid_z)
-                x2, y2 = self.project_3d_to_2d(i + 1, j, grid_z)
-                x3, y3 = self.project_3d_to_2d(i, j + 1, grid_z)
-                
-                # Use boundary color for edge lines
-                is_boundary = (i == -grid_range or i == grid_range or 
-                              j == -grid_range or j == grid_range)
-                color = boundary_color if is_boundary else grid_color
-                
-                if i < grid_range:
-                    self.canvas.create_line(x1, y1, x2, y2, fill=color, tags="grid")
-                if j < grid_range:
-                    self.canvas.create_line(x1, y1, x3, y3, fill=color, tags="grid")
+        for coords, is_boundary in self.grid_lines(grid_range, grid_z):
+            self.canvas.create_line(*coords, fill=boundary_color if is_boundary else grid_color,
+                                    tags="grid")
     
     def draw_mini_cube(self, canvas: tk.Canvas, cx: float, cy: float, 
                        color: Tuple[float, float, float], depth: float = 1.0) -> None:
@@ -246,31 +285,39 @@ class IsometricRenderer:
         ]
         
         outline = '#444'
+        fills = self._face_hexes(tuple(color))
         
         # Draw faces
         canvas.create_polygon(v[0][0], v[0][1], v[1][0], v[1][1],
                              v[2][0], v[2][1], v[3][0], v[3][1],
-                             fill=self._rgb_to_hex(self._brighten_color(color, 0.5)), outline=outline)
+                             fill=fills[0], outline=outline)
         
         canvas.create_polygon(v[2][0], v[2][1], v[3][0], v[3][1],
                              v[7][0], v[7][1], v[6][0], v[6][1],
-                             fill=self._rgb_to_hex(self._brighten_color(color, 0.6)), outline=outline)
+                             fill=fills[1], outline=outline)
         
         canvas.create_polygon(v[1][0], v[1][1], v[2][0], v[2][1],
                              v[6][0], v[6][1], v[5][0], v[5][1],
-                             fill=self._rgb_to_hex(self._brighten_color(color, 0.55)), outline=outline)
+                             fill=fills[2], outline=outline)
         
         canvas.create_polygon(v[0][0], v[0][1], v[3][0], v[3][1], 
                              v[7][0], v[7][1], v[4][0], v[4][1],
-                             fill=self._rgb_to_hex(self._brighten_color(color, 0.7)), outline=outline)
+                             fill=fills[3], outline=outline)
         
         canvas.create_polygon(v[0][0], v[0][1], v[1][0], v[1][1],
                              v[5][0], v[5][1], v[4][0], v[4][1],
-                             fill=self._rgb_to_hex(self._brighten_color(color, 0.85)), outline=outline)
+                             fill=fills[4], outline=outline)
         
         canvas.create_polygon(v[4][0], v[4][1], v[5][0], v[5][1],
                              v[6][0], v[6][1], v[7][0], v[7][1],
-                             fill=self._rgb_to_hex(self._brighten_color(color, 1.1)), outline=outline)
+                             fill=fills[5], outline=outline)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _face_hexes(color: Tuple[float, float, float]) -> Tuple[str, ...]:
+        """Hex fills for the six cube faces of a base color, in _FACE_INDICES order."""
+        return tuple(IsometricRenderer._rgb_to_hex(IsometricRenderer._brighten_color(color, factor))
+                     for factor in IsometricRenderer._FACE_BRIGHTNESS)
     
     @staticmethod
     def _rgb_to_hex(color: Tuple[float, float, float]) -> str:
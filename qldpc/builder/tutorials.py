@@ -9,15 +9,101 @@ Author: Jeffrey Morais"""
 
 import tkinter as tk
 from tkinter import ttk
+import functools
 import json
 import os
-from typing import Dict, List, Any, Optional, Callable, TYPE_CHECKING
+import sys
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Callable, Tuple, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 if TYPE_CHECKING:
     from .main import CircuitBuilder3D
 
 
+# Step content for every tutorial, keyed by tutorial class name
+TUTORIAL_STEPS_PATH = os.path.join(os.path.dirname(__file__), 'tutorial_steps.json')
+
+
+@functools.lru_cache(maxsize=1)
+def _read_tutorial_steps() -> Dict[str, List[Dict[str, Any]]]:
+    """Parse the tutorial step asset on first use."""
+    with open(TUTORIAL_STEPS_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_tutorial_steps(name: str) -> List[Dict[str, Any]]:
+    """
+    Load the step definitions for one tutorial from the JSON asset.
+    
+    Each step's ``content`` is a list of ``[text, tag]`` spans. The step dicts
+    are fresh copies, so compiling them never alters the cached asset.
+    
+    Args:
+        name: Tutorial class name, e.g. 'TutorialScreen'
+        
+    Returns:
+        List of step dicts with 'title', 'content' and optional 'demo_action'
+    """
+    return [dict(step) for step in _read_tutorial_steps()[name]]
+
+
+def compile_tutorial_steps(steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Flatten each step's ``(text, tag)`` content spans in place.
+    
+    The spans become one flat ``(text, tag, text, tag, ...)`` tuple so a step
+    is rendered with a single ``Text.insert(END, *content)`` call instead of
+    one insert per span. Consecutive spans sharing a tag are merged, and tag
+    names are interned so every step shares a single string object per tag.
+    
+    Args:
+        steps: Tutorial step definitions as returned by _create_tutorial_steps
+        
+    Returns:
+        The same list, with each 'content' entry flattened
+    """
+    for step in steps:
+        step['content'] = tuple(
+            part
+            for tag, spans in groupby(step['content'], key=itemgetter(1))
+            for part in (''.join(text for text, _ in spans), sys.intern(tag))
+        )
+    return steps
+
+
+def screen_dims(root: tk.Misc) -> Tuple[int, int]:
+    """
+    Return ``(width, height)`` of the screen, queried once per root window.
+    
+    Args:
+        root: Window whose screen is measured; the result is cached on it
+    """
+    dims = getattr(root, '_cached_screen_dims', None)
+    if dims is None:
+        dims = root._cached_screen_dims = (root.winfo_screenwidth(), root.winfo_screenheight())
+    return dims
+
+
+def configure_text_tags(text_widget: tk.Text, colors: Dict[str, str],
+                        normal: str = '#cccccc') -> None:
+    """
+    Configure foreground colors for tutorial text tags in one Tcl round-trip.
+    
+    Args:
+        text_widget: Text widget the tags belong to
+        colors: Mapping of tag name to foreground color
+        normal: Foreground color for the 'normal' tag
+    """
+    widget = str(text_widget)
+    tag_colors = dict(colors, normal=normal)
+    text_widget.tk.eval('\n'.join(
+        f"{widget} tag configure {{{tag}}} -foreground {{{color}}}"
+        for tag, color in tag_colors.items()
+    ))
+
+
 class BaseTutorialScreen(ABC):
     """
     Abstract base class for tutorial screens.
@@ -43,6 +129,9 @@ class BaseTutorialScreen(ABC):
         'gate': '#ffaa00',         # Orange for gates
     }
     
+    # Compiled steps per concrete tutorial class (see _get_steps)
+    _steps_cache: Dict[type, List[Dict[str, Any]]] = {}
+    
     def __init__(self, parent: tk.Tk, circuit_builder: 'CircuitBuilder3D' = None,
                  on_complete_callback: Callable[[bool], None] = None):
         """
@@ -99,9 +188,17 @@ class BaseTutorialScreen(ABC):
         """Execute a demo action for the current step."""
         pass
     
+    def _get_steps(self) -> List[Dict[str, Any]]:
+        """Return the compiled steps for this tutorial class, building them on first use."""
+        cls = type(self)
+        steps = self._steps_cache.get(cls)
+        if steps is None:
+            steps = self._steps_cache[cls] = compile_tutorial_steps(self._create_tutorial_steps())
+        return steps
+    
     def show(self):
         """Display the tutorial window."""
-        self.steps = self._create_tutorial_steps()
+        self.steps = self._get_steps()
         
         self.tutorial_window = tk.Toplevel(self.parent)
         self.tutorial_window.title(self.window_title)
@@ -112,7 +209,7 @@ class BaseTutorialScreen(ABC):
         # Position to the left of screen
         self.tutorial_window.update_idletasks()
         x = 50
-        y = (self.tutorial_window.winfo_screenheight() - 520) // 2
+        y = (screen_dims(self.parent)[1] - 520) // 2
         geo = self.window_geometry.split('x')
         self.tutorial_window.geometry(f"{geo[0]}x{geo[1]}+{x}+{y}")
         
@@ -191,9 +288,7 @@ class BaseTutorialScreen(ABC):
         self.content_text.config(yscrollcommand=scrollbar.set)
         
         # Configure text tags for colors
-        for tag_name, color in self.COLORS.items():
-            self.content_text.tag_configure(tag_name, foreground=color)
-        self.content_text.tag_configure('normal', foreground='#cccccc')
+        configure_text_tags(self.content_text, self.COLORS)
     
     def _setup_nav_buttons(self):
         """Set up navigation buttons. Override for custom buttons."""
@@ -266,8 +361,7 @@ class BaseTutorialScreen(ABC):
         self.content_text.config(state='normal')
         self.content_text.delete('1.0', tk.END)
         
-        for text, tag in step_data['content']:
-            self.content_text.insert(tk.END, text, tag)
+        self.content_text.insert(tk.END, *step_data['content'])
         
         self.content_text.config(state='disabled')
         
@@ -343,26 +437,33 @@ class BaseTutorialScreen(ABC):
 
 # Tutorial preference management
 TUTORIAL_CONFIG_FILENAME = '.tutorial_config.json'
+TUTORIAL_CONFIG_PATH = os.path.join(os.path.dirname(__file__), TUTORIAL_CONFIG_FILENAME)
 
 
+@functools.lru_cache(maxsize=1)
 def should_show_tutorial() -> bool:
     """Check if tutorial should be shown based on saved preferences."""
-    config_path = os.path.join(os.path.dirname(__file__), TUTORIAL_CONFIG_FILENAME)
     try:
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
+        if os.path.exists(TUTORIAL_CONFIG_PATH):
+            with open(TUTORIAL_CONFIG_PATH, 'r') as f:
                 config = json.load(f)
                 return config.get('show_tutorial', True)
-    except:
+    except (OSError, json.JSONDecodeError):
         pass
     return True
 
 
 def save_tutorial_preference(show_on_startup: bool):
     """Save the tutorial display preference."""
-    config_path = os.path.join(os.path.dirname(__file__), TUTORIAL_CONFIG_FILENAME)
+    # Skip the disk write when the preference is unchanged
+    if show_on_startup == should_show_tutorial():
+        return
+    # Write to a temp file and swap it in so the config is never left half-written
+    tmp_path = TUTORIAL_CONFIG_PATH + '.tmp'
     try:
-        with open(config_path, 'w') as f:
+        with open(tmp_path, 'w') as f:
             json.dump({'show_tutorial': show_on_startup}, f)
-    except:
+        os.replace(tmp_path, TUTORIAL_CONFIG_PATH)
+    except OSError:
         pass
+    should_show_tutorial.cache_clear()
@@ -5,6 +5,7 @@ This module defines the component types (gates, qubits, stabilizers) and
 the Component3D data class that represents placed components in the circuit.
 Author: Jeffrey Morais"""
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Tuple, Any, Optional
@@ -98,13 +99,22 @@ class ComponentType(Enum):
     @classmethod
     def get_by_value_or_name(cls, identifier: str) -> Optional['ComponentType']:
         """Find a ComponentType by either its value or name."""
-        for ct in cls:
-            if ct.value == identifier or ct.name == identifier:
-                return ct
-        return None
+        return _COMPONENT_TYPE_LOOKUP.get(identifier)
+
+
+# ComponentType by value and by name (earlier members win, as in definition order)
+_COMPONENT_TYPE_LOOKUP: Dict[str, ComponentType] = {}
+for _ct in ComponentType:
+    _COMPONENT_TYPE_LOOKUP.setdefault(_ct.value, _ct)
+    _COMPONENT_TYPE_LOOKUP.setdefault(_ct.name, _ct)
+del _ct
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Component3D:
     """
     Represents a 3D quantum circuit component with position and properties.
@@ -124,14 +134,8 @@ class Component3D:
     rotation: float = 0.0
     size: Tuple[float, float, float] = (1.0, 1.0, 1.0)
     color: Tuple[float, float, float] = (0.5, 0.5, 0.8)
-    connections: List[int] = None
-    properties: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.connections is None:
-            self.connections = []
-        if self.properties is None:
-            self.properties = {}
+    connections: List[int] = field(default_factory=list)
+    properties: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the component to a dictionary."""
@@ -175,8 +179,8 @@ class Component3D:
             rotation=data.get('rotation', 0.0),
             size=size,
             color=color_override if color_override else tuple(data.get('color', (0.5, 0.5, 0.5))),
-            connections=data.get('connections', []),
-            properties=data.get('properties', {})
+            connections=data.get('connections') or [],
+            properties=data.get('properties') or {}
         )
     
     def is_at_position(self, x: int, y: int, tolerance: float = 0.5) -> bool:
@@ -5,8 +5,10 @@ This module handles quantum circuit construction, syndrome calculation,
 error correction decoding, and quantum state simulation.
 Author: Jeffrey Morais"""
 
+import importlib.util
+from collections import defaultdict
 import numpy as np
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import DefaultDict, Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 
 from .components import ComponentType, Component3D
 from .config import DEFAULT_CONFIG
@@ -14,20 +16,44 @@ from .config import DEFAULT_CONFIG
 if TYPE_CHECKING:
     pass
 
-# Quantum computing libraries
-try:
-    from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
-    from qiskit.quantum_info import Statevector, Operator
-    from qiskit_aer import AerSimulator
-    QISKIT_AVAILABLE = True
-except ImportError:
-    QISKIT_AVAILABLE = False
-    QuantumCircuit = None
-    QuantumRegister = None
-    ClassicalRegister = None
+# Quantum computing libraries are imported on first use (see _ensure_qiskit);
+# qiskit_aer dominates import time and is not needed for syndrome decoding.
+QISKIT_AVAILABLE = (importlib.util.find_spec("qiskit") is not None and
+                    importlib.util.find_spec("qiskit_aer") is not None)
+QuantumCircuit = None
+QuantumRegister = None
+ClassicalRegister = None
+transpile = None
+AerSimulator = None
+if not QISKIT_AVAILABLE:
     print("Warning: Qiskit not available. Some quantum computations will be simulated.")
 
 
+def _ensure_qiskit() -> bool:
+    """Import the Qiskit stack on first use; return whether it is usable."""
+    global QISKIT_AVAILABLE, QuantumCircuit, QuantumRegister, ClassicalRegister
+    global transpile, AerSimulator
+    if not QISKIT_AVAILABLE or AerSimulator is not None:
+        return QISKIT_AVAILABLE
+    try:
+        from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
+        from qiskit_aer import AerSimulator
+    except ImportError:
+        QISKIT_AVAILABLE = False
+    return QISKIT_AVAILABLE
+
+
+_QUBIT_TYPES = frozenset({ComponentType.DATA_QUBIT, ComponentType.ANCILLA_QUBIT})
+
+
+def group_by_type(components: List[Component3D]) -> DefaultDict[ComponentType, List[Component3D]]:
+    """Bucket components by component_type in a single pass, preserving order."""
+    groups: DefaultDict[ComponentType, List[Component3D]] = defaultdict(list)
+    for comp in components:
+        groups[comp.component_type].append(comp)
+    return groups
+
+
 class QuantumLDPCProcessor:
     """
     Handles quantum LDPC computations for real-time circuit analysis.
@@ -38,6 +64,21 @@ class QuantumLDPCProcessor:
     - Quantum state evolution
     """
     
+    # QuantumCircuit method names for each gate component
+    _SINGLE_QUBIT_GATES: Dict[ComponentType, str] = {
+        ComponentType.X_GATE: 'x',
+        ComponentType.Z_GATE: 'z',
+        ComponentType.Y_GATE: 'y',
+        ComponentType.H_GATE: 'h',
+        ComponentType.S_GATE: 's',
+        ComponentType.T_GATE: 't',
+    }
+    _TWO_QUBIT_GATES: Dict[ComponentType, str] = {
+        ComponentType.CNOT_GATE: 'cx',
+        ComponentType.CZ_GATE: 'cz',
+        ComponentType.SWAP_GATE: 'swap',
+    }
+    
     def __init__(self, config=None):
         """Initialize the quantum processor."""
         self.config = config or DEFAULT_CONFIG
@@ -45,8 +86,20 @@ class QuantumLDPCProcessor:
         self.current_state = None
         self.syndrome_history: List[np.ndarray] = []
         self.error_corrections: List[Dict[str, Any]] = []
+        # Last built circuit and the component fingerprint it was built from
+        self._circuit_key: Optional[tuple] = None
+        # (built circuit, the same circuit with measurements) from with_measurements
+        self._measured: Optional[Tuple[Any, Any]] = None
+        # Last parity matrix and the check/data layout it was built from
+        self._parity_cache: Optional[Tuple[tuple, np.ndarray]] = None
     
-    def build_circuit_from_components(self, components: List[Component3D]) -> Optional[QuantumCircuit]:
+    @staticmethod
+    def _circuit_fingerprint(components: List[Component3D]) -> tuple:
+        """Everything the circuit build reads from components, in placement order."""
+        return tuple((c.component_type, c.position, c.control_lane, c.target_lane)
+                     for c in components)
+    
+    def build_circuit_from_components(self, components: List[Component3D]) -> Optional['QuantumCircuit']:
         """
         Build a Qiskit quantum circuit from placed components.
         
@@ -57,15 +110,21 @@ class QuantumLDPCProcessor:
             components: List of placed 3D components
             
         Returns:
-            Constructed QuantumCircuit or None if build fails
+            Constructed QuantumCircuit or None if build fails. The circuit
+            is reused while the components are unchanged, so callers must
+            not modify it in place.
         """
-        if not QISKIT_AVAILABLE:
+        if not _ensure_qiskit():
             return self._simulate_circuit_build(components)
         
+        key = self._circuit_fingerprint(components)
+        if key == self._circuit_key and self.circuit is not None:
+            return self.circuit
+        
         try:
             # Build qubit registry: map lane (Y-position) to qubit index
-            qubit_components = [comp for comp in components 
-                               if comp.component_type in [ComponentType.DATA_QUBIT, ComponentType.ANCILLA_QUBIT]]
+            groups = group_by_type(components)
+            qubit_components = groups[ComponentType.DATA_QUBIT] + groups[ComponentType.ANCILLA_QUBIT]
             
             if not qubit_components:
                 print("No qubit components found in circuit")
@@ -86,20 +145,18 @@ class QuantumLDPCProcessor:
             creg = ClassicalRegister(num_qubits, 'c')
             circuit = QuantumCircuit(qreg, creg)
             
-            # Sort components by x-position for temporal ordering
-            sorted_components = sorted(components, key=lambda c: c.position[0])
+            # Drop components on empty lanes (two-qubit gates may still reach
+            # a qubit through their control lane), then sort the rest by
+            # x-position for temporal ordering
+            placed = [comp for comp in components
+                      if comp.position[1] in lane_to_qubit or comp.is_two_qubit]
+            placed.sort(key=lambda c: c.position[0])
             
-            for comp in sorted_components:
-                lane = comp.position[1]
-                # Check if this lane has a qubit (skip components on empty lanes)
-                if lane not in lane_to_qubit:
-                    # For two-qubit gates, check if control lane exists
-                    if not comp.is_two_qubit:
-                        continue
-                
+            for comp in placed:
                 self._add_component_to_circuit(circuit, comp, qreg, creg, lane_to_qubit)
             
             self.circuit = circuit
+            self._circuit_key = key
             return circuit
             
         except Exception as e:
@@ -108,10 +165,10 @@ class QuantumLDPCProcessor:
             traceback.print_exc()
             return None
     
-    def _add_component_to_circuit(self, circuit: QuantumCircuit, 
+    def _add_component_to_circuit(self, circuit: 'QuantumCircuit', 
                                  component: Component3D,
-                                 qreg: QuantumRegister, 
-                                 creg: ClassicalRegister,
+                                 qreg: 'QuantumRegister', 
+                                 creg: 'ClassicalRegister',
                                  lane_to_qubit: Dict[int, int]):
         """
         Add a single component to the quantum circuit.
@@ -135,46 +192,27 @@ class QuantumLDPCProcessor:
         qubit_idx = lane_to_qubit.get(lane, -1)
         
         # Single-qubit gates
-        gate_map = {
-            ComponentType.X_GATE: lambda: circuit.x(qreg[qubit_idx]),
-            ComponentType.Z_GATE: lambda: circuit.z(qreg[qubit_idx]),
-            ComponentType.Y_GATE: lambda: circuit.y(qreg[qubit_idx]),
-            ComponentType.H_GATE: lambda: circuit.h(qreg[qubit_idx]),
-            ComponentType.S_GATE: lambda: circuit.s(qreg[qubit_idx]),
-            ComponentType.T_GATE: lambda: circuit.t(qreg[qubit_idx]),
-        }
-        
-        if comp_type in gate_map and qubit_idx >= 0:
-            gate_map[comp_type]()
+        gate_name = self._SINGLE_QUBIT_GATES.get(comp_type)
+        if gate_name is not None:
+            if qubit_idx >= 0:
+                getattr(circuit, gate_name)(qreg[qubit_idx])
             return
         
         # Two-qubit gates
-        if comp_type in [ComponentType.CNOT_GATE, ComponentType.CZ_GATE, ComponentType.SWAP_GATE]:
+        gate_name = self._TWO_QUBIT_GATES.get(comp_type)
+        if gate_name is not None:
             control_lane = component.control_lane
             target_lane = component.target_lane
             
             if control_lane is not None and target_lane is not None:
                 ctrl_idx = lane_to_qubit.get(control_lane, -1)
                 tgt_idx = lane_to_qubit.get(target_lane, -1)
-                if ctrl_idx >= 0 and tgt_idx >= 0 and ctrl_idx != tgt_idx:
-                    if comp_type == ComponentType.CNOT_GATE:
-                        circuit.cx(qreg[ctrl_idx], qreg[tgt_idx])
-                    elif comp_type == ComponentType.CZ_GATE:
-                        circuit.cz(qreg[ctrl_idx], qreg[tgt_idx])
-                    elif comp_type == ComponentType.SWAP_GATE:
-                        circuit.swap(qreg[ctrl_idx], qreg[tgt_idx])
             else:
                 # Fallback: gate at control lane, target is next lane
-                if qubit_idx >= 0:
-                    target_lane_fallback = lane + 1
-                    tgt_idx = lane_to_qubit.get(target_lane_fallback, -1)
-                    if tgt_idx >= 0 and tgt_idx != qubit_idx:
-                        if comp_type == ComponentType.CNOT_GATE:
-                            circuit.cx(qreg[qubit_idx], qreg[tgt_idx])
-                        elif comp_type == ComponentType.CZ_GATE:
-                            circuit.cz(qreg[qubit_idx], qreg[tgt_idx])
-                        elif comp_type == ComponentType.SWAP_GATE:
-                            circuit.swap(qreg[qubit_idx], qreg[tgt_idx])
+                ctrl_idx = qubit_idx
+                tgt_idx = lane_to_qubit.get(lane + 1, -1)
+            if ctrl_idx >= 0 and tgt_idx >= 0 and ctrl_idx != tgt_idx:
+                getattr(circuit, gate_name)(qreg[ctrl_idx], qreg[tgt_idx])
             return
         
         # Measurement and reset
@@ -185,32 +223,71 @@ class QuantumLDPCProcessor:
     
     def _simulate_circuit_build(self, components: List[Component3D]):
         """Simulate circuit building when Qiskit is not available."""
-        qubit_components = [
-            c for c in components
-            if c.component_type in (ComponentType.DATA_QUBIT, ComponentType.ANCILLA_QUBIT)
-        ]
-        if not qubit_components:
+        qubit_lanes = {c.position[1] for c in components if c.component_type in _QUBIT_TYPES}
+        if not qubit_lanes:
             return None
         return {
-            'num_qubits': len(set(comp.position[1] for comp in qubit_components)),
+            'num_qubits': len(qubit_lanes),
             'num_gates': len(components),
-            'depth': max([comp.position[0] for comp in components], default=0) + 1
+            'depth': max((comp.position[0] for comp in components), default=0) + 1
         }
     
-    def calculate_syndrome(self, components: List[Component3D]) -> np.ndarray:
+    def _parity_matrix(self, parity_checks: List[Component3D],
+                       data_qubits: List[Component3D]) -> np.ndarray:
+        """
+        Build (or reuse) the check/data connection matrix.
+        
+        The matrix only depends on the grid positions of the checks and data
+        qubits, so it is cached against that layout and rebuilt only when a
+        component is placed, moved or removed.
+        """
+        connection_distance = self.config.simulation.parity_connection_distance
+        key = (connection_distance,
+               tuple(c.position[:2] for c in parity_checks),
+               tuple(d.position[:2] for d in data_qubits))
+        if self._parity_cache is not None and self._parity_cache[0] == key:
+            return self._parity_cache[1]
+        
+        num_checks = len(parity_checks)
+        num_data = len(data_qubits)
+        
+        # Simulate connections between parity checks and data qubits with a
+        # simple distance-based rule: connect when the grid Manhattan distance
+        # is within range (broadcast over all check/data pairs)
+        check_xy = np.array(key[1])
+        data_xy = np.array(key[2])
+        distance = np.abs(check_xy[:, None, :] - data_xy[None, :, :]).sum(axis=2)
+        parity_matrix = (distance <= connection_distance).astype(np.int8)
+        
+        # Check if we have any connections
+        if not parity_matrix.any():
+            # If no automatic connections, create a simple pattern
+            for i in range(min(num_checks, num_data)):
+                parity_matrix[i, i] = 1
+                if i + 1 < num_data:
+                    parity_matrix[i, i + 1] = 1
+        
+        self._parity_cache = (key, parity_matrix)
+        return parity_matrix
+    
+    def calculate_syndrome(self, components: List[Component3D],
+                           groups: Optional[Dict[ComponentType, List[Component3D]]] = None) -> np.ndarray:
         """
         Calculate syndrome for current circuit configuration.
         
         Args:
             components: List of placed components
+            groups: group_by_type(components), if the caller already has it
             
         Returns:
             Syndrome vector as numpy array
         """
-        # Extract parity check components
-        parity_checks = [c for c in components if c.component_type == ComponentType.PARITY_CHECK]
-        ancilla_qubits = [c for c in components if c.component_type == ComponentType.ANCILLA_QUBIT]
-        data_qubits = [c for c in components if c.component_type == ComponentType.DATA_QUBIT]
+        # Extract parity check components (one pass over the circuit)
+        if groups is None:
+            groups = group_by_type(components)
+        parity_checks = groups[ComponentType.PARITY_CHECK]
+        ancilla_qubits = groups[ComponentType.ANCILLA_QUBIT]
+        data_qubits = groups[ComponentType.DATA_QUBIT]
         
         # Use ancilla qubits as syndrome extractors if no dedicated parity checks
         if not parity_checks and ancilla_qubits:
@@ -219,54 +296,46 @@ class QuantumLDPCProcessor:
         if not parity_checks or not data_qubits:
             return np.array([])
         
-        # Build parity check matrix
         num_checks = len(parity_checks)
-        num_data = len(data_qubits)
-        
-        parity_matrix = np.zeros((num_checks, num_data), dtype=int)
-        
-        # Simulate connections between parity checks and data qubits
-        connection_distance = self.config.simulation.parity_connection_distance
-        for i, check in enumerate(parity_checks):
-            for j, data in enumerate(data_qubits):
-                # Simple distance-based connection rule
-                distance = abs(check.position[0] - data.position[0]) + abs(check.position[1] - data.position[1])
-                if distance <= connection_distance:
-                    parity_matrix[i, j] = 1
-        
-        # Check if we have any connections
-        if np.sum(parity_matrix) == 0:
-            # If no automatic connections, create a simple pattern
-            for i in range(min(num_checks, num_data)):
-                parity_matrix[i, i] = 1
-                if i + 1 < num_data:
-                    parity_matrix[i, i + 1] = 1
-        
-        # Build error vector from actual X_GATE positions in the circuit
-        error_vector = np.zeros(num_data, dtype=int)
         
-        # Find all X gates and map them to data qubits by Y-coordinate (lane)
-        x_gates = [c for c in components if c.component_type == ComponentType.X_GATE]
-        for x_gate in x_gates:
-            gate_lane = x_gate.position[1]
-            for j, data in enumerate(data_qubits):
-                if data.position[1] == gate_lane:
-                    error_vector[j] = 1
-                    break
-        
-        # Calculate syndrome
-        syndrome = np.dot(parity_matrix, error_vector) % 2
+        # Build error vector from actual X_GATE positions in the circuit,
+        # mapping each gate to the first data qubit on its Y-coordinate (lane)
+        data_by_lane: Dict[int, int] = {}
+        for j, data in enumerate(data_qubits):
+            data_by_lane.setdefault(data.position[1], j)
+        error_vector = np.zeros(len(data_qubits), dtype=bool)
+        for x_gate in groups[ComponentType.X_GATE]:
+            j = data_by_lane.get(x_gate.position[1])
+            if j is not None:
+                error_vector[j] = True
+        
+        if not error_vector.any():
+            # No errors: every check is quiet whatever the connectivity
+            syndrome = np.zeros(num_checks, dtype=int)
+            self.syndrome_history.append(syndrome.copy())
+            return syndrome
+        
+        parity_matrix = self._parity_matrix(parity_checks, data_qubits)
+        
+        # Calculate syndrome: over GF(2) this is the parity of the columns of
+        # errored qubits, so sum just those instead of a full integer product
+        syndrome = parity_matrix[:, error_vector].sum(axis=1) % 2
         
         self.syndrome_history.append(syndrome.copy())
         return syndrome
     
-    def perform_error_correction(self, syndrome: np.ndarray, components: List[Component3D]) -> Dict[str, Any]:
+    def perform_error_correction(self, syndrome: np.ndarray, components: List[Component3D],
+                                 groups: Optional[Dict[ComponentType, List[Component3D]]] = None,
+                                 record_history: bool = False) -> Dict[str, Any]:
         """
         Perform belief propagation decoding for error correction.
         
         Args:
             syndrome: Current syndrome vector
             components: List of circuit components
+            groups: group_by_type(components), if the caller already has it
+            record_history: Keep the beliefs after every iteration under
+                'history' as an (iterations, num_bits) array; otherwise None
             
         Returns:
             Dictionary with correction results
@@ -275,40 +344,46 @@ class QuantumLDPCProcessor:
             return {'success': False, 'error': 'No syndrome available'}
         
         # Count data qubits
-        data_qubits = [c for c in components if c.component_type == ComponentType.DATA_QUBIT]
-        num_bits = len(data_qubits)
+        if groups is not None:
+            num_bits = len(groups[ComponentType.DATA_QUBIT])
+        else:
+            num_bits = sum(1 for c in components if c.component_type == ComponentType.DATA_QUBIT)
         
         if num_bits == 0:
             return {'success': False, 'error': 'No data qubits found'}
         
         # Simple belief propagation simulation
         max_iterations = self.config.simulation.bp_max_iterations
-        convergence_threshold = self.config.simulation.bp_convergence_threshold
+        convergence_threshold_sq = self.config.simulation.bp_convergence_threshold ** 2
         
-        # Initialize belief probabilities
-        beliefs = np.ones(num_bits) * 0.5
+        history = np.empty((max_iterations, num_bits)) if record_history else None
         
-        correction_history = []
+        # The syndrome constraint is the same for every bit and iteration, so
+        # every bit starts at and follows the same belief: iterate that one
+        # value and spread it over the bits afterwards
+        syndrome_weight = np.sum(syndrome) / len(syndrome)
+        belief = 0.5
         
         for iteration in range(max_iterations):
-            old_beliefs = beliefs.copy()
+            old_belief = belief
             
-            # Update beliefs based on syndrome constraints
-            if len(syndrome) > 0:
-                syndrome_weight = np.sum(syndrome) / len(syndrome)
-                for i in range(num_bits):
-                    if syndrome_weight > 0.5:
-                        beliefs[i] = min(0.9, beliefs[i] + syndrome_weight * 0.2)
-                    else:
-                        beliefs[i] = max(0.1, beliefs[i] - (1 - syndrome_weight) * 0.1)
+            # Update belief based on syndrome constraints
+            if syndrome_weight > 0.5:
+                belief = min(0.9, belief + syndrome_weight * 0.2)
+            else:
+                belief = max(0.1, belief - (1 - syndrome_weight) * 0.1)
             
-            beliefs = np.clip(beliefs, 0.01, 0.99)
-            correction_history.append(beliefs.copy())
+            belief = min(max(belief, 0.01), 0.99)
+            if history is not None:
+                history[iteration] = belief
             
-            # Check convergence
-            if np.linalg.norm(beliefs - old_beliefs) < convergence_threshold:
+            # Check convergence (squared L2 step over all bits against squared threshold)
+            step = belief - old_belief
+            if step * step * num_bits < convergence_threshold_sq:
                 break
         
+        beliefs = np.full(num_bits, float(belief))
+        
         # Determine correction
         correction = (beliefs > 0.5).astype(int)
         
@@ -317,7 +392,7 @@ class QuantumLDPCProcessor:
             'correction': correction,
             'beliefs': beliefs,
             'iterations': iteration + 1,
-            'history': correction_history,
+            'history': history[:iteration + 1] if history is not None else None,
             'syndrome_weight': np.sum(syndrome),
             'num_data_qubits': num_bits
         }
@@ -325,6 +400,20 @@ class QuantumLDPCProcessor:
         self.error_corrections.append(result)
         return result
     
+    def with_measurements(self, circuit: 'QuantumCircuit') -> 'QuantumCircuit':
+        """
+        Return circuit with a final measure_all unless it already measures.
+        
+        Measurements go on a copy, since the built circuit is cached; the copy
+        is kept for as long as the same built circuit keeps being simulated.
+        """
+        if self._measured is None or self._measured[0] is not circuit:
+            measured = circuit
+            if 'measure' not in circuit.count_ops():
+                measured = circuit.measure_all(inplace=False)
+            self._measured = (circuit, measured)
+        return self._measured[1]
+    
     def simulate_evolution(self, components: List[Component3D], shots: int = None) -> Dict[str, Any]:
         """
         Simulate quantum state evolution for the circuit.
@@ -344,14 +433,11 @@ class QuantumLDPCProcessor:
         if circuit is None:
             return {'success': False, 'error': 'Failed to build quantum circuit'}
         
-        if QISKIT_AVAILABLE and hasattr(circuit, 'num_qubits'):
+        if hasattr(circuit, 'num_qubits') and _ensure_qiskit():
             try:
                 simulator = AerSimulator()
                 
-                # Add measurements if not present
-                if not any(instr.operation.name == 'measure' for instr in circuit.data):
-                    circuit.measure_all()
-                
+                circuit = self.with_measurements(circuit)
                 transpiled = transpile(circuit, simulator)
                 job = simulator.run(transpiled, shots=shots)
                 result = job.result()
@@ -5,6 +5,8 @@ Covers ComponentType enum classification, Component3D serialization,
 and view mode utilities.
 """
 
+import sys
+
 import pytest
 from qldpc.components import (
     ComponentType, Component3D, ViewMode,
@@ -77,6 +79,19 @@ class TestComponent3D:
         assert comp.connections == []
         assert comp.properties == {}
 
+    def test_default_containers_not_shared(self):
+        a = Component3D(component_type=ComponentType.X_GATE, position=(0, 0, 0))
+        b = Component3D(component_type=ComponentType.X_GATE, position=(1, 0, 0))
+        a.properties['control'] = 1
+        a.connections.append(2)
+        assert b.properties == {}
+        assert b.connections == []
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+")
+    def test_slotted(self):
+        comp = Component3D(component_type=ComponentType.X_GATE, position=(0, 0, 0))
+        assert not hasattr(comp, '__dict__')
+
     def test_serialization_roundtrip(self):
         original = Component3D(
             component_type=ComponentType.H_GATE,
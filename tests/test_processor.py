@@ -6,7 +6,7 @@ Covers QuantumLDPCProcessor initialization and basic operations.
 
 import pytest
 import numpy as np
-from qldpc.processor import QuantumLDPCProcessor, QISKIT_AVAILABLE
+from qldpc.processor import QuantumLDPCProcessor, QISKIT_AVAILABLE, group_by_type
 from qldpc.components import ComponentType, Component3D
 from qldpc.config import Config
 
@@ -48,6 +48,83 @@ class TestProcessorCircuitBuild:
         # Should return a circuit object (Qiskit or simulated)
         assert result is not None
 
+    @pytest.mark.skipif(QISKIT_AVAILABLE, reason="simulated build only without Qiskit")
+    def test_simulated_build_counts_lanes(self):
+        proc = QuantumLDPCProcessor()
+        components = [
+            Component3D(ComponentType.DATA_QUBIT, position=(0, 0, 0)),
+            Component3D(ComponentType.ANCILLA_QUBIT, position=(0, 2, 0)),
+            Component3D(ComponentType.DATA_QUBIT, position=(1, 2, 0)),
+            Component3D(ComponentType.X_GATE, position=(3, 0, 0)),
+        ]
+        result = proc.build_circuit_from_components(components)
+        assert result == {'num_qubits': 2, 'num_gates': 4, 'depth': 4}
+
+    def test_fingerprint_tracks_gate_lanes(self):
+        comp = Component3D(ComponentType.CNOT_GATE, position=(1, 0, 0))
+        before = QuantumLDPCProcessor._circuit_fingerprint([comp])
+        assert QuantumLDPCProcessor._circuit_fingerprint([comp]) == before
+        comp.properties['target'] = 3
+        assert QuantumLDPCProcessor._circuit_fingerprint([comp]) != before
+
+
+class _RecordingCircuit:
+    """Stand-in for QuantumCircuit that records gate calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+
+class TestAddComponentToCircuit:
+    def _add(self, component, lane_to_qubit):
+        circuit = _RecordingCircuit()
+        qreg = list(range(len(lane_to_qubit)))
+        QuantumLDPCProcessor()._add_component_to_circuit(
+            circuit, component, qreg, qreg, lane_to_qubit)
+        return circuit.calls
+
+    def test_single_qubit_gate(self):
+        comp = Component3D(ComponentType.H_GATE, position=(1, 3, 0))
+        assert self._add(comp, {3: 0}) == [('h', (0,))]
+
+    def test_two_qubit_gate_uses_lanes(self):
+        comp = Component3D(ComponentType.CZ_GATE, position=(1, 0, 0),
+                           properties={'control': 2, 'target': 0})
+        assert self._add(comp, {0: 0, 2: 1}) == [('cz', (1, 0))]
+
+    def test_gate_on_empty_lane_skipped(self):
+        comp = Component3D(ComponentType.X_GATE, position=(1, 5, 0))
+        assert self._add(comp, {0: 0}) == []
+
+
+class _OpsCircuit:
+    """Stand-in for QuantumCircuit with just count_ops and measure_all."""
+
+    def __init__(self, ops):
+        self.ops = ops
+
+    def count_ops(self):
+        return dict.fromkeys(self.ops, 1)
+
+    def measure_all(self, inplace=True):
+        return _OpsCircuit(self.ops + ['measure'])
+
+
+class TestWithMeasurements:
+    def test_adds_measurements_once_per_circuit(self):
+        proc = QuantumLDPCProcessor()
+        circuit = _OpsCircuit(['h'])
+        measured = proc.with_measurements(circuit)
+        assert measured is not circuit and 'measure' in measured.ops
+        assert proc.with_measurements(circuit) is measured
+
+    def test_measured_circuit_kept_as_is(self):
+        circuit = _OpsCircuit(['x', 'measure'])
+        assert QuantumLDPCProcessor().with_measurements(circuit) is circuit
+
 
 class TestProcessorSyndrome:
     def test_syndrome_with_components(self):
@@ -77,3 +154,79 @@ class TestProcessorSyndrome:
         ]
         syndrome = proc.calculate_syndrome(components)
         assert isinstance(syndrome, np.ndarray)
+
+    def test_syndrome_values(self):
+        """An X gate on a lane flips every check connected to that lane's data qubit."""
+        proc = QuantumLDPCProcessor()
+        components = [
+            Component3D(ComponentType.DATA_QUBIT, position=(0, 0, 0)),
+            Component3D(ComponentType.X_GATE, position=(2, 0, 0)),
+            Component3D(ComponentType.DATA_QUBIT, position=(0, 5, 0)),
+            Component3D(ComponentType.PARITY_CHECK, position=(1, 0, 0)),
+            Component3D(ComponentType.PARITY_CHECK, position=(1, 5, 0)),
+        ]
+        syndrome = proc.calculate_syndrome(components)
+        assert syndrome.tolist() == [1, 0]
+
+    def test_syndrome_with_precomputed_groups(self):
+        proc = QuantumLDPCProcessor()
+        components = [
+            Component3D(ComponentType.DATA_QUBIT, position=(0, 0, 0)),
+            Component3D(ComponentType.X_GATE, position=(2, 0, 0)),
+            Component3D(ComponentType.PARITY_CHECK, position=(1, 0, 0)),
+        ]
+        groups = group_by_type(components)
+        assert proc.calculate_syndrome(components, groups).tolist() == [1]
+
+    def test_quiet_circuit_gives_zero_syndrome(self):
+        proc = QuantumLDPCProcessor()
+        components = [
+            Component3D(ComponentType.DATA_QUBIT, position=(0, 0, 0)),
+            Component3D(ComponentType.PARITY_CHECK, position=(1, 0, 0)),
+            Component3D(ComponentType.PARITY_CHECK, position=(1, 4, 0)),
+        ]
+        assert proc.calculate_syndrome(components).tolist() == [0, 0]
+        assert len(proc.syndrome_history) == 1
+
+    def test_parity_matrix_cached_until_layout_changes(self):
+        proc = QuantumLDPCProcessor()
+        check = Component3D(ComponentType.PARITY_CHECK, position=(1, 0, 0))
+        data = Component3D(ComponentType.DATA_QUBIT, position=(0, 0, 0))
+        matrix = proc._parity_matrix([check], [data])
+        assert proc._parity_matrix([check], [data]) is matrix
+        check.position = (1, 4, 0)
+        assert proc._parity_matrix([check], [data]) is not matrix
+
+
+class TestProcessorErrorCorrection:
+    def _data_qubits(self, n):
+        return [Component3D(ComponentType.DATA_QUBIT, position=(0, i, 0)) for i in range(n)]
+
+    def test_empty_syndrome_fails(self):
+        result = QuantumLDPCProcessor().perform_error_correction(np.array([]), self._data_qubits(2))
+        assert result['success'] is False
+
+    def test_no_data_qubits_fails(self):
+        result = QuantumLDPCProcessor().perform_error_correction(np.array([1]), [])
+        assert result['success'] is False
+
+    def test_quiet_syndrome_converges_low(self):
+        result = QuantumLDPCProcessor().perform_error_correction(np.array([0, 0]), self._data_qubits(3))
+        assert np.allclose(result['beliefs'], 0.1)
+        assert result['correction'].tolist() == [0, 0, 0]
+        assert result['iterations'] == 5
+
+    def test_loud_syndrome_flags_all_bits(self):
+        result = QuantumLDPCProcessor().perform_error_correction(np.array([1, 1]), self._data_qubits(3))
+        assert np.allclose(result['beliefs'], 0.9)
+        assert result['correction'].tolist() == [1, 1, 1]
+
+    def test_history_is_opt_in(self):
+        proc = QuantumLDPCProcessor()
+        result = proc.perform_error_correction(np.array([0, 0]), self._data_qubits(3))
+        assert result['history'] is None
+        result = proc.perform_error_correction(np.array([0, 0]), self._data_qubits(3),
+                                               record_history=True)
+        assert result['history'].shape == (result['iterations'], 3)
+        assert np.allclose(result['history'][0], 0.4)
+        assert np.allclose(result['history'][-1], result['beliefs'])
@@ -0,0 +1,81 @@
+"""
+Tests for qldpc.builder.renderers.isometric module.
+
+Covers the isometric projection helpers (no canvas drawing).
+"""
+
+import pytest
+import numpy as np
+from qldpc.builder.renderers.isometric import IsometricRenderer
+
+
+class TestProjection:
+    def test_origin_maps_to_offset(self):
+        renderer = IsometricRenderer(canvas=None)
+        assert renderer.project_3d_to_2d(0, 0, 0) == (renderer.offset_x, renderer.offset_y)
+
+    def test_batch_matches_scalar(self):
+        renderer = IsometricRenderer(canvas=None)
+        verts = np.array([[0, 0, 0], [1, 2, 3], [-4, 5, 0.5]], dtype=float)
+        expected = [renderer.project_3d_to_2d(*v) for v in verts]
+        assert np.allclose(renderer.project_batch(verts), expected)
+
+    def test_scale_change_updates_projection(self):
+        renderer = IsometricRenderer(canvas=None, scale=10.0)
+        renderer.scale = 20.0
+        x, y = renderer.project_3d_to_2d(0, 0, 1)
+        assert y == pytest.approx(renderer.offset_y - 20.0)
+
+    def test_cube_batch_matches_draw_cube(self):
+        class RecordingCanvas:
+            def __init__(self):
+                self.polygons = []
+
+            def create_polygon(self, *coords, **kwargs):
+                self.polygons.append(coords)
+                return len(self.polygons)
+
+        renderer = IsometricRenderer(canvas=RecordingCanvas())
+        box = (2, -1, 0, 1.0, 2.0, 1.5)
+        renderer.draw_cube(*box, color=(0.5, 0.5, 0.5))
+        scalar = renderer.canvas.polygons
+        renderer.canvas = RecordingCanvas()
+        faces = renderer.project_cube_faces(np.array([box], dtype=float)).tolist()[0]
+        renderer.draw_cube(*box, color=(0.5, 0.5, 0.5), faces=faces)
+        assert np.allclose(renderer.canvas.polygons, scalar)
+
+
+class TestGridLines:
+    def _cell_edges(self, renderer, grid_range):
+        """Expand merged grid lines back into unit cell edges with their colors."""
+        to_grid = {}
+        for i in range(-grid_range, grid_range + 1):
+            for j in range(-grid_range, grid_range + 1):
+                x, y = renderer.project_3d_to_2d(i, j, -0.05)
+                to_grid[(round(x, 6), round(y, 6))] = (i, j)
+        edges = {}
+        for (x1, y1, x2, y2), is_boundary in renderer.grid_lines(grid_range):
+            (i1, j1), (i2, j2) = to_grid[(round(x1, 6), round(y1, 6))], to_grid[(round(x2, 6), round(y2, 6))]
+            for i in range(i1, i2):
+                edges[((i, j1), (i + 1, j1))] = is_boundary
+            for j in range(j1, j2):
+                edges[((i1, j), (i1, j + 1))] = is_boundary
+        return edges
+
+    @pytest.mark.parametrize("grid_range", [1, 3, 10])
+    def test_covers_every_cell_edge(self, grid_range):
+        renderer = IsometricRenderer(canvas=None)
+        expected = {}
+        for i in range(-grid_range, grid_range + 1):
+            for j in range(-grid_range, grid_range + 1):
+                is_boundary = i in (-grid_range, grid_range) or j in (-grid_range, grid_range)
+                if i < grid_range:
+                    expected[((i, j), (i + 1, j))] = is_boundary
+                if j < grid_range:
+                    expected[((i, j), (i, j + 1))] = is_boundary
+        assert self._cell_edges(renderer, grid_range) == expected
+
+    def test_line_count(self):
+        renderer = IsometricRenderer(canvas=None)
+        assert len(renderer.grid_lines(10)) == 80
+        assert renderer.grid_lines(0) == []
@@ -0,0 +1,97 @@
+"""
+Tests for qldpc.builder.tutorials helpers.
+
+Covers compilation of tutorial step content into Text.insert arguments.
+"""
+
+import pytest
+from qldpc.builder import tutorials
+from qldpc.builder.tutorials import compile_tutorial_steps
+
+
+class TestCompileTutorialSteps:
+    def test_flattens_spans(self):
+        steps = [{'title': 'T', 'content': [('a', 'normal'), ('b', 'title')]}]
+        compiled = compile_tutorial_steps(steps)
+        assert compiled[0]['content'] == ('a', 'normal', 'b', 'title')
+
+    def test_merges_consecutive_tags(self):
+        steps = [{'title': 'T', 'content': [
+            ('Hello ', 'normal'), ('world', 'normal'), ('!', 'action'), ('\n', 'normal'),
+        ]}]
+        compiled = compile_tutorial_steps(steps)
+        assert compiled[0]['content'] == ('Hello world', 'normal', '!', 'action', '\n', 'normal')
+
+    def test_preserves_other_keys(self):
+        steps = [{'title': 'T', 'content': [], 'demo_action': 'show_welcome'}]
+        compiled = compile_tutorial_steps(steps)
+        assert compiled[0]['content'] == ()
+        assert compiled[0]['demo_action'] == 'show_welcome'
+
+
+class TestTutorialPreference:
+    @pytest.fixture
+    def config_path(self, tmp_path, monkeypatch):
+        path = tmp_path / '.tutorial_config.json'
+        monkeypatch.setattr(tutorials, 'TUTORIAL_CONFIG_PATH', str(path))
+        tutorials.should_show_tutorial.cache_clear()
+        yield path
+        tutorials.should_show_tutorial.cache_clear()
+
+    def test_default_is_true(self, config_path):
+        assert tutorials.should_show_tutorial() is True
+
+    def test_save_round_trip(self, config_path):
+        tutorials.save_tutorial_preference(False)
+        assert config_path.exists()
+        assert tutorials.should_show_tutorial() is False
+
+    def test_unchanged_preference_skips_write(self, config_path):
+        tutorials.save_tutorial_preference(True)
+        assert not config_path.exists()
+
+    def test_malformed_config_defaults_to_true(self, config_path):
+        config_path.write_text('{not json')
+        assert tutorials.should_show_tutorial() is True
+
+    def test_save_leaves_no_temp_file(self, config_path):
+        tutorials.save_tutorial_preference(False)
+        assert not config_path.with_name(config_path.name + '.tmp').exists()
+
+
+class TestScreenDims:
+    def test_queries_screen_once(self):
+        class FakeRoot:
+            calls = 0
+
+            def winfo_screenwidth(self):
+                FakeRoot.calls += 1
+                return 1920
+
+            def winfo_screenheight(self):
+                FakeRoot.calls += 1
+                return 1080
+
+        root = FakeRoot()
+        assert tutorials.screen_dims(root) == (1920, 1080)
+        assert tutorials.screen_dims(root) == (1920, 1080)
+        assert FakeRoot.calls == 2
+
+
+class TestLoadTutorialSteps:
+    @pytest.mark.parametrize('name', [
+        'TutorialScreen', 'SurfaceCodeTutorialScreen',
+        'AdvancedLargeCircuitsTutorial', 'SurfaceCodeTutorial',
+    ])
+    def test_steps_have_title_and_content(self, name):
+        steps = tutorials.load_tutorial_steps(name)
+        assert steps
+        for step in steps:
+            assert isinstance(step['title'], str)
+            assert all(len(span) == 2 for span in step['content'])
+
+    def test_compiling_does_not_alter_asset(self):
+        compile_tutorial_steps(tutorials.load_tutorial_steps('TutorialScreen'))
+        steps = tutorials.load_tutorial_steps('TutorialScreen')
+        assert isinstance(steps[0]['content'], list)
+